@@ -2,6 +2,8 @@ from pathlib import Path
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from src.providers.docker_test import PluginTestBackendType
+
 from .models import RepoInfo
 
 
@@ -33,3 +35,13 @@ class Config(BaseModel, extra="ignore"):
     github_repository: str
     github_run_id: str
     github_step_summary: Path
+    plugin_test_backend: PluginTestBackendType = "docker"
+    """ 插件测试后端 """
+    plugin_test_reuse_environment: bool = False
+    """ 仅修改插件配置时是否复用之前安装好的测试环境
+
+    测试环境保存在缓存卷中，只有缓存卷在多次运行之间保留时才能复用，
+    否则每次都要额外复制一次测试环境
+    """
+    validation_profile: bool = False
+    """ 是否记录各字段验证耗时，并将最慢的字段添加到作业摘要 """
@@ -1,6 +1,6 @@
 from typing import Literal
 
-from githubkit.rest import Issue
+from githubkit.rest import Issue, IssueComment
 from pydantic import ConfigDict
 
 from src.plugins.github.constants import SKIP_COMMENT
@@ -84,9 +84,15 @@ class IssueHandler(GithubHandler):
 
         return await super().create_pull_request(base_branch, title, branch_name, body)
 
-    async def should_skip_test(self) -> bool:
-        """判断评论是否包含跳过的标记"""
-        comments = await self.list_comments()
+    async def should_skip_test(
+        self, comments: list[IssueComment] | None = None
+    ) -> bool:
+        """判断评论是否包含跳过的标记
+
+        已经拉取过评论时可以直接传入，避免重复请求
+        """
+        if comments is None:
+            comments = await self.list_comments()
         for comment in comments:
             author_association = comment.author_association
             if comment.body == SKIP_COMMENT and author_association in [
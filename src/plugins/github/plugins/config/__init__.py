@@ -20,7 +20,6 @@ from src.plugins.github.depends import (
     is_config_workflow,
 )
 from src.plugins.github.handlers import GithubHandler, IssueHandler
-from src.plugins.github.plugins.publish.render import render_comment
 from src.plugins.github.plugins.publish.utils import (
     ensure_issue_plugin_test_button,
     ensure_issue_plugin_test_button_in_progress,
@@ -78,6 +77,8 @@ async def handle_remove_check(
         result = await validate_info_from_issue(handler)
 
         # 渲染评论信息
+        from src.plugins.github.plugins.publish.render import render_comment
+
         comment = await render_comment(result, True)
 
         # 对议题评论
@@ -2,6 +2,7 @@ from typing import Any
 
 from nonebot import logger
 
+from src.plugins.github import plugin_config
 from src.plugins.github.handlers import IssueHandler
 from src.plugins.github.models import AuthorInfo
 from src.plugins.github.plugins.publish.constants import (
@@ -9,11 +10,10 @@ from src.plugins.github.plugins.publish.constants import (
     PLUGIN_MODULE_NAME_PATTERN,
     PROJECT_LINK_PATTERN,
 )
-from src.plugins.github.plugins.publish.render import render_summary
 from src.plugins.github.plugins.publish.validation import add_step_summary, strip_ansi
 from src.plugins.github.utils import extract_issue_info_from_issue
-from src.providers.constants import PYPI_KEY_TEMPLATE
-from src.providers.docker_test import DockerPluginTest, Metadata
+from src.providers.constants import PLUGIN_TEST_PYTHON_VERSION, PYPI_KEY_TEMPLATE
+from src.providers.docker_test import Metadata, get_plugin_test
 from src.providers.models import RegistryPlugin, StoreTestResult
 from src.providers.utils import dump_json, load_json_from_file
 from src.providers.validation import PublishType, ValidationDict, validate_info
@@ -55,8 +55,17 @@ async def validate_info_from_issue(handler: IssueHandler) -> ValidationDict:
     raw_data["skip_test"] = False
 
     # 运行插件测试
-    test = DockerPluginTest(project_link, module_name, test_config)
-    test_result = await test.run("3.12")
+    test = get_plugin_test(
+        project_link,
+        module_name,
+        test_config,
+        backend=plugin_config.plugin_test_backend,
+    )
+    # 插件版本未变化时复用之前安装好的测试环境，只重新加载插件
+    test_result = await test.run(
+        PLUGIN_TEST_PYTHON_VERSION,
+        reuse_environment=plugin_config.plugin_test_reuse_environment,
+    )
 
     # 去除颜色字符
     test_output = strip_ansi(test_result.output)
@@ -72,6 +81,8 @@ async def validate_info_from_issue(handler: IssueHandler) -> ValidationDict:
     raw_data["metadata"] = bool(metadata)
 
     # 输出插件测试相关信息
+    from src.plugins.github.plugins.publish.render import render_summary
+
     add_step_summary(await render_summary(test_result, test_output, project_link))
     logger.info(
         f"插件 {project_link}({test_result.version}) 插件加载{'成功' if test_result.load else '失败'} {'插件已尝试加载' if test_result.run else '插件并未开始运行'}"
@@ -81,7 +92,12 @@ async def validate_info_from_issue(handler: IssueHandler) -> ValidationDict:
     logger.info(test_output)
 
     # 验证插件相关信息
-    result = validate_info(PublishType.PLUGIN, raw_data, previous_data)
+    result = validate_info(
+        PublishType.PLUGIN,
+        raw_data,
+        previous_data,
+        adapter_path=plugin_config.input_config.adapter_path,
+    )
 
     if not result.valid_data.get("metadata"):
         # 如果没有跳过测试且缺少插件元数据，则跳过元数据相关的错误
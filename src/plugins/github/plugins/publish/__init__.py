@@ -31,10 +31,10 @@ from src.plugins.github.depends import (
 from src.plugins.github.handlers import GithubHandler, IssueHandler
 from src.providers.validation.models import PublishType, ValidationDict
 
+from .check_state import CheckState, PluginTestState, hash_inputs, is_retest_requested
 from .depends import (
     get_type_by_labels_name,
 )
-from .render import render_comment
 from .utils import (
     ensure_issue_content,
     ensure_issue_plugin_test_button,
@@ -43,6 +43,7 @@ from .utils import (
     trigger_registry_update,
 )
 from .validation import (
+    extract_plugin_info_from_issue,
     validate_adapter_info_from_issue,
     validate_bot_info_from_issue,
     validate_plugin_info_from_issue,
@@ -86,23 +87,42 @@ async def handle_publish_plugin_check(
             logger.info("议题未开启，已跳过")
             await publish_check_matcher.finish()
 
-        # 提示插件正在测试中
-        await ensure_issue_plugin_test_button_in_progress(handler)
+        comments = await handler.list_comments()
+        # 插件测试相关字段输入的哈希值，用于判断是否需要重新测试
+        inputs = hash_inputs(extract_plugin_info_from_issue(handler.issue))
+        previous_state = CheckState.from_comments(comments, int(bot.self_id))
 
         # 是否需要跳过插件测试
-        skip_test = await handler.should_skip_test()
+        skip_test = await handler.should_skip_test(comments)
+        # 插件测试相关的字段未修改且没有勾选重测勾选框时，使用上次的插件测试结果
+        previous_test = None
+        if (
+            previous_state
+            and not skip_test
+            and not is_retest_requested(handler.issue.body or "")
+        ):
+            previous_test = previous_state.reusable_test(inputs)
+
+        if previous_test is None:
+            # 提示插件正在测试中
+            await ensure_issue_plugin_test_button_in_progress(handler)
         # 如果需要跳过插件测试，则修改议题内容，确保其包含插件所需信息
         if skip_test:
             await ensure_issue_content(handler)
 
         # 检查是否满足发布要求
         # 仅在通过检查的情况下创建拉取请求
-        result = await validate_plugin_info_from_issue(handler, skip_test)
+        result = await validate_plugin_info_from_issue(
+            handler, skip_test, previous_test=previous_test
+        )
 
         # 确保插件重测按钮存在
         await ensure_issue_plugin_test_button(handler)
 
         state["validation"] = result
+        state["check_state"] = CheckState(
+            inputs=inputs, test=PluginTestState.from_raw_data(result.raw_data)
+        )
 
 
 @publish_check_matcher.handle(parameterless=[Depends(bypass_git)])
@@ -148,13 +168,17 @@ async def handle_bot_publish_check(
 @publish_check_matcher.handle(parameterless=[Depends(bypass_git)])
 async def handle_pull_request_and_update_issue(
     bot: GitHubBot,
+    state: T_State,
     validation: ValidationDict = Arg(),
     handler: IssueHandler = Depends(get_issue_handler),
     installation_id: int = Depends(get_installation_id),
 ) -> None:
     async with bot.as_installation(installation_id):
         # 渲染评论信息
-        comment = await render_comment(validation, True)
+        from .render import render_comment
+
+        # 插件发布检查会在评论中保存检查状态
+        comment = await render_comment(validation, True, state.get("check_state"))
 
         # 对议题评论
         await handler.comment_issue(comment)
@@ -0,0 +1,137 @@
+"""发布检查状态
+
+上次检查时插件测试相关字段输入的哈希值与插件测试结果保存在评论的隐藏标记中，
+再次检查时只有这些字段修改或勾选了重测勾选框才重新运行插件测试。
+其他字段每次检查都重新验证。
+"""
+
+import base64
+import hashlib
+import json
+import zlib
+from typing import Any
+
+from githubkit.rest import IssueComment
+from nonebot import logger
+from pydantic import BaseModel, ValidationError
+
+from src.plugins.github.constants import NONEFLOW_MARKER
+from src.providers.docker_test import Metadata
+
+from .constants import (
+    CHECK_STATE_MARKER,
+    CHECK_STATE_MARKER_LIMIT,
+    CHECK_STATE_OUTPUT_LIMIT,
+    CHECK_STATE_PATTERN,
+    PLUGIN_TEST_BUTTON_CHECKED_PATTERN,
+    PLUGIN_TEST_INPUT_KEYS,
+)
+
+
+def hash_value(value: Any) -> str:
+    """计算字段输入的哈希值"""
+    data = json.dumps(value, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(data.encode()).hexdigest()[:16]
+
+
+def hash_inputs(raw_data: dict[str, Any]) -> dict[str, str]:
+    """计算插件测试相关字段输入的哈希值"""
+    return {key: hash_value(raw_data.get(key)) for key in PLUGIN_TEST_INPUT_KEYS}
+
+
+def is_retest_requested(body: str) -> bool:
+    """议题中是否勾选了插件重测勾选框"""
+    return PLUGIN_TEST_BUTTON_CHECKED_PATTERN.search(body) is not None
+
+
+class PluginTestState(BaseModel):
+    """插件测试结果"""
+
+    version: str | None
+    load: bool
+    output: str
+    metadata: Metadata | None
+
+    @classmethod
+    def from_raw_data(cls, raw_data: dict[str, Any]) -> "PluginTestState | None":
+        """从验证的原始数据中获取插件测试结果，跳过测试时返回 None"""
+        if raw_data.get("skip_test"):
+            return None
+        metadata = (
+            Metadata(**{key: raw_data.get(key) for key in Metadata.__annotations__})
+            if raw_data.get("metadata")
+            else None
+        )
+        return cls(
+            version=raw_data.get("version"),
+            load=raw_data.get("load", False),
+            output=raw_data.get("test_output", ""),
+            metadata=metadata,
+        )
+
+
+class CheckState(BaseModel):
+    """发布检查状态"""
+
+    inputs: dict[str, str] = {}
+    """插件测试相关字段输入的哈希值"""
+    test: PluginTestState | None = None
+    """插件测试结果，跳过测试时为空"""
+
+    def reusable_test(self, inputs: dict[str, str]) -> PluginTestState | None:
+        """插件测试相关的字段都没有变化时，返回上次的插件测试结果"""
+        if self.test is None:
+            return None
+        if any(
+            self.inputs.get(key) != inputs.get(key) for key in PLUGIN_TEST_INPUT_KEYS
+        ):
+            return None
+        return self.test
+
+    def to_marker(self) -> str:
+        """转换为评论中的隐藏标记
+
+        插件测试输出可能很长，只保留末尾的报错信息，压缩后再编码。
+        仍然超过长度限制时不保存插件测试结果，下次检查重新测试。
+        """
+        state = self
+        if self.test and len(self.test.output) > CHECK_STATE_OUTPUT_LIMIT:
+            output = "……\n" + self.test.output[-CHECK_STATE_OUTPUT_LIMIT:]
+            state = self.model_copy(
+                update={"test": self.test.model_copy(update={"output": output})}
+            )
+        marker = state._encode()
+        if len(marker) > CHECK_STATE_MARKER_LIMIT:
+            logger.warning("检查状态过大，不保存插件测试结果")
+            marker = self.model_copy(update={"test": None})._encode()
+        return marker
+
+    def _encode(self) -> str:
+        """压缩并编码为隐藏标记"""
+        data = zlib.compress(self.model_dump_json().encode())
+        return CHECK_STATE_MARKER.format(base64.urlsafe_b64encode(data).decode())
+
+    @classmethod
+    def from_comments(
+        cls, comments: list[IssueComment], app_id: int
+    ) -> "CheckState | None":
+        """从机器人的评论中读取上次的检查状态
+
+        其他用户与其他机器人可以伪造隐藏标记，只读取本应用发布的评论
+        """
+        for comment in comments:
+            body = comment.body or ""
+            if NONEFLOW_MARKER not in body:
+                continue
+            app = comment.performed_via_github_app
+            if not app or app.id != app_id:
+                continue
+            match = CHECK_STATE_PATTERN.search(body)
+            if not match:
+                return None
+            try:
+                data = zlib.decompress(base64.urlsafe_b64decode(match.group(1)))
+                return cls.model_validate_json(data)
+            except (ValueError, zlib.error, ValidationError) as e:
+                logger.warning(f"无法读取上次的检查状态：{e}")
+                return None
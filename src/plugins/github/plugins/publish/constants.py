@@ -6,6 +6,18 @@ COMMIT_MESSAGE_PREFIX = ":beers: publish"
 
 BRANCH_NAME_PREFIX = "publish/issue"
 
+VALIDATION_TIMINGS_LIMIT = 5
+""" 作业摘要中显示的最慢字段数量 """
+
+CHECK_STATE_MARKER = "<!-- NONEFLOW_STATE {} -->"
+CHECK_STATE_PATTERN = re.compile(r"<!-- NONEFLOW_STATE (\S+) -->")
+CHECK_STATE_OUTPUT_LIMIT = 4000
+""" 检查状态中保存的插件测试输出的最大长度，超出时只保留末尾 """
+CHECK_STATE_MARKER_LIMIT = 16000
+""" 检查状态标记的最大长度，需远小于 GitHub 评论的 65536 字符限制 """
+PLUGIN_TEST_INPUT_KEYS = ["project_link", "module_name", "test_config"]
+""" 修改后需要重新运行插件测试的字段 """
+
 
 # 基本信息
 PROJECT_LINK_PATTERN = re.compile(ISSUE_PATTERN.format("PyPI 项目名"))
@@ -29,6 +41,9 @@ PLUGIN_TEST_STRING = "插件测试"
 PLUGIN_TEST_PATTERN = re.compile(ISSUE_PATTERN.format(PLUGIN_TEST_STRING))
 PLUGIN_TEST_BUTTON_TIPS = "如需重新运行插件测试，请勾选左侧勾选框"
 PLUGIN_TEST_BUTTON_STRING = f"- [ ] {PLUGIN_TEST_BUTTON_TIPS}"
+PLUGIN_TEST_BUTTON_CHECKED_PATTERN = re.compile(
+    rf"- \[[xX]\] {PLUGIN_TEST_BUTTON_TIPS}"
+)
 PLUGIN_TEST_BUTTON_IN_PROGRESS_STRING = "- [x] 🔥插件测试中，请稍后"
 PLUGIN_SUPPORTED_ADAPTERS_STRING = "插件支持的适配器"
 PLUGIN_SUPPORTED_ADAPTERS_PATTERN = re.compile(
@@ -10,7 +10,8 @@ from src.providers.utils import dumps_json
 from src.providers.validation import ValidationDict
 from src.providers.validation.models import PublishType
 
-from .constants import LOC_NAME_MAP
+from .check_state import CheckState
+from .constants import LOC_NAME_MAP, VALIDATION_TIMINGS_LIMIT
 
 
 def tags_to_str(tags: list[dict[str, str]]) -> str:
@@ -65,8 +66,13 @@ env.filters["key_to_name"] = key_to_name
 env.filters["format_time"] = format_time
 
 
-async def render_comment(result: ValidationDict, reuse: bool = False) -> str:
-    """将验证结果转换为评论内容"""
+async def render_comment(
+    result: ValidationDict, reuse: bool = False, check_state: CheckState | None = None
+) -> str:
+    """将验证结果转换为评论内容
+
+    传入检查状态时，将其作为隐藏标记添加到评论末尾
+    """
     title = f"{result.type}: {result.name}"
 
     valid_data = result.valid_data.copy()
@@ -106,6 +112,7 @@ async def render_comment(result: ValidationDict, reuse: bool = False) -> str:
         data=data,
         errors=result.errors,
         skip_test=result.skip_test,
+        state_marker=check_state.to_marker() if check_state else None,
     )
 
 
@@ -122,4 +129,17 @@ async def render_summary(test_result: DockerTestResult, output: str, project_lin
         if test_result.metadata
         else {},
         output=output,
+        timings=test_result.timings,
+    )
+
+
+async def render_validation_timings(result: ValidationDict) -> str:
+    """将最慢的几个字段的验证耗时转换为工作流总结"""
+    timings = sorted(result.timings.items(), key=lambda x: x[1], reverse=True)
+
+    template = env.get_template("timings.md.jinja")
+    return await template.render_async(
+        title=f"{result.type}: {result.name}",
+        total=sum(result.timings.values()),
+        timings=timings[:VALIDATION_TIMINGS_LIMIT],
     )
@@ -1,4 +1,5 @@
 import re
+from typing import Any
 
 from githubkit.exception import RequestFailed
 from nonebot import logger
@@ -27,8 +28,12 @@ from .constants import (
     PLUGIN_TEST_STRING,
 )
 from .validation import (
+    extract_adapter_info_from_issue,
+    extract_bot_info_from_issue,
+    run_plugin_test_from_issue,
     validate_adapter_info_from_issue,
     validate_bot_info_from_issue,
+    validate_info_from_issues,
     validate_plugin_info_from_issue,
 )
 
@@ -85,6 +90,8 @@ async def resolve_conflict_pull_requests(
 
     直接重新提交之前分支中的内容
     """
+    # 先从议题中获取所有拉取请求的信息，同一发布类型的信息一起验证
+    pending: dict[PublishType, list[tuple[int, str, IssueHandler, dict[str, Any]]]] = {}
     for pull in pulls:
         issue_number = extract_issue_number_from_ref(pull.head.ref)
         if not issue_number:
@@ -103,14 +110,22 @@ async def resolve_conflict_pull_requests(
             # 重新测试
             match publish_type:
                 case PublishType.ADAPTER:
-                    result = await validate_adapter_info_from_issue(issue_handler.issue)
+                    raw_data = extract_adapter_info_from_issue(issue_handler.issue)
                 case PublishType.BOT:
-                    result = await validate_bot_info_from_issue(issue_handler.issue)
+                    raw_data = extract_bot_info_from_issue(issue_handler.issue)
                 case PublishType.PLUGIN:
-                    result = await validate_plugin_info_from_issue(issue_handler)
+                    raw_data = await run_plugin_test_from_issue(issue_handler)
                 case _:
                     raise ValueError("暂不支持的发布类型")
+            pending.setdefault(publish_type, []).append(
+                (issue_number, pull.head.ref, issue_handler, raw_data)
+            )
 
+    for publish_type, items in pending.items():
+        results = await validate_info_from_issues(
+            publish_type, [raw_data for *_, raw_data in items]
+        )
+        for (issue_number, ref, issue_handler, _), result in zip(items, results):
             # 如果信息验证失败，则跳过更新
             if not result.valid:
                 logger.error("信息验证失败，已跳过")
@@ -120,12 +135,12 @@ async def resolve_conflict_pull_requests(
             # 每次切换前都要确保回到主分支
             handler.checkout_branch(plugin_config.input_config.base)
             # 切换到对应分支
-            handler.switch_branch(pull.head.ref)
+            handler.switch_branch(ref)
             # 更新文件
             update_file(result)
 
             message = commit_message(result.type, result.name, issue_number)
-            issue_handler.commit_and_push(message, pull.head.ref)
+            issue_handler.commit_and_push(message, ref)
 
             logger.info("拉取请求更新完毕")
 
@@ -1,4 +1,5 @@
 import re
+from pathlib import Path
 from typing import Any
 
 from githubkit.rest import Issue
@@ -8,10 +9,18 @@ from src.plugins.github import plugin_config
 from src.plugins.github.handlers import IssueHandler
 from src.plugins.github.models import AuthorInfo
 from src.plugins.github.utils import extract_issue_info_from_issue
-from src.providers.docker_test import DockerPluginTest, Metadata
-from src.providers.utils import get_pypi_version, load_json_from_file
-from src.providers.validation import PublishType, ValidationDict, validate_info
+from src.providers.constants import PLUGIN_TEST_PYTHON_VERSION
+from src.providers.docker_test import Metadata, get_plugin_test
+from src.providers.utils import get_pypi_version
+from src.providers.validation import (
+    PublishType,
+    ValidationDict,
+    get_previous_keys,
+    validate_info,
+    validate_many,
+)
 
+from .check_state import PluginTestState
 from .constants import (
     ADAPTER_DESC_PATTERN,
     ADAPTER_HOMEPAGE_PATTERN,
@@ -30,7 +39,6 @@ from .constants import (
     PROJECT_LINK_PATTERN,
     TAGS_PATTERN,
 )
-from .render import render_summary
 
 
 def strip_ansi(text: str | None) -> str:
@@ -47,15 +55,18 @@ def add_step_summary(summary: str):
         f.write(summary + "\n")
 
 
-async def validate_plugin_info_from_issue(
-    handler: IssueHandler,
-    skip_test: bool | None = None,
-    load_previous_data: bool = True,
-) -> ValidationDict:
-    """从议题中获取插件信息，并且运行插件测试加载且获取插件元信息后进行验证"""
-    body = handler.issue.body if handler.issue.body else ""
+async def add_validation_timings_summary(result: ValidationDict):
+    """开启耗时记录时，将最慢的字段添加到作业摘要"""
+    if result.timings:
+        from .render import render_validation_timings
+
+        add_step_summary(await render_validation_timings(result))
+
+
+def extract_plugin_info_from_issue(issue: Issue) -> dict[str, Any]:
+    """从议题中提取插件测试前就能获取的插件信息"""
+    body = issue.body if issue.body else ""
 
-    # 从议题里提取插件所需信息
     raw_data: dict[str, Any] = extract_issue_info_from_issue(
         {
             "module_name": PLUGIN_MODULE_NAME_PATTERN,
@@ -66,19 +77,97 @@ async def validate_plugin_info_from_issue(
         body,
     )
     # 更新作者信息
-    raw_data.update(AuthorInfo.from_issue(handler.issue).model_dump())
+    raw_data.update(AuthorInfo.from_issue(issue).model_dump())
+    return raw_data
 
-    module_name: str = raw_data.get("module_name", None)
-    project_link: str = raw_data.get("project_link", None)
-    test_config: str = raw_data.get("test_config", "")
 
-    # 获取插件上次的数据
-    previous_data = (
-        load_json_from_file(plugin_config.input_config.plugin_path)
+def get_store_path(publish_type: PublishType) -> Path:
+    """获取商店中对应发布类型的数据文件"""
+    match publish_type:
+        case PublishType.ADAPTER:
+            return plugin_config.input_config.adapter_path
+        case PublishType.BOT:
+            return plugin_config.input_config.bot_path
+        case PublishType.PLUGIN:
+            return plugin_config.input_config.plugin_path
+        case _:
+            raise ValueError("暂不支持的发布类型")
+
+
+async def validate_info_from_issues(
+    publish_type: PublishType, items: list[dict[str, Any]]
+) -> list[ValidationDict]:
+    """批量验证从议题中提取的信息
+
+    所有信息共享商店数据键索引与网络数据的获取
+    """
+    results = validate_many(
+        publish_type,
+        items,
+        None,
+        previous_keys=get_previous_keys(get_store_path(publish_type)),
+        adapter_path=plugin_config.input_config.adapter_path
+        if publish_type == PublishType.PLUGIN
+        else None,
+        profile=plugin_config.validation_profile,
+    )
+    for result in results:
+        await add_validation_timings_summary(result)
+    if publish_type == PublishType.PLUGIN:
+        results = [clear_metadata_errors(result) for result in results]
+    return results
+
+
+async def validate_plugin_info_from_issue(
+    handler: IssueHandler,
+    skip_test: bool | None = None,
+    load_previous_data: bool = True,
+    previous_test: PluginTestState | None = None,
+) -> ValidationDict:
+    """从议题中获取插件信息，并且运行插件测试加载且获取插件元信息后进行验证
+
+    传入上次的插件测试结果时，直接使用该结果，不再运行插件测试
+    """
+    raw_data = await run_plugin_test_from_issue(handler, skip_test, previous_test)
+
+    # 商店数据文件未修改时直接使用已构建的键索引
+    previous_keys = (
+        get_previous_keys(plugin_config.input_config.plugin_path)
         if load_previous_data
-        else []
+        else frozenset()
     )
 
+    # 验证插件相关信息
+    result = validate_info(
+        PublishType.PLUGIN,
+        raw_data,
+        None,
+        previous_keys=previous_keys,
+        adapter_path=plugin_config.input_config.adapter_path,
+        profile=plugin_config.validation_profile,
+    )
+    await add_validation_timings_summary(result)
+    return clear_metadata_errors(result)
+
+
+async def run_plugin_test_from_issue(
+    handler: IssueHandler,
+    skip_test: bool | None = None,
+    previous_test: PluginTestState | None = None,
+) -> dict[str, Any]:
+    """从议题中获取插件信息，并且运行插件测试加载且获取插件元信息
+
+    返回需要验证的插件信息
+    """
+    body = handler.issue.body if handler.issue.body else ""
+
+    # 从议题里提取插件所需信息
+    raw_data = extract_plugin_info_from_issue(handler.issue)
+
+    module_name: str = raw_data.get("module_name", None)
+    project_link: str = raw_data.get("project_link", None)
+    test_config: str = raw_data.get("test_config", "")
+
     # 决定是否跳过插件测试
     # 因为在上一步可能已经知道了是否跳过插件测试，所以这里可以传入
     # 如果没有传入，则从 handler 中获取
@@ -106,11 +195,25 @@ async def validate_plugin_info_from_issue(
         raw_data["test_output"] = "插件未进行测试"
         raw_data["metadata"] = bool(metadata)
         logger.info(f"插件已跳过测试，从议题中获取的插件元信息：{metadata}")
+    elif previous_test is not None:
+        # 插件测试相关的信息没有修改，直接使用上次的测试结果
+        metadata = previous_test.metadata
+        if metadata:
+            raw_data.update(metadata)
+
+        raw_data["version"] = previous_test.version
+        raw_data["load"] = previous_test.load
+        raw_data["test_output"] = previous_test.output
+        raw_data["metadata"] = bool(metadata)
+        logger.info(f"插件测试相关信息未修改，使用上次的插件测试结果：{metadata}")
     else:
         # 插件不跳过则运行插件测试
-        test_result = await DockerPluginTest(
-            project_link, module_name, test_config
-        ).run("3.12")
+        test_result = await get_plugin_test(
+            project_link,
+            module_name,
+            test_config,
+            backend=plugin_config.plugin_test_backend,
+        ).run(PLUGIN_TEST_PYTHON_VERSION)
         # 去除颜色字符
         test_output = strip_ansi(test_result.output)
         metadata = test_result.metadata
@@ -124,6 +227,8 @@ async def validate_plugin_info_from_issue(
         raw_data["metadata"] = bool(metadata)
 
         # 输出插件测试相关信息
+        from .render import render_summary
+
         add_step_summary(await render_summary(test_result, test_output, project_link))
         logger.info(
             f"插件 {project_link}({test_result.version}) 插件加载{'成功' if test_result.load else '失败'} {'插件已尝试加载' if test_result.run else '插件并未开始运行'}"
@@ -132,10 +237,12 @@ async def validate_plugin_info_from_issue(
         logger.info("插件测试输出：")
         logger.info(test_result.output)
 
-    # 验证插件相关信息
-    result = validate_info(PublishType.PLUGIN, raw_data, previous_data)
+    return raw_data
+
 
-    if not result.valid_data.get("metadata") and not skip_test:
+def clear_metadata_errors(result: ValidationDict) -> ValidationDict:
+    """没有跳过测试且缺少插件元数据时，去除元数据相关的错误与字段"""
+    if not result.valid_data.get("metadata") and not result.raw_data["skip_test"]:
         # 如果没有跳过测试且缺少插件元数据，则跳过元数据相关的错误
         # 因为这个时候这些项都会报错，错误在此时没有意义
         metadata_keys = Metadata.__annotations__.keys()
@@ -156,6 +263,28 @@ async def validate_adapter_info_from_issue(
     issue: Issue, load_previous_data: bool = True
 ) -> ValidationDict:
     """从议题中提取适配器信息"""
+    raw_data = extract_adapter_info_from_issue(issue)
+
+    # 商店数据文件未修改时直接使用已构建的键索引
+    previous_keys = (
+        get_previous_keys(plugin_config.input_config.adapter_path)
+        if load_previous_data
+        else frozenset()
+    )
+
+    result = validate_info(
+        PublishType.ADAPTER,
+        raw_data,
+        None,
+        previous_keys=previous_keys,
+        profile=plugin_config.validation_profile,
+    )
+    await add_validation_timings_summary(result)
+    return result
+
+
+def extract_adapter_info_from_issue(issue: Issue) -> dict[str, Any]:
+    """从议题中提取需要验证的适配器信息"""
     body = issue.body if issue.body else ""
     raw_data: dict[str, Any] = extract_issue_info_from_issue(
         {
@@ -169,14 +298,7 @@ async def validate_adapter_info_from_issue(
         body,
     )
     raw_data.update(AuthorInfo.from_issue(issue).model_dump())
-
-    previous_data = (
-        load_json_from_file(plugin_config.input_config.adapter_path)
-        if load_previous_data
-        else []
-    )
-
-    return validate_info(PublishType.ADAPTER, raw_data, previous_data)
+    return raw_data
 
 
 async def validate_bot_info_from_issue(
@@ -184,6 +306,28 @@ async def validate_bot_info_from_issue(
     load_previous_data: bool = True,
 ) -> ValidationDict:
     """从议题中提取机器人信息"""
+    raw_data = extract_bot_info_from_issue(issue)
+
+    # 商店数据文件未修改时直接使用已构建的键索引
+    previous_keys = (
+        get_previous_keys(plugin_config.input_config.bot_path)
+        if load_previous_data
+        else frozenset()
+    )
+
+    result = validate_info(
+        PublishType.BOT,
+        raw_data,
+        None,
+        previous_keys=previous_keys,
+        profile=plugin_config.validation_profile,
+    )
+    await add_validation_timings_summary(result)
+    return result
+
+
+def extract_bot_info_from_issue(issue: Issue) -> dict[str, Any]:
+    """从议题中提取需要验证的机器人信息"""
     body = issue.body if issue.body else ""
     raw_data: dict[str, Any] = extract_issue_info_from_issue(
         {
@@ -196,11 +340,4 @@ async def validate_bot_info_from_issue(
     )
 
     raw_data.update(AuthorInfo.from_issue(issue).model_dump())
-
-    previous_data = (
-        load_json_from_file(plugin_config.input_config.bot_path)
-        if load_previous_data
-        else []
-    )
-
-    return validate_info(PublishType.BOT, raw_data, previous_data)
+    return raw_data
@@ -27,7 +27,6 @@ from src.plugins.github.typing import IssuesEvent
 from src.providers.validation.models import PublishType
 
 from .constants import BRANCH_NAME_PREFIX
-from .render import render_comment, render_error
 from .utils import process_pull_reqeusts
 from .validation import validate_author_info
 
@@ -86,6 +85,8 @@ async def handle_remove_check(
             result = await validate_author_info(handler.issue, publish_type)
         except PydanticCustomError as err:
             logger.error(f"信息验证失败: {err}")
+            from .render import render_error
+
             await handler.comment_issue(await render_error(err))
             await remove_check_matcher.finish()
 
@@ -109,6 +110,8 @@ async def handle_remove_check(
         ).number
 
         # 评论议题
+        from .render import render_comment
+
         comment = await render_comment(
             result,
             f"{plugin_config.input_config.store_repository}#{pull_number}",
@@ -10,6 +10,9 @@ BOT_KEY_TEMPLATE = "{name}:{homepage}"
 PYPI_KEY_TEMPLATE = "{project_link}:{module_name}"
 """ 插件键名模板 """
 
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/83.0.4103.116 Safari/537.36"
+""" 访问网址时使用的 User-Agent """
+
 # NoneBot 插件商店测试结果
 # https://github.com/nonebot/registry/tree/results
 REGISTRY_BASE_URL = (
@@ -38,3 +41,49 @@ STORE_PLUGINS_URL = f"{STORE_BASE_URL}/plugins.json5"
 # https://github.com/orgs/nonebot/packages/container/package/nonetest
 DOCKER_IMAGES_VERSION = os.environ.get("DOCKER_IMAGES_VERSION") or "latest"
 DOCKER_IMAGES = f"ghcr.io/nonebot/nonetest:{DOCKER_IMAGES_VERSION}"
+# 插件测试的缓存卷，所有测试容器共享
+DOCKER_CACHE_VOLUME = os.environ.get("DOCKER_CACHE_VOLUME") or "noneflow-cache"
+
+# 插件测试环境
+# 主要测试环境的 Python 版本，其测试结果用于验证插件
+PLUGIN_TEST_PYTHON_VERSION = os.environ.get("PLUGIN_TEST_PYTHON_VERSION") or "3.12"
+# 商店测试中额外测试的环境，用于记录插件在不同环境下的兼容性
+# 格式为 JSON 列表，例：[{"python": "3.13"}, {"python": "3.12", "constraints": ["pydantic<2.0"]}]
+PLUGIN_TEST_MATRIX = os.environ.get("PLUGIN_TEST_MATRIX") or "[]"
+# 每个插件测试容器的资源配额
+PLUGIN_TEST_CPUS = float(os.environ.get("PLUGIN_TEST_CPUS") or 1)
+""" CPU 数量 """
+PLUGIN_TEST_MEMORY = int(os.environ.get("PLUGIN_TEST_MEMORY") or 2 * 1024**3)
+""" 内存大小，单位为字节 """
+# 插件测试后端，可选 docker 或 local
+# local 在本地进程中测试插件，适用于无法使用 Docker 的环境
+PLUGIN_TEST_BACKEND = os.environ.get("PLUGIN_TEST_BACKEND") or "docker"
+# 预先下载的插件分发文件目录，测试时优先从此处安装插件
+PLUGIN_TEST_WHEELHOUSE = os.environ.get("PLUGIN_TEST_WHEELHOUSE") or os.path.expanduser(
+    "~/.cache/noneflow/wheels"
+)
+# 保存的锁文件目录，同一插件版本重新测试时直接按锁文件安装
+# Docker 命名卷无法在 GitHub Actions 的多次运行之间保存，所以挂载主机目录，可以通过 actions/cache 缓存
+PLUGIN_TEST_LOCK_DIR = os.environ.get("PLUGIN_TEST_LOCK_DIR") or os.path.expanduser(
+    "~/.cache/noneflow/locks"
+)
+PLUGIN_PREFETCH_CONCURRENCY = int(os.environ.get("PLUGIN_PREFETCH_CONCURRENCY") or 8)
+""" 同时下载的插件分发文件数量 """
+
+# 项目主页可访问性检查结果的缓存文件，在多次运行之间复用
+HOMEPAGE_CACHE_PATH = os.environ.get("HOMEPAGE_CACHE_PATH") or os.path.expanduser(
+    "~/.cache/noneflow/homepages.json"
+)
+HOMEPAGE_CHECK_CONCURRENCY = int(os.environ.get("HOMEPAGE_CHECK_CONCURRENCY") or 16)
+""" 批量检查项目主页时同时发送的请求数量 """
+HOMEPAGE_HOST_CONCURRENCY = 2
+""" 同一网站同时发送的请求数量 """
+HOMEPAGE_HOST_DELAY = 1.0
+""" 同一网站两次请求之间的间隔，单位为秒 """
+
+# 离线验证，开启后验证所需的网络数据全部从离线数据库读取
+# 数据库通过 store_test 的 sync-facts 命令同步
+VALIDATION_OFFLINE = os.environ.get("VALIDATION_OFFLINE") == "1"
+VALIDATION_FACTS_PATH = os.environ.get("VALIDATION_FACTS_PATH") or os.path.expanduser(
+    "~/.cache/noneflow/facts.db"
+)
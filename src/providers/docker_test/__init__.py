@@ -1,10 +1,57 @@
+import abc
+import asyncio
 import json
-from typing import TypedDict
+import math
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from functools import cache, partial
+from typing import TYPE_CHECKING, Any, Literal, NotRequired, TypedDict
 
-import docker
-from pydantic import BaseModel, SkipValidation, field_validator
+from pydantic import BaseModel, ConfigDict, SkipValidation, field_validator
 
-from src.providers.constants import DOCKER_IMAGES
+from src.providers.constants import (
+    DOCKER_CACHE_VOLUME,
+    DOCKER_IMAGES,
+    PLUGIN_TEST_BACKEND,
+    PLUGIN_TEST_CPUS,
+    PLUGIN_TEST_LOCK_DIR,
+    PLUGIN_TEST_MATRIX,
+    PLUGIN_TEST_MEMORY,
+    PLUGIN_TEST_PYTHON_VERSION,
+    PLUGIN_TEST_WHEELHOUSE,
+    REGISTRY_PLUGINS_URL,
+)
+from src.providers.logger import logger
+from src.providers.utils import load_json_from_web
+
+from .constants import (
+    DEFAULT_PHASE_TIMEOUT,
+    EVENT_METADATA,
+    EVENT_OUTPUT,
+    EVENT_PHASE_FINISHED,
+    EVENT_PHASE_STARTED,
+    EVENT_RESULT,
+    LOCK_MOUNT,
+    PHASE_CREATE,
+    PHASE_LOCK,
+    PHASE_RESTORE,
+    PHASE_TIMEOUT_FACTOR,
+    PHASE_TIMEOUT_GRACE,
+    PHASE_TIMEOUT_MIN,
+    PHASE_TIMEOUTS,
+    WHEELHOUSE_MOUNT,
+)
+from .scheduler import get_scheduler
+
+if TYPE_CHECKING:
+    import docker
+
+PluginTestBackendType = Literal["docker", "local"]
+""" 插件测试后端
+
+docker: 在 Docker 容器中测试
+local: 在本地进程中测试，不需要 Docker
+"""
 
 
 class Metadata(TypedDict):
@@ -17,9 +64,36 @@ class Metadata(TypedDict):
     supported_adapters: list[str] | None
 
 
+class PhaseTiming(TypedDict):
+    """测试阶段耗时，单位为秒"""
+
+    wall: float
+    cpu: float
+    max_rss: NotRequired[int]
+    """ 阶段中命令及其子进程的峰值常驻内存，单位为 KB
+
+    旧版本镜像或命令被终止时没有记录
+    """
+
+
+class PluginProfile(TypedDict):
+    """插件加载性能数据"""
+
+    load_time: float
+    """ load_plugin 耗时，单位为秒 """
+    base_rss: int
+    """ 加载插件前的峰值内存占用，单位为字节 """
+    peak_rss: int
+    """ 加载插件后的峰值内存占用，单位为字节 """
+    import_times: dict[str, int]
+    """ 自身导入耗时最长的模块，单位为微秒 """
+
+
 class DockerTestResult(BaseModel):
     """Docker 测试结果"""
 
+    model_config = ConfigDict(defer_build=True)
+
     run: bool
     """ 是否运行测试 """
     load: bool
@@ -37,6 +111,12 @@ class DockerTestResult(BaseModel):
     """
     metadata: SkipValidation[Metadata] | None = None
     """ 插件元数据 """
+    oom_killed: bool = False
+    """ 是否因内存不足被终止 """
+    timings: dict[str, PhaseTiming] = {}
+    """ 各测试阶段耗时 """
+    profile: SkipValidation[PluginProfile] | None = None
+    """ 插件加载性能数据 """
 
     @field_validator("config", mode="before")
     @classmethod
@@ -44,44 +124,465 @@ class DockerTestResult(BaseModel):
         return v or ""
 
 
-class DockerPluginTest:
-    def __init__(self, project_link: str, module_name: str, config: str = ""):
+class MatrixCell(BaseModel):
+    """测试矩阵中的一个测试环境"""
+
+    model_config = ConfigDict(defer_build=True)
+
+    python: str
+    """ Python 版本 """
+    constraints: list[str] = []
+    """ 额外的依赖约束
+
+    例：["pydantic<2.0"]
+    """
+
+    @property
+    def test_env(self) -> str:
+        """测试环境
+
+        在测试未能获取到实际环境时使用
+        python==3.12 pydantic<2.0
+        """
+        return " ".join([f"python=={self.python}", *self.constraints])
+
+
+def get_test_matrix() -> list[MatrixCell]:
+    """获取商店测试的测试矩阵
+
+    第一个为主要测试环境，其余为环境变量中配置的额外测试环境
+    """
+    matrix = [MatrixCell(python=PLUGIN_TEST_PYTHON_VERSION)]
+    matrix.extend(MatrixCell(**cell) for cell in json.loads(PLUGIN_TEST_MATRIX))
+    return matrix
+
+
+@cache
+def get_plugin_index() -> str | None:
+    """获取插件索引
+
+    由主机获取一次后传递给所有测试，格式为紧凑的 JSON：
+    {"规范化的项目名": "模块名"}
+
+    获取失败时返回 None，由测试自行获取
+    """
+    from .plugin_test import canonicalize_name
+
+    try:
+        plugins = load_json_from_web(REGISTRY_PLUGINS_URL)
+    except Exception as e:
+        logger.warning(f"获取插件索引失败：{e}")
+        return None
+    return json.dumps(
+        {
+            canonicalize_name(plugin["project_link"]): plugin["module_name"]
+            for plugin in plugins
+        },
+        separators=(",", ":"),
+    )
+
+
+@cache
+def get_docker_client() -> "docker.DockerClient":
+    """获取共享的 Docker 客户端
+
+    客户端是线程安全的，所有测试共用同一个连接
+    docker 导入较慢，只在需要时导入
+    """
+    import docker
+
+    return docker.DockerClient(base_url="unix://var/run/docker.sock")
+
+
+def remove_container(container) -> None:
+    """停止并删除容器"""
+    try:
+        container.remove(force=True)
+    except Exception as e:
+        logger.warning(f"删除容器失败：{e}")
+
+
+async def create_container[T](create: Callable[[], T]) -> T:
+    """在线程中创建容器
+
+    取消时线程中的创建不会停止，之后创建出的容器同样需要删除，
+    由线程或取消的一方删除，取决于哪一方后拿到锁
+    """
+    lock = threading.Lock()
+    cancelled = False
+    created: list[T] = []
+
+    def run() -> T:
+        container = create()
+        with lock:
+            if not cancelled:
+                created.append(container)
+                return container
+        remove_container(container)
+        return container
+
+    try:
+        return await asyncio.to_thread(run)
+    except asyncio.CancelledError:
+        with lock:
+            cancelled = True
+            containers = created.copy()
+        for container in containers:
+            await asyncio.shield(asyncio.to_thread(remove_container, container))
+        raise
+
+
+def is_oom_killed(container) -> bool:
+    """容器是否因内存不足被终止"""
+    container.reload()
+    return container.attrs["State"]["OOMKilled"]
+
+
+def iter_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """将容器输出的数据块拆分成行"""
+    buffer = b""
+    for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line.decode()
+    if buffer:
+        yield buffer.decode()
+
+
+def get_phase_timeouts(timings: dict[str, PhaseTiming] | None) -> dict[str, int]:
+    """根据插件上次测试各阶段的耗时计算超时时间
+
+    耗时较短的插件卡住时可以更早结束测试，没有上次耗时的阶段使用默认超时时间
+
+    Args:
+        timings (dict[str, PhaseTiming] | None): 上次测试各阶段的耗时
+    """
+    timeouts = {}
+    for phase, timing in (timings or {}).items():
+        default = PHASE_TIMEOUTS.get(phase, DEFAULT_PHASE_TIMEOUT)
+        timeout = math.ceil(timing["wall"] * PHASE_TIMEOUT_FACTOR)
+        timeouts[phase] = min(max(timeout, PHASE_TIMEOUT_MIN), default)
+    return timeouts
+
+
+class PluginTestBackend(abc.ABC):
+    """插件测试后端
+
+    不同后端只需实现 _run，按相同的事件协议读取测试进程的输出
+    """
+
+    def __init__(
+        self,
+        project_link: str,
+        module_name: str,
+        config: str = "",
+        cpus: float = PLUGIN_TEST_CPUS,
+        memory: int = PLUGIN_TEST_MEMORY,
+        timeouts: dict[str, int] | None = None,
+    ):
         self.project_link = project_link
         self.module_name = module_name
         self.config = config
+        # 各测试阶段的超时时间，未指定的阶段使用默认值
+        self.timeouts = timeouts or {}
+        # 测试的资源配额
+        self.cpus = cpus
+        self.memory = memory
+
+    @property
+    def wheelhouse(self) -> str:
+        """测试进程中预先下载的插件分发文件目录"""
+        return PLUGIN_TEST_WHEELHOUSE
+
+    @property
+    def lock_dir(self) -> str:
+        """测试进程中保存的锁文件目录"""
+        return PLUGIN_TEST_LOCK_DIR
+
+    async def run_matrix(self, matrix: list[MatrixCell]) -> list[DockerTestResult]:
+        """在多个测试环境中同时测试插件
+
+        所有测试环境并行运行，并共享缓存
+
+        Args:
+            matrix (list[MatrixCell]): 测试矩阵
+
+        Returns:
+            list[DockerTestResult]: 与测试矩阵顺序一致的测试结果
+        """
+        return await asyncio.gather(
+            *(self.run(cell.python, cell.constraints) for cell in matrix)
+        )
+
+    async def run(
+        self,
+        version: str,
+        constraints: list[str] | None = None,
+        reuse_environment: bool = False,
+    ) -> DockerTestResult:
+        """测试插件
 
-    async def run(self, version: str) -> DockerTestResult:
-        """运行 Docker 容器测试插件
+        测试输出的事件会在线程中实时读取，不会阻塞事件循环。
+        如果测试阶段超时或测试被取消，测试进程会被终止。
+        测试只有在主机剩余资源足够时才会开始，并受到 CPU 与内存配额的限制。
 
         Args:
             version (str): 对应的 Python 版本
+            constraints (list[str] | None): 额外的依赖约束
+            reuse_environment (bool): 是否复用之前安装好的测试环境，
+                仅修改插件配置重新测试时使用
 
         Returns:
             DockerTestResult: 测试结果
         """
-        # 连接 Docker 环境
-        client = docker.DockerClient(base_url="unix://var/run/docker.sock")
+        environment = {
+            # 运行测试的 Python 版本
+            "PYTHON_VERSION": version,
+            # 插件信息
+            "PROJECT_LINK": self.project_link,
+            "MODULE_NAME": self.module_name,
+            "PLUGIN_CONFIG": self.config,
+            "PLUGIN_WHEELHOUSE": self.wheelhouse,
+            "PLUGIN_LOCK_DIR": self.lock_dir,
+        }
+        if constraints:
+            environment["PLUGIN_CONSTRAINTS"] = json.dumps(constraints)
+        if reuse_environment:
+            environment["PLUGIN_REUSE_ENVIRONMENT"] = "1"
+        if self.timeouts:
+            environment["PLUGIN_TIMEOUTS"] = json.dumps(self.timeouts)
+        # 插件索引用于将依赖的包名转换为模块名
+        plugin_index = await asyncio.to_thread(get_plugin_index)
+        if plugin_index:
+            environment["PLUGIN_INDEX"] = plugin_index
+
+        async with get_scheduler().reserve(self.cpus, self.memory):
+            return await self._run(environment)
+
+    @abc.abstractmethod
+    async def _run(self, environment: dict[str, str]) -> DockerTestResult:
+        """启动测试并读取测试结果
+
+        Args:
+            environment (dict[str, str]): 传递给测试进程的环境变量
+        """
+
+    async def _read_events(
+        self,
+        read_lines: Callable[[], Iterable[str]],
+        check_oom_killed: Callable[[], bool] | None = None,
+    ) -> dict[str, Any]:
+        """实时读取测试输出的事件，直到测试结束
+
+        测试的每个阶段都有超时限制，主机在此基础上额外等待一段时间，
+        如果阶段仍未结束，则认为测试已经卡住，直接返回超时结果。
+
+        Args:
+            read_lines (Callable[[], Iterable[str]]): 在单独的线程中调用，返回测试输出的每一行
+            check_oom_killed (Callable[[], bool] | None): 测试结束后检查是否因内存不足被终止
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[str | Exception | None] = asyncio.Queue()
+
+        def put(item: str | Exception | None):
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:  # pragma: no cover
+                # 事件循环已经关闭
+                pass
 
+        def reader():
+            try:
+                for line in read_lines():
+                    put(line)
+            except Exception as e:
+                put(e)
+            finally:
+                put(None)
+
+        # 读取会持续到测试结束，不能占用默认线程池
+        # 否则同时卡住的测试过多时，删除容器等操作拿不到线程，导致死锁
+        threading.Thread(target=reader, daemon=True).start()
+
+        outputs: list[str] = []
+        timings: dict[str, PhaseTiming] = {}
+        deadlines: dict[str, float] = {}
+        run = False
+        result: dict[str, Any] | None = None
+        while True:
+            timeout = min(deadlines.values()) - loop.time() if deadlines else None
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except TimeoutError:
+                phase = min(deadlines, key=lambda x: deadlines[x])
+                logger.warning(f"插件 {self.project_link} 测试阶段 {phase} 超时")
+                outputs.append(f"测试阶段 {phase} 超时")
+                return {
+                    "run": run,
+                    "load": False,
+                    "output": "\n".join(outputs),
+                    "timings": timings,
+                }
+
+            if item is None:
+                break
+            if isinstance(item, Exception):
+                raise item
+
+            try:
+                event = json.loads(item)
+            except json.JSONDecodeError:
+                logger.debug(f"无法解析的测试输出：{item}")
+                continue
+            if not isinstance(event, dict):
+                continue
+
+            event_type = event.get("event")
+            if event_type is None:
+                # 旧版本镜像只在最后输出一次完整的测试结果
+                result = event
+            elif event_type == EVENT_RESULT:
+                result = event["result"]
+            elif event_type == EVENT_PHASE_STARTED:
+                phase = event["phase"]
+                phase_timeout = event.get("timeout")
+                if phase_timeout is None:
+                    phase_timeout = DEFAULT_PHASE_TIMEOUT
+                deadlines[phase] = loop.time() + phase_timeout + PHASE_TIMEOUT_GRACE
+                logger.info(f"插件 {self.project_link} 开始测试阶段 {phase}")
+            elif event_type == EVENT_PHASE_FINISHED:
+                phase = event["phase"]
+                deadlines.pop(phase, None)
+                # 安装或恢复测试环境成功后才会加载插件
+                if phase in (PHASE_CREATE, PHASE_LOCK, PHASE_RESTORE) and event.get(
+                    "success"
+                ):
+                    run = True
+                if "wall" in event:
+                    timings[phase] = {"wall": event["wall"], "cpu": event["cpu"]}
+                    if "max_rss" in event:
+                        timings[phase]["max_rss"] = event["max_rss"]
+                logger.info(
+                    f"插件 {self.project_link} 测试阶段 {phase} {'成功' if event.get('success') else '失败'}"
+                )
+            elif event_type == EVENT_OUTPUT:
+                outputs.append(event["text"])
+                logger.debug(event["text"])
+            elif event_type == EVENT_METADATA:
+                logger.info(f"插件 {self.project_link} 元数据：{event['metadata']}")
+
+        # 测试已经结束，检查是否因内存不足被终止
+        # 插件进程被终止时，测试代码仍可能输出测试结果
+        oom_killed = (
+            await asyncio.to_thread(check_oom_killed) if check_oom_killed else False
+        )
+        if oom_killed:
+            logger.warning(f"插件 {self.project_link} 测试因内存不足被终止")
+            outputs.append("测试因内存不足被终止")
+
+        if result is None:
+            if not oom_killed:
+                outputs.append("未获取到测试结果")
+            result = {
+                "run": run,
+                "load": False,
+                "output": "\n".join(outputs),
+                "timings": timings,
+            }
+        elif oom_killed:
+            result = {
+                **result,
+                "load": False,
+                "output": f"{result.get('output', '')}\n测试因内存不足被终止",
+            }
+        # 旧版本镜像的测试结果中没有耗时
+        result.setdefault("timings", timings)
+        result["oom_killed"] = oom_killed
+        return result
+
+
+class DockerPluginTest(PluginTestBackend):
+    """在 Docker 容器中测试插件
+
+    容器以后台模式运行，结束或被取消后会被停止并删除
+    """
+
+    @property
+    def wheelhouse(self) -> str:
+        return WHEELHOUSE_MOUNT
+
+    @property
+    def lock_dir(self) -> str:
+        return LOCK_MOUNT
+
+    async def _run(self, environment: dict[str, str]) -> DockerTestResult:
+        """运行容器并读取测试结果"""
         try:
-            # 运行 Docker 容器，捕获输出。 容器内运行的代码拥有超时设限，此处无需设置超时
-            output = client.containers.run(
-                DOCKER_IMAGES,
-                environment={
-                    # 运行测试的 Python 版本
-                    "PYTHON_VERSION": version,
-                    # 插件信息
-                    "PROJECT_LINK": self.project_link,
-                    "MODULE_NAME": self.module_name,
-                    "PLUGIN_CONFIG": self.config,
-                },
-                detach=False,
-                remove=True,
-            ).decode()
-            data = json.loads(output)
+            client = get_docker_client()
+            container = await create_container(
+                partial(
+                    client.containers.run,
+                    DOCKER_IMAGES,
+                    environment=environment,
+                    # 共享 uv 与 poetry 的缓存，避免重复下载
+                    volumes={
+                        DOCKER_CACHE_VOLUME: {"bind": "/root/.cache", "mode": "rw"},
+                        # 商店测试预先下载的插件分发文件
+                        PLUGIN_TEST_WHEELHOUSE: {
+                            "bind": WHEELHOUSE_MOUNT,
+                            "mode": "ro",
+                        },
+                        # 锁文件保存在主机目录中，可以在多次运行之间缓存
+                        PLUGIN_TEST_LOCK_DIR: {"bind": LOCK_MOUNT, "mode": "rw"},
+                    },
+                    nano_cpus=int(self.cpus * 1e9),
+                    mem_limit=self.memory,
+                    detach=True,
+                )
+            )
+        except Exception as e:
+            return DockerTestResult(run=False, load=False, output=str(e))
+
+        try:
+            data = await self._read_events(
+                lambda: iter_lines(
+                    container.logs(stream=True, follow=True, stdout=True, stderr=False)
+                ),
+                partial(is_oom_killed, container),
+            )
         except Exception as e:
             data = {
                 "run": False,
                 "load": False,
                 "output": str(e),
             }
+        finally:
+            # 无论是正常结束还是被取消，都需要清理容器
+            await asyncio.shield(asyncio.to_thread(remove_container, container))
         return DockerTestResult(**data)
+
+
+def get_plugin_test(
+    project_link: str,
+    module_name: str,
+    config: str = "",
+    backend: str = PLUGIN_TEST_BACKEND,
+    timeouts: dict[str, int] | None = None,
+) -> PluginTestBackend:
+    """获取指定后端的插件测试
+
+    Args:
+        project_link (str): 插件的项目名
+        module_name (str): 插件的模块名
+        config (str): 插件配置
+        backend (str): 插件测试后端，可选 docker 或 local
+        timeouts (dict[str, int] | None): 各测试阶段的超时时间
+    """
+    if backend == "local":
+        from .local import LocalPluginTest
+
+        return LocalPluginTest(project_link, module_name, config, timeouts=timeouts)
+    if backend == "docker":
+        return DockerPluginTest(project_link, module_name, config, timeouts=timeouts)
+    raise ValueError(f"不支持的插件测试后端：{backend}")
@@ -1,4 +1,5 @@
 import asyncio
+import json
 import os
 
 from .plugin_test import PluginTest
@@ -11,14 +12,37 @@ def main():
     PROJECT_LINK 为插件的项目名
     MODULE_NAME 为插件的模块名
     PLUGIN_CONFIG 为该插件的配置
+    PLUGIN_CONSTRAINTS 为额外的依赖约束，格式为 JSON 列表
+    PLUGIN_WHEELHOUSE 为预先下载的插件分发文件目录
+    PLUGIN_LOCK_DIR 为保存的锁文件目录
+    PLUGIN_INDEX 为主机提供的插件索引，格式为 JSON 对象
+    PLUGIN_REUSE_ENVIRONMENT 为 1 时复用之前安装好的测试环境
+    PLUGIN_TIMEOUTS 为各测试阶段的超时时间，格式为 JSON 对象
     """
     python_version = os.environ.get("PYTHON_VERSION", "")
 
     project_link = os.environ.get("PROJECT_LINK", "")
     module_name = os.environ.get("MODULE_NAME", "")
     plugin_config = os.environ.get("PLUGIN_CONFIG", None)
-
-    plugin = PluginTest(python_version, project_link, module_name, plugin_config)
+    constraints = json.loads(os.environ.get("PLUGIN_CONSTRAINTS") or "[]")
+    wheelhouse = os.environ.get("PLUGIN_WHEELHOUSE", None)
+    lock_dir = os.environ.get("PLUGIN_LOCK_DIR", None)
+    plugin_index = os.environ.get("PLUGIN_INDEX", None)
+    reuse_environment = os.environ.get("PLUGIN_REUSE_ENVIRONMENT") == "1"
+    timeouts = json.loads(os.environ.get("PLUGIN_TIMEOUTS") or "{}")
+
+    plugin = PluginTest(
+        python_version,
+        project_link,
+        module_name,
+        plugin_config,
+        constraints,
+        wheelhouse,
+        json.loads(plugin_index) if plugin_index else None,
+        reuse_environment,
+        timeouts,
+        lock_dir,
+    )
 
     asyncio.run(plugin.run())
 
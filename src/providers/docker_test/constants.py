@@ -0,0 +1,95 @@
+from pathlib import Path
+
+# 容器与主机之间的事件类型
+# 容器每行输出一个 JSON 对象，其中 event 字段为以下值之一
+EVENT_PHASE_STARTED = "phase_started"
+""" 测试阶段开始 """
+EVENT_PHASE_FINISHED = "phase_finished"
+""" 测试阶段结束 """
+EVENT_OUTPUT = "output"
+""" 测试输出 """
+EVENT_METADATA = "metadata"
+""" 插件元数据 """
+EVENT_RESULT = "result"
+""" 最终测试结果 """
+
+# 测试阶段
+PHASE_TEMPLATE = "template"
+""" 构建基础环境模板 """
+PHASE_CREATE = "create"
+""" 创建测试项目并安装插件 """
+PHASE_LOCK = "lock"
+""" 按保存的锁文件安装插件，失败时再以 PHASE_CREATE 重新解析依赖 """
+PHASE_RESTORE = "restore"
+""" 恢复保存的测试环境 """
+PHASE_INTROSPECT = "introspect"
+""" 获取测试环境信息 """
+PHASE_PACKAGE_INFO = "package_info"
+""" 获取插件信息 """
+PHASE_DEPENDENCIES = "dependencies"
+""" 获取插件依赖 """
+PHASE_PYTHON_VERSION = "python_version"
+""" 获取 Python 版本 """
+PHASE_LOAD = "load"
+""" 加载插件 """
+
+# 插件加载性能分析
+IMPORT_MARKER = "noneflow: start loading plugin"
+""" 插件开始加载时输出到标准错误流的标记 """
+IMPORT_TIME_LIMIT = 10
+""" 记录导入耗时最长的模块数量 """
+
+COMMAND_KILL_GRACE = 5
+""" 命令超时后先发送 SIGTERM，等待进程组退出的时间，之后发送 SIGKILL """
+
+DEFAULT_PHASE_TIMEOUT = 300
+""" 未指定超时时间的测试阶段默认超时时间 """
+PHASE_TIMEOUT_GRACE = 60
+""" 主机在容器内超时时间基础上额外等待的时间 """
+PHASE_TIMEOUTS = {PHASE_LOAD: 600, PHASE_LOCK: 180}
+""" 各测试阶段的默认超时时间，未列出的阶段使用 DEFAULT_PHASE_TIMEOUT
+
+按锁文件安装失败后还需要重新解析依赖，因此超时时间较短
+"""
+
+# 根据插件上次测试各阶段的耗时调整超时时间
+# 超时时间为上次耗时的倍数，不低于下限，也不超过默认超时时间
+PHASE_TIMEOUT_FACTOR = 4
+""" 超时时间相对于上次耗时的倍数 """
+PHASE_TIMEOUT_MIN = 120
+""" 超时时间的下限 """
+
+WHEELHOUSE_MOUNT = "/wheels"
+""" 预先下载的插件分发文件在容器中的挂载位置 """
+
+# 锁文件
+# 同一插件版本重新测试时直接使用保存的锁文件安装，无需重新解析依赖
+LOCK_DIR = Path.home() / ".cache" / "noneflow" / "locks"
+""" 未指定时的锁文件存放目录 """
+LOCK_MOUNT = "/locks"
+""" 主机的锁文件目录在容器中的挂载位置 """
+LOCK_FILES = ["pyproject.toml", "poetry.lock"]
+""" 需要保存的项目文件 """
+
+# 测试环境
+# 仅修改插件配置重新测试时直接恢复之前安装好的测试环境，只需重新加载插件
+ENV_DIR = Path.home() / ".cache" / "noneflow" / "envs"
+""" 测试环境存放目录 """
+ENV_INFO_FILE = "environment.json"
+""" 测试环境信息文件，记录插件版本与测试环境 """
+
+# Python 解释器
+# uv 默认安装到 ~/.local/share/uv/python，不在缓存卷中，每个容器都需要重新下载
+PYTHON_INSTALL_DIR = Path.home() / ".cache" / "noneflow" / "python"
+""" uv 管理的 Python 解释器安装目录，位于缓存卷中 """
+
+# 基础环境模板
+# 位于缓存卷中，同一镜像的所有测试容器共享
+TEMPLATE_DIR = Path.home() / ".cache" / "noneflow" / "templates"
+""" 基础环境模板存放目录 """
+TEMPLATE_PACKAGES = ["nonebot2"]
+""" 基础环境模板中预装的依赖
+
+仅包含几乎所有插件都会依赖的包，安装插件时以最新版本固定在模板中，
+安装插件后会移除插件未依赖的包
+"""
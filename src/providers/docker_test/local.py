@@ -0,0 +1,95 @@
+"""不依赖 Docker 的本地插件测试后端
+
+在临时目录中启动测试进程，插件安装在该目录下独立的虚拟环境中
+"""
+
+import asyncio
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from . import DockerTestResult, PluginTestBackend
+
+PROJECT_ROOT = Path(__file__).parents[3]
+""" 项目根目录，测试进程需要从此处导入测试代码 """
+TEST_COMMAND = [sys.executable, "-m", "src.providers.docker_test"]
+""" 测试进程的启动命令 """
+
+
+LIMITS_LAUNCHER = """\
+import os, resource, sys
+
+memory = int(sys.argv[1])
+resource.setrlimit(resource.RLIMIT_DATA, (memory, memory))
+resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+os.execvp(sys.argv[2], sys.argv[2:])
+"""
+""" 设置资源限制后启动测试进程
+
+在多线程中 fork 后运行 preexec_fn 可能死锁，所以由单独的启动进程设置限制。
+内存使用 RLIMIT_DATA 限制，不计入共享库、文件映射与未提交的地址空间，
+RLIMIT_AS 会因这些映射在内存远未用完时就让插件测试失败。
+"""
+
+
+def limited_command(command: list[str], memory: int) -> list[str]:
+    """在资源限制下运行命令"""
+    return [sys.executable, "-c", LIMITS_LAUNCHER, str(memory), *command]
+
+
+def stop_process(process: subprocess.Popen) -> None:
+    """终止测试进程及其创建的所有子进程"""
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    process.wait()
+
+
+class LocalPluginTest(PluginTestBackend):
+    """在本地进程中测试插件
+
+    测试进程位于单独的进程组中，结束或被取消后整个进程组都会被终止。
+    内存配额通过 RLIMIT_DATA 限制，CPU 配额只用于资源调度。
+    """
+
+    async def _run(self, environment: dict[str, str]) -> DockerTestResult:
+        """启动测试进程并读取测试结果"""
+        test_dir = tempfile.mkdtemp(prefix="noneflow-plugin-test-")
+        try:
+            process = await asyncio.to_thread(
+                subprocess.Popen,
+                limited_command(TEST_COMMAND, self.memory),
+                cwd=test_dir,
+                env={**os.environ, **environment, "PYTHONPATH": str(PROJECT_ROOT)},
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                start_new_session=True,
+            )
+        except Exception as e:
+            shutil.rmtree(test_dir, ignore_errors=True)
+            return DockerTestResult(run=False, load=False, output=str(e))
+
+        def read_lines():
+            assert process.stdout
+            for line in process.stdout:
+                yield line.rstrip("\n")
+
+        try:
+            data = await self._read_events(read_lines)
+        except Exception as e:
+            data = {
+                "run": False,
+                "load": False,
+                "output": str(e),
+            }
+        finally:
+            # 无论是正常结束还是被取消，都需要终止进程并清理临时目录
+            await asyncio.shield(asyncio.to_thread(stop_process, process))
+            shutil.rmtree(test_dir, ignore_errors=True)
+        return DockerTestResult(**data)
@@ -5,17 +5,93 @@
 # ruff: noqa: T201, ASYNC109
 
 import asyncio
+import hashlib
 import json
 import os
 import re
-from asyncio import create_subprocess_shell, subprocess
+import resource
+import shlex
+import shutil
+import signal
+import sys
+import time
+from asyncio import create_subprocess_exec, subprocess
+from contextvars import ContextVar
 from pathlib import Path
+from typing import Any
+from uuid import uuid4
 
 import httpx
 
 from src.providers.constants import REGISTRY_PLUGINS_URL
 
-from .render import render_fake, render_runner
+from .constants import (
+    COMMAND_KILL_GRACE,
+    DEFAULT_PHASE_TIMEOUT,
+    ENV_DIR,
+    ENV_INFO_FILE,
+    EVENT_METADATA,
+    EVENT_OUTPUT,
+    EVENT_PHASE_FINISHED,
+    EVENT_PHASE_STARTED,
+    EVENT_RESULT,
+    IMPORT_MARKER,
+    IMPORT_TIME_LIMIT,
+    LOCK_DIR,
+    LOCK_FILES,
+    PHASE_CREATE,
+    PHASE_DEPENDENCIES,
+    PHASE_INTROSPECT,
+    PHASE_LOAD,
+    PHASE_LOCK,
+    PHASE_PACKAGE_INFO,
+    PHASE_PYTHON_VERSION,
+    PHASE_RESTORE,
+    PHASE_TEMPLATE,
+    PHASE_TIMEOUTS,
+    PYTHON_INSTALL_DIR,
+    TEMPLATE_DIR,
+    TEMPLATE_PACKAGES,
+)
+from .render import render_fake, render_introspect, render_runner
+
+
+def emit_event(event: str, **data: Any) -> None:
+    """输出一行 JSON 事件，供主机实时读取"""
+    print(json.dumps({"event": event, **data}, ensure_ascii=False), flush=True)
+
+
+def children_cpu_time() -> float:
+    """已结束的子进程消耗的 CPU 时间"""
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+MAX_RSS_LAUNCHER = """\
+import os, resource, subprocess, sys
+
+code = subprocess.call(sys.argv[2], shell=True)
+usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+os.write(int(sys.argv[1]), str(usage.ru_maxrss).encode())
+sys.exit(code if code >= 0 else 128 - code)
+"""
+""" 通过 shell 执行命令，结束后将命令的峰值内存写入指定的文件描述符
+
+启动进程只等待这一条命令，所以 RUSAGE_CHILDREN 只包含该命令及其子进程
+"""
+
+_command_usage: ContextVar[dict[str, int] | None] = ContextVar(
+    "command_usage", default=None
+)
+""" 当前测试阶段中命令的资源使用情况，由 command 写入 """
+
+
+def kill_process_group(pid: int, sig: signal.Signals) -> None:
+    """向进程组发送信号，进程组已不存在时忽略"""
+    try:
+        os.killpg(pid, sig)
+    except ProcessLookupError:
+        pass
 
 
 def strip_ansi(text: str | None) -> str:
@@ -39,6 +115,15 @@ def get_plugin_list() -> dict[str, str]:
     }
 
 
+def get_latest_version(project_link: str) -> str | None:
+    """获取插件在 PyPI 上的最新版本号"""
+    try:
+        r = httpx.get(f"https://pypi.org/pypi/{project_link}/json")
+        return r.json()["info"]["version"] if r.status_code == 200 else None
+    except Exception:
+        return None
+
+
 _canonicalize_regex = re.compile(r"[-_.]+")
 
 
@@ -94,6 +179,56 @@ def parse_requirements(requirements: str) -> dict[str, str]:
     return results
 
 
+def parse_import_times(stderr: str) -> tuple[str, dict[str, int]]:
+    """解析 python -X importtime 的输出
+
+    只统计插件开始加载后导入的模块
+
+    Returns:
+        tuple[str, dict[str, int]]: 去除导入耗时后的标准错误流，
+            以及自身导入耗时最长的模块及其耗时（微秒）
+    """
+    lines = []
+    times: dict[str, int] = {}
+    loading = False
+    for line in stderr.splitlines():
+        if line == IMPORT_MARKER:
+            loading = True
+            continue
+        if not line.startswith("import time:"):
+            lines.append(line)
+            continue
+        # import time: self [us] | cumulative | imported package
+        match = re.match(r"import time:\s+(\d+) \|\s+\d+ \|\s+(\S+)", line)
+        if match and loading:
+            times[match.group(2)] = int(match.group(1))
+
+    slowest = sorted(times.items(), key=lambda x: x[1], reverse=True)
+    return "\n".join(lines), dict(slowest[:IMPORT_TIME_LIMIT])
+
+
+def staging_path(target: Path) -> Path:
+    """与目标目录同级的临时目录，准备好内容后通过 publish_staged 移动到目标位置"""
+    return target.with_name(f"{target.name}-{uuid4().hex}").absolute()
+
+
+def publish_staged(staging: Path, target: Path) -> bool:
+    """将准备好的临时目录重命名为目标目录
+
+    多个容器共享缓存目录，直接写入目标目录时其他容器可能读到不完整的内容。
+    重命名是原子操作，目标目录已存在时说明其他容器已完成，丢弃临时目录。
+
+    Returns:
+        bool: 是否重命名成功
+    """
+    try:
+        staging.rename(target)
+    except OSError:
+        shutil.rmtree(staging, ignore_errors=True)
+        return False
+    return True
+
+
 class PluginTest:
     def __init__(
         self,
@@ -101,21 +236,42 @@ class PluginTest:
         project_link: str,
         module_name: str,
         config: str | None = None,
+        constraints: list[str] | None = None,
+        wheelhouse: str | None = None,
+        plugin_index: dict[str, str] | None = None,
+        reuse_environment: bool = False,
+        timeouts: dict[str, int] | None = None,
+        lock_dir: str | None = None,
     ) -> None:
         """插件测试构造函数
 
         Args:
             project_info (str): 项目信息，格式为 project_link:module_name
             config (str | None, optional): 插件配置. 默认为 None.
+            constraints (list[str] | None, optional): 额外的依赖约束. 默认为 None.
+            wheelhouse (str | None, optional): 预先下载的插件分发文件目录. 默认为 None.
+            plugin_index (dict[str, str] | None, optional): 主机提供的插件索引，
+                为 None 时从商店获取. 默认为 None.
+            reuse_environment (bool, optional): 是否复用之前安装好的测试环境. 默认为 False.
+            timeouts (dict[str, int] | None, optional): 各测试阶段的超时时间，
+                未指定的阶段使用默认值. 默认为 None.
+            lock_dir (str | None, optional): 保存的锁文件目录，为 None 时使用默认目录. 默认为 None.
         """
         self.python_version = python_version
 
         self.project_link = project_link
         self.module_name = module_name
         self.config = config
+        self.constraints = constraints or []
+        self.wheelhouse = wheelhouse
+        self.reuse_environment = reuse_environment
+        self.timeouts = timeouts or {}
 
-        self._plugin_list = None
+        self._plugin_list = plugin_index
         self._test_dir = Path("plugin_test")
+        self._template_dir = TEMPLATE_DIR
+        self._lock_dir = Path(lock_dir) if lock_dir else LOCK_DIR
+        self._env_dir = ENV_DIR
         # 插件信息
         self._version = None
         # 插件测试结果
@@ -127,6 +283,10 @@ class PluginTest:
         self._deps = []
         self._test_env = []
         self._test_python_version = "unknown"
+        # 各测试阶段耗时
+        self._timings: dict[str, dict[str, float]] = {}
+        # 插件加载时的导入耗时
+        self._import_times: dict[str, int] = {}
 
     @property
     def key(self) -> str:
@@ -150,23 +310,74 @@ class PluginTest:
         env["POETRY_VIRTUALENVS_IN_PROJECT"] = "true"
         # https://python-poetry.org/docs/configuration/#virtualenvsprefer-active-python-experimental
         env["POETRY_VIRTUALENVS_PREFER_ACTIVE_PYTHON"] = "true"
+        # uv 安装的解释器放在缓存卷中，之后的容器可以直接使用
+        # https://docs.astral.sh/uv/configuration/environment/#uv_python_install_dir
+        env.setdefault("UV_PYTHON_INSTALL_DIR", str(PYTHON_INSTALL_DIR))
         return env
 
     def _log_output(self, msg: str):
-        # print(msg)
+        emit_event(EVENT_OUTPUT, text=msg)
         self._lines_output.append(msg)
 
+    def phase_timeout(self, phase: str) -> int:
+        """测试阶段的超时时间"""
+        if phase in self.timeouts:
+            return self.timeouts[phase]
+        return PHASE_TIMEOUTS.get(phase, DEFAULT_PHASE_TIMEOUT)
+
+    async def run_phase(self, phase: str, cmd: str) -> tuple[bool, str, str]:
+        """以测试阶段的形式执行命令
+
+        阶段开始与结束时都会输出事件，主机据此展示进度并设置阶段超时。
+        同时记录阶段的墙钟时间、CPU 时间与命令的峰值内存，并行的阶段之间 CPU 时间可能互相计入。
+
+        Args:
+            phase (str): 阶段名称
+            cmd (str): 命令
+
+        Returns:
+            tuple[bool, str, str]: 命令执行返回值，标准输出，标准错误
+        """
+        timeout = self.phase_timeout(phase)
+        emit_event(EVENT_PHASE_STARTED, phase=phase, timeout=timeout)
+        wall, cpu = time.perf_counter(), children_cpu_time()
+        usage: dict[str, int] = {}
+        token = _command_usage.set(usage)
+        try:
+            code, stdout, stderr = await self.command(cmd, timeout)
+        finally:
+            _command_usage.reset(token)
+        # 同一阶段执行多次时累计耗时，内存取最大值
+        timing = self._timings.setdefault(phase, {"wall": 0, "cpu": 0})
+        timing["wall"] = round(timing["wall"] + time.perf_counter() - wall, 3)
+        timing["cpu"] = round(timing["cpu"] + children_cpu_time() - cpu, 3)
+        if "max_rss" in usage:
+            timing["max_rss"] = max(timing.get("max_rss", 0), usage["max_rss"])
+        emit_event(
+            EVENT_PHASE_FINISHED, phase=phase, success=code, **self._timings[phase]
+        )
+        return code, stdout, stderr
+
     async def run(self):
         """插件测试入口"""
-        # 创建插件测试项目
-        await self.create_poetry_project()
-        if self._create:
-            await asyncio.gather(
-                self.show_package_info(),
-                self.show_plugin_dependencies(),
-                self.get_python_version(),
-            )
+        if self.reuse_environment and await self.restore_environment():
+            # 测试环境已安装，只需重新加载插件
             await self.run_poetry_project()
+        else:
+            # 创建插件测试项目
+            await self.create_poetry_project()
+            if self._create:
+                if not await self.introspect_environment():
+                    # 无法直接获取测试环境信息时，通过 poetry 获取
+                    await asyncio.gather(
+                        self.show_package_info(),
+                        self.show_plugin_dependencies(),
+                        self.get_python_version(),
+                    )
+                self.save_lock()
+                if self.reuse_environment:
+                    await self.save_environment()
+                await self.run_poetry_project()
 
         # 补上获取到 Python 版本
         self._test_env.insert(0, f"python=={self._test_python_version}")
@@ -176,6 +387,14 @@ class PluginTest:
         if metadata_path.exists():
             with open(self._test_dir / "metadata.json", encoding="utf-8") as f:
                 metadata = json.load(f)
+            emit_event(EVENT_METADATA, metadata=metadata)
+        # 读取插件加载性能数据
+        profile = None
+        profile_path = self._test_dir / "profile.json"
+        if profile_path.exists():
+            with open(profile_path, encoding="utf-8") as f:
+                profile = json.load(f)
+            profile["import_times"] = self._import_times
 
         result = {
             "metadata": metadata,
@@ -185,14 +404,20 @@ class PluginTest:
             "version": self._version,
             "config": self.config,
             "test_env": " ".join(self._test_env),
+            "timings": self._timings,
+            "profile": profile,
         }
         # 输出测试结果
-        print(json.dumps(result, ensure_ascii=False))
+        emit_event(EVENT_RESULT, result=result)
         return result
 
     async def command(self, cmd: str, timeout: int = 300) -> tuple[bool, str, str]:
         """执行命令
 
+        命令在单独的进程组中运行。超时后先向整个进程组发送 SIGTERM，
+        等待一段时间仍未退出则发送 SIGKILL，避免 poetry、pip 或插件进程在超时后继续运行。
+        在测试阶段中执行时，同时记录命令的峰值内存。
+
         Args:
             cmd (str): 命令
             timeout (int, optional): 超时限制. Defaults to 300.
@@ -200,33 +425,166 @@ class PluginTest:
         Returns:
             tuple[bool, str, str]: 命令执行返回值，标准输出，标准错误
         """
-        proc = await create_subprocess_shell(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            cwd=self._test_dir,
-            env=self.env,
-        )
+        read_fd, write_fd = os.pipe()
         try:
-            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+            proc = await create_subprocess_exec(
+                sys.executable,
+                "-I",
+                "-c",
+                MAX_RSS_LAUNCHER,
+                str(write_fd),
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=self._test_dir,
+                env=self.env,
+                start_new_session=True,
+                pass_fds=(write_fd,),
+            )
+        except BaseException:
+            os.close(read_fd)
+            raise
+        finally:
+            os.close(write_fd)
+        communicate = asyncio.ensure_future(proc.communicate())
+        done, _ = await asyncio.wait({communicate}, timeout=timeout)
+        if done:
+            stdout, stderr = communicate.result()
             code = proc.returncode
-        except TimeoutError:
-            proc.terminate()
-            # 超时后仍需读取 stdout 与 stderr 的内容
-            stdout = "执行命令超时\n".encode()
-            stdout += await proc.stdout.read() if proc.stdout else b""
-            stderr = await proc.stderr.read() if proc.stderr else b""
+        else:
+            kill_process_group(proc.pid, signal.SIGTERM)
+            await asyncio.wait({communicate}, timeout=COMMAND_KILL_GRACE)
+            # 进程组中可能还有忽略了 SIGTERM 的进程，强制终止
+            kill_process_group(proc.pid, signal.SIGKILL)
+            try:
+                # 超时后仍需读取 stdout 与 stderr 的内容
+                stdout, stderr = await asyncio.wait_for(communicate, COMMAND_KILL_GRACE)
+            except TimeoutError:
+                stdout, stderr = b"", b""
+            stdout = "执行命令超时\n".encode() + stdout
             code = 1
 
+        # 启动进程被终止时没有写入
+        os.set_blocking(read_fd, False)
+        try:
+            max_rss = os.read(read_fd, 32)
+        except BlockingIOError:
+            max_rss = b""
+        finally:
+            os.close(read_fd)
+        if max_rss and (usage := _command_usage.get()) is not None:
+            usage["max_rss"] = max(usage.get("max_rss", 0), int(max_rss))
+
         return not code, stdout.decode(), stderr.decode()
 
+    def template_packages(self) -> list[str] | None:
+        """基础环境模板中安装的依赖
+
+        基础依赖固定为 PyPI 上的最新版本，新版本发布后使用新的模板。
+        额外的依赖约束中已指定的基础依赖以约束为准。
+
+        Returns:
+            list[str] | None: 依赖列表，无法获取基础依赖的最新版本时返回 None
+        """
+        constrained = {
+            canonicalize_name(match.group())
+            for constraint in self.constraints
+            if (match := re.match(r"[A-Za-z0-9._-]+", constraint))
+        }
+        packages = []
+        for name in TEMPLATE_PACKAGES:
+            if canonicalize_name(name) in constrained:
+                continue
+            version = get_latest_version(name)
+            if not version:
+                return None
+            packages.append(f"{name}=={version}")
+        return [*packages, *self.constraints]
+
+    async def find_python(self) -> str | None:
+        """获取测试使用的 Python 解释器路径
+
+        镜像中没有对应版本时由 uv 安装，安装失败时返回 None。
+        模板只用于加速，失败时不输出到插件测试结果中
+        """
+        cmd = f"uv python find {self.python_version}"
+        code, stdout, _ = await self.command(cmd)
+        if code:
+            return stdout.strip()
+
+        code, stdout, _ = await self.command(
+            f"uv python install {self.python_version} && {cmd}"
+        )
+        if not code or not stdout.strip():
+            return None
+        # 只保留 uv python find 输出的路径
+        return stdout.strip().splitlines()[-1]
+
+    async def prepare_template(self) -> Path | None:
+        """准备基础环境模板
+
+        模板按 Python 解释器与基础依赖的版本（含额外的依赖约束）区分，
+        不存在时构建一次，之后的测试直接复制使用。
+
+        Returns:
+            Path | None: 模板虚拟环境路径，无法使用模板时返回 None
+        """
+        interpreter = await self.find_python()
+        if not interpreter:
+            return None
+
+        packages = self.template_packages()
+        if packages is None:
+            return None
+        key = hashlib.sha256(json.dumps([interpreter, packages]).encode()).hexdigest()[
+            :16
+        ]
+        template = self._template_dir / key
+        if template.exists():
+            return template.absolute()
+
+        self._template_dir.mkdir(parents=True, exist_ok=True)
+        building = staging_path(template)
+        code, stdout, stderr = await self.run_phase(
+            PHASE_TEMPLATE,
+            f"uv venv --relocatable --python {interpreter} {building} && uv pip install --python {building / 'bin' / 'python'} {' '.join(shlex.quote(x) for x in packages)}",
+        )
+        if not code:
+            self._log_output("基础环境模板构建失败，跳过模板：")
+            self._std_output(stdout, stderr)
+            shutil.rmtree(building, ignore_errors=True)
+            return None
+
+        publish_staged(building, template)
+        return template.absolute()
+
     async def create_poetry_project(self):
         """创建 poetry 项目用来测试插件"""
         if not self._test_dir.exists():
             self._test_dir.mkdir()
 
-            code, stdout, stderr = await self.command(
-                f"""uv venv --python {self.python_version} && poetry init -n --python "~{self.python_version}" && poetry env info --ansi && poetry add {self.project_link}"""
+            # 优先复制基础环境模板，之后只需安装插件额外的依赖
+            # 支持写时复制的文件系统上不会真正复制文件
+            template = await self.prepare_template()
+            if template:
+                venv = f"cp -a --reflink=auto {template} .venv"
+            else:
+                venv = f"uv venv --python {self.python_version}"
+            # 安装后移除插件未依赖的模板预装包，避免掩盖插件未声明的依赖
+            sync = bool(template)
+
+            # 同一版本重新测试时无需重新解析依赖
+            if await self.install_from_lock(venv, sync):
+                self._create = True
+                return
+
+            # 额外的依赖约束与插件一同安装
+            packages = " ".join(
+                [self.project_link, *(shlex.quote(x) for x in self.constraints)]
+            )
+            code, stdout, stderr = await self.run_phase(
+                PHASE_CREATE,
+                f"""{venv} && poetry init -n --python "~{self.python_version}" && poetry env info --ansi && {self.prefetched_install}poetry add {packages}{" && poetry install --sync --no-root" if sync else ""}""",
             )
 
             self._create = code
@@ -245,11 +603,216 @@ class PluginTest:
             self._log_output(f"项目 {self.project_link} 已存在，跳过创建。")
             self._create = True
 
+    @property
+    def prefetched_install(self) -> str:
+        """从预先下载的分发文件安装插件的命令
+
+        插件已安装时 poetry 无需再次下载，没有对应文件时忽略
+        """
+        if not self.wheelhouse or not Path(self.wheelhouse).is_dir():
+            return ""
+        return f"(uv pip install --python .venv/bin/python --no-deps --no-index --find-links {shlex.quote(self.wheelhouse)} {shlex.quote(self.project_link)} || true) && "
+
+    def lock_path(self, version: str) -> Path:
+        """插件指定版本的锁文件目录
+
+        按插件、版本、Python 版本与额外的依赖约束区分
+        """
+        key = hashlib.sha256(
+            json.dumps(
+                [self.project_link, version, self.python_version, self.constraints]
+            ).encode()
+        ).hexdigest()[:16]
+        return self._lock_dir / key
+
+    async def install_from_lock(self, venv: str, sync: bool = False) -> bool:
+        """使用保存的锁文件安装插件
+
+        插件最新版本已有保存的锁文件时，直接按锁文件安装，不再解析依赖。
+        安装失败时清理测试项目，之后重新解析依赖。
+        使用单独的测试阶段，重新解析依赖时仍有完整的超时时间。
+
+        Args:
+            venv (str): 创建虚拟环境的命令
+            sync (bool): 是否移除锁文件之外已安装的包
+
+        Returns:
+            bool: 是否安装成功
+        """
+        version = get_latest_version(self.project_link)
+        if not version:
+            return False
+        lock = self.lock_path(version)
+        if not lock.exists():
+            return False
+
+        for name in LOCK_FILES:
+            shutil.copyfile(lock / name, self._test_dir / name)
+        code, stdout, stderr = await self.run_phase(
+            PHASE_LOCK,
+            f"{venv} && poetry env info --ansi && poetry install{' --sync' if sync else ''} --no-root",
+        )
+        if code:
+            self._log_output(
+                f"项目 {self.project_link} 使用版本 {version} 的锁文件创建成功。"
+            )
+            self._std_output(stdout)
+            return True
+
+        self._log_output(f"项目 {self.project_link} 使用锁文件创建失败，重新解析依赖：")
+        self._std_output(stdout, stderr)
+        for name in [*LOCK_FILES, ".venv"]:
+            path = self._test_dir / name
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                path.unlink(missing_ok=True)
+        return False
+
+    def save_lock(self) -> None:
+        """保存解析得到的锁文件，供之后测试同一版本时使用"""
+        if not self._version or not all(
+            (self._test_dir / name).exists() for name in LOCK_FILES
+        ):
+            return
+        lock = self.lock_path(self._version)
+        if lock.exists():
+            return
+
+        self._lock_dir.mkdir(parents=True, exist_ok=True)
+        saving = staging_path(lock)
+        saving.mkdir()
+        for name in LOCK_FILES:
+            shutil.copyfile(self._test_dir / name, saving / name)
+        publish_staged(saving, lock)
+
+    def environment_path(self) -> Path:
+        """插件的测试环境目录
+
+        按插件、Python 版本与额外的依赖约束区分，每个插件只保留最新保存的版本
+        """
+        key = hashlib.sha256(
+            json.dumps(
+                [self.project_link, self.python_version, self.constraints]
+            ).encode()
+        ).hexdigest()[:16]
+        return self._env_dir / key
+
+    async def restore_environment(self) -> bool:
+        """恢复保存的测试环境
+
+        仅当保存的测试环境对应插件的最新版本时使用，恢复后无需重新安装插件。
+        恢复失败时清理测试项目，之后重新创建。
+
+        Returns:
+            bool: 是否恢复成功
+        """
+        env = self.environment_path()
+        info_path = env / ENV_INFO_FILE
+        if not info_path.exists():
+            return False
+        with open(info_path, encoding="utf-8") as f:
+            info = json.load(f)
+        version = get_latest_version(self.project_link)
+        if not version or info["version"] != version:
+            return False
+
+        self._test_dir.mkdir(exist_ok=True)
+        code, stdout, stderr = await self.run_phase(
+            PHASE_RESTORE,
+            f"cp -a --reflink=auto {shlex.quote(str(env.absolute()))}/. .",
+        )
+        if not code:
+            self._log_output(f"项目 {self.project_link} 测试环境恢复失败，重新创建：")
+            self._std_output(stdout, stderr)
+            shutil.rmtree(self._test_dir, ignore_errors=True)
+            return False
+
+        self._create = True
+        self._version = info["version"]
+        self._test_python_version = info["python"]
+        self._deps = info["deps"]
+        self._test_env = info["test_env"]
+        self._log_output(
+            f"项目 {self.project_link} 使用版本 {version} 已安装的测试环境，跳过创建。"
+        )
+        return True
+
+    async def save_environment(self) -> None:
+        """保存安装好的测试环境，供仅修改插件配置重新测试时使用
+
+        需要在加载插件前保存，避免之后恢复时读取到上次加载插件的结果
+        """
+        if not self._version:
+            return
+        env = self.environment_path()
+
+        self._env_dir.mkdir(parents=True, exist_ok=True)
+        saving = staging_path(env)
+        code, stdout, stderr = await self.command(
+            f"cp -a --reflink=auto . {shlex.quote(str(saving))}"
+        )
+        if not code:
+            self._log_output("测试环境保存失败：")
+            self._std_output(stdout, stderr)
+            shutil.rmtree(saving, ignore_errors=True)
+            return
+        with open(saving / ENV_INFO_FILE, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": self._version,
+                    "python": self._test_python_version,
+                    "deps": self._deps,
+                    "test_env": self._test_env,
+                },
+                f,
+            )
+
+        # 替换之前保存的测试环境
+        shutil.rmtree(env, ignore_errors=True)
+        publish_staged(saving, env)
+
+    async def introspect_environment(self) -> bool:
+        """获取测试环境信息
+
+        在测试环境中运行一次脚本，同时获取 Python 版本、已安装的包与插件版本
+
+        Returns:
+            bool: 是否获取成功
+        """
+        script = await render_introspect()
+        with open(self._test_dir / "introspect.py", "w", encoding="utf-8") as f:
+            f.write(script)
+
+        code, stdout, stderr = await self.run_phase(
+            PHASE_INTROSPECT,
+            f".venv/bin/python introspect.py {shlex.quote(self.project_link)}",
+        )
+        try:
+            data = json.loads(stdout) if code else None
+        except json.JSONDecodeError:
+            data = None
+        if not data:
+            self._log_output("测试环境信息获取失败。")
+            self._std_output(stdout, stderr)
+            return False
+
+        packages: dict[str, str] = data["packages"]
+        self._version = data["version"]
+        self._test_python_version = data["python"]
+        self._deps = self._get_deps(packages)
+        self._test_env = self._get_test_env(packages)
+
+        self._log_output(f"插件 {self.project_link} 的版本为 {self._version}。")
+        self._log_output(f"插件 {self.project_link} 依赖的插件如下：")
+        self._log_output(f"    {', '.join(self._deps)}")
+        return True
+
     async def show_package_info(self) -> None:
         """获取插件的版本与插件信息"""
         if self._test_dir.exists():
-            code, stdout, stderr = await self.command(
-                f"poetry show {self.project_link}"
+            code, stdout, stderr = await self.run_phase(
+                PHASE_PACKAGE_INFO, f"poetry show {self.project_link}"
             )
             if code:
                 # 获取插件版本
@@ -281,9 +844,10 @@ class PluginTest:
             with open(self._test_dir / "runner.py", "w", encoding="utf-8") as f:
                 f.write(runner_script)
 
-            code, stdout, stderr = await self.command(
-                "poetry run python runner.py", timeout=600
+            code, stdout, stderr = await self.run_phase(
+                PHASE_LOAD, "poetry run python -X importtime runner.py"
             )
+            stderr, self._import_times = parse_import_times(stderr)
 
             self._run = code
 
@@ -297,7 +861,9 @@ class PluginTest:
     async def show_plugin_dependencies(self) -> None:
         """获取插件的依赖"""
         if self._test_dir.exists():
-            code, stdout, stderr = await self.command("poetry export --without-hashes")
+            code, stdout, stderr = await self.run_phase(
+                PHASE_DEPENDENCIES, "poetry export --without-hashes"
+            )
 
             if code:
                 self._log_output(f"插件 {self.project_link} 依赖的插件如下：")
@@ -312,7 +878,9 @@ class PluginTest:
     async def get_python_version(self):
         """获取 Python 版本"""
         if self._test_dir.exists():
-            code, stdout, stderr = await self.command("poetry run python --version")
+            code, stdout, stderr = await self.run_phase(
+                PHASE_PYTHON_VERSION, "poetry run python --version"
+            )
             if code:
                 version = stdout.strip()
                 if version.startswith("Python "):
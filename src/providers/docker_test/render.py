@@ -2,6 +2,8 @@ from pathlib import Path
 
 import jinja2
 
+from .constants import IMPORT_MARKER
+
 env = jinja2.Environment(
     loader=jinja2.FileSystemLoader(Path(__file__).parent / "templates"),
     enable_async=True,
@@ -18,9 +20,17 @@ async def render_runner(module_name: str, deps: list[str]) -> str:
     return await template.render_async(
         module_name=module_name,
         deps=deps,
+        import_marker=IMPORT_MARKER,
     )
 
 
+async def render_introspect() -> str:
+    """生成 introspect.py 文件内容"""
+    template = env.get_template("introspect.py.jinja")
+
+    return await template.render_async()
+
+
 async def render_fake():
     """生成 fake.py 文件内容"""
     template = env.get_template("fake.py.jinja")
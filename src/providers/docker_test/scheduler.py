@@ -0,0 +1,143 @@
+"""插件测试容器的资源调度
+
+根据主机的 CPU 与内存容量决定同时运行的测试容器数量
+"""
+
+import asyncio
+import os
+import sys
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from functools import cache
+from pathlib import Path
+
+from src.providers.logger import logger
+
+CGROUP_PATH = Path("/sys/fs/cgroup")
+""" cgroup 挂载路径 """
+
+PROC_MEMINFO_PATH = Path("/proc/meminfo")
+""" 内存信息路径 """
+
+
+def _read_text(path: Path) -> str | None:
+    """读取文件内容，文件不存在时返回 None"""
+    try:
+        return path.read_text().strip()
+    except OSError:
+        return None
+
+
+def get_cpu_capacity() -> float:
+    """获取主机可用的 CPU 数量
+
+    取 CPU 亲和性与 cgroup 配额中的较小值
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cpus = float(len(os.sched_getaffinity(0)))
+    else:  # pragma: no cover
+        cpus = float(os.cpu_count() or 1)
+
+    # cgroup v2: "max 100000" 或 "200000 100000"
+    if cpu_max := _read_text(CGROUP_PATH / "cpu.max"):
+        quota, _, period = cpu_max.partition(" ")
+        if quota != "max" and period:
+            cpus = min(cpus, int(quota) / int(period))
+    # cgroup v1: 配额为 -1 时表示不限制
+    elif (quota := _read_text(CGROUP_PATH / "cpu" / "cpu.cfs_quota_us")) and (
+        period := _read_text(CGROUP_PATH / "cpu" / "cpu.cfs_period_us")
+    ):
+        if int(quota) > 0:
+            cpus = min(cpus, int(quota) / int(period))
+
+    return cpus
+
+
+def get_memory_capacity() -> int:
+    """获取主机可用的内存大小，单位为字节
+
+    取 /proc/meminfo 中的可用内存与 cgroup 限制中的较小值
+    如果都无法获取，则视为不限制
+    """
+    memory: int | None = None
+
+    if meminfo := _read_text(PROC_MEMINFO_PATH):
+        for line in meminfo.splitlines():
+            if line.startswith("MemAvailable:"):
+                # MemAvailable:   12345678 kB
+                memory = int(line.split()[1]) * 1024
+                break
+
+    # cgroup v2: "max" 或字节数
+    limit = _read_text(CGROUP_PATH / "memory.max")
+    # cgroup v1: 不限制时为一个极大的数
+    if limit is None:
+        limit = _read_text(CGROUP_PATH / "memory" / "memory.limit_in_bytes")
+    if limit and limit.isdigit():
+        memory = int(limit) if memory is None else min(memory, int(limit))
+
+    if memory is None:  # pragma: no cover
+        logger.warning("无法获取主机内存容量，将不限制同时运行的测试数量")
+        return sys.maxsize
+    return memory
+
+
+class ResourceScheduler:
+    """测试容器资源调度器
+
+    只有在主机剩余容量足够时才允许新的测试开始
+    """
+
+    def __init__(self, cpus: float, memory: int) -> None:
+        self.cpus = cpus
+        """ 可用的 CPU 数量 """
+        self.memory = memory
+        """ 可用的内存大小 """
+
+        self._used_cpus = 0.0
+        self._used_memory = 0
+        self._running = 0
+        self._condition = asyncio.Condition()
+
+    def _can_admit(self, cpus: float, memory: int) -> bool:
+        """剩余容量是否足够"""
+        # 没有正在运行的测试时总是允许，避免配额超过主机容量时测试永远无法开始
+        if self._running == 0:
+            return True
+        return (
+            self._used_cpus + cpus <= self.cpus
+            and self._used_memory + memory <= self.memory
+        )
+
+    @asynccontextmanager
+    async def reserve(self, cpus: float, memory: int) -> AsyncGenerator[None]:
+        """预留资源，直到退出上下文时释放
+
+        Args:
+            cpus (float): 需要的 CPU 数量
+            memory (int): 需要的内存大小，单位为字节
+        """
+        async with self._condition:
+            if not self._can_admit(cpus, memory):
+                logger.debug("主机剩余资源不足，等待其他测试结束")
+            await self._condition.wait_for(lambda: self._can_admit(cpus, memory))
+            self._used_cpus += cpus
+            self._used_memory += memory
+            self._running += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._used_cpus -= cpus
+                self._used_memory -= memory
+                self._running -= 1
+                self._condition.notify_all()
+
+
+@cache
+def get_scheduler() -> ResourceScheduler:
+    """获取共享的资源调度器"""
+    cpus = get_cpu_capacity()
+    memory = get_memory_capacity()
+    logger.info(f"插件测试可用资源：CPU {cpus:g} 核，内存 {memory / 1024**3:.1f} GiB")
+    return ResourceScheduler(cpus, memory)
@@ -0,0 +1,168 @@
+"""离线验证数据
+
+验证需要从网络获取 PyPI 项目信息、适配器列表、作者名称与项目主页状态。
+这些数据可以预先同步到 SQLite 数据库中，开启离线验证后全部从数据库读取，
+验证不再访问网络，结果只取决于数据库中的数据。
+"""
+
+import re
+import sqlite3
+import threading
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from src.providers.constants import VALIDATION_FACTS_PATH, VALIDATION_OFFLINE
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pypi (
+    project_link TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    version TEXT,
+    upload_time TEXT
+);
+CREATE TABLE IF NOT EXISTS adapters (module_name TEXT PRIMARY KEY);
+CREATE TABLE IF NOT EXISTS authors (author_id INTEGER PRIMARY KEY, name TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS homepages (
+    url TEXT PRIMARY KEY,
+    status_code INTEGER NOT NULL,
+    msg TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+_canonicalize_regex = re.compile(r"[-_.]+")
+
+
+def canonicalize_name(name: str) -> str:
+    """规范化 PyPI 项目名
+
+    PyPI 会将不同写法的项目名指向同一个项目，查询时需要使用同样的规则
+    """
+    return _canonicalize_regex.sub("-", name).lower()
+
+
+class FactsStore:
+    """离线验证数据库"""
+
+    def __init__(self, path: Path, readonly: bool = True) -> None:
+        if readonly:
+            # 只读模式下数据库不存在时直接报错，不会创建空数据库
+            self._conn = sqlite3.connect(
+                f"{path.resolve().as_uri()}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+            )
+        else:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.executescript(SCHEMA)
+        # 验证前可能在多个线程中读取
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _fetchone(self, sql: str, *params: Any) -> tuple | None:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()
+
+    def has_pypi(self, project_link: str) -> bool:
+        """PyPI 项目是否存在"""
+        return (
+            self._fetchone(
+                "SELECT 1 FROM pypi WHERE project_link = ?",
+                canonicalize_name(project_link),
+            )
+            is not None
+        )
+
+    def get_pypi_data(self, project_link: str) -> dict[str, Any]:
+        """获取 PyPI 数据
+
+        按 PyPI JSON API 的格式返回验证需要的字段
+        """
+        row = self._fetchone(
+            "SELECT name, version, upload_time FROM pypi WHERE project_link = ?",
+            canonicalize_name(project_link),
+        )
+        if row is None:
+            raise ValueError(f"离线数据中不存在 PyPI 项目 {project_link}")
+        name, version, upload_time = row
+        return {
+            "info": {"name": name, "version": version},
+            "urls": [{"upload_time_iso_8601": upload_time}],
+        }
+
+    def get_adapters(self) -> frozenset[str]:
+        """获取适配器列表"""
+        with self._lock:
+            rows = self._conn.execute("SELECT module_name FROM adapters").fetchall()
+        return frozenset(row[0] for row in rows)
+
+    def get_author_name(self, author_id: int) -> str:
+        """获取作者名字"""
+        row = self._fetchone("SELECT name FROM authors WHERE author_id = ?", author_id)
+        if row is None:
+            raise ValueError(f"离线数据中不存在作者 {author_id}")
+        return row[0]
+
+    def get_homepage(self, url: str) -> tuple[int, str]:
+        """获取项目主页的状态码与报错信息"""
+        row = self._fetchone(
+            "SELECT status_code, msg FROM homepages WHERE url = ?", url
+        )
+        if row is None:
+            return -1, "离线数据中不存在该项目主页"
+        return row[0], row[1]
+
+    def get_meta(self, key: str) -> str | None:
+        """获取同步信息"""
+        row = self._fetchone("SELECT value FROM meta WHERE key = ?", key)
+        return row[0] if row else None
+
+    def set_pypi(
+        self, project_link: str, name: str, version: str | None, upload_time: str | None
+    ) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pypi VALUES (?, ?, ?, ?)",
+                (canonicalize_name(project_link), name, version, upload_time),
+            )
+
+    def set_adapters(self, module_names: list[str]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM adapters")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO adapters VALUES (?)",
+                [(module_name,) for module_name in module_names],
+            )
+
+    def set_author_name(self, author_id: int, name: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO authors VALUES (?, ?)", (author_id, name)
+            )
+
+    def set_homepage(self, url: str, status_code: int, msg: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO homepages VALUES (?, ?, ?)",
+                (url, status_code, msg),
+            )
+
+    def set_meta(self, key: str, value: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value)
+            )
+
+
+@cache
+def get_facts() -> FactsStore | None:
+    """获取离线验证数据库
+
+    未开启离线验证时返回 None，需要从网络获取数据
+    """
+    if not VALIDATION_OFFLINE:
+        return None
+    return FactsStore(Path(VALIDATION_FACTS_PATH))
@@ -2,13 +2,26 @@
 from datetime import datetime
 from typing import Any, Literal, Self, TypeAlias
 
-from pydantic import BaseModel, Field, field_serializer, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    SerializerFunctionWrapHandler,
+    field_serializer,
+    field_validator,
+    model_serializer,
+)
 from pydantic_extra_types.color import Color
 
-from src.providers.constants import BOT_KEY_TEMPLATE, PYPI_KEY_TEMPLATE, TIME_ZONE
-from src.providers.docker_test import Metadata
+from src.providers.constants import (
+    BOT_KEY_TEMPLATE,
+    PLUGIN_TEST_PYTHON_VERSION,
+    PYPI_KEY_TEMPLATE,
+    TIME_ZONE,
+)
+from src.providers.docker_test import Metadata, PhaseTiming, PluginProfile
 from src.providers.utils import get_author_name, get_pypi_upload_time, get_pypi_version
-from src.providers.validation import validate_info
+from src.providers.validation import ValidationDict, validate_info
 from src.providers.validation.models import (
     AdapterPublishInfo,
     BotPublishInfo,
@@ -20,7 +33,10 @@ from src.providers.validation.models import (
 
 
 class Tag(BaseModel):
-    """标签"""
+    """标签
+
+    作为其他模型的字段，不能延迟构建，否则单独序列化时会报错
+    """
 
     label: str
     color: Color
@@ -34,6 +50,9 @@ class Tag(BaseModel):
 class StoreAdapter(BaseModel):
     """NoneBot 仓库中的适配器数据"""
 
+    # 首次使用时才构建模型，减少导入耗时
+    model_config = ConfigDict(defer_build=True)
+
     module_name: str
     project_link: str
     name: str
@@ -62,17 +81,19 @@ class StoreAdapter(BaseModel):
             is_official=publish_info.is_official,
         )
 
-    def to_registry(self) -> "RegistryAdapter":
+    def registry_data(self) -> dict[str, Any]:
+        """获取 author 信息，生成需要重新验证的数据"""
+        return {**self.model_dump(), "author": get_author_name(self.author_id)}
+
+    def to_registry(self, result: ValidationDict | None = None) -> "RegistryAdapter":
         """将仓库数据转换为注册表数据
 
         将获取 author 信息，重新验证数据
+
+        批量转换时传入 validate_many 对 registry_data 的验证结果
         """
-        author = get_author_name(self.author_id)
-        result = validate_info(
-            PublishType.ADAPTER,
-            {**self.model_dump(), "author": author},
-            [],
-        )
+        if result is None:
+            result = validate_info(PublishType.ADAPTER, self.registry_data(), [])
         if result.info is None or not isinstance(result.info, AdapterPublishInfo):
             raise ValueError(f"数据验证失败: {result.errors}")
         return RegistryAdapter.from_publish_info(result.info)
@@ -81,6 +102,8 @@ class StoreAdapter(BaseModel):
 class StoreBot(BaseModel):
     """NoneBot 仓库中的机器人数据"""
 
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     desc: str
     author_id: int
@@ -103,17 +126,19 @@ class StoreBot(BaseModel):
             is_official=publish_info.is_official,
         )
 
-    def to_registry(self) -> "RegistryBot":
+    def registry_data(self) -> dict[str, Any]:
+        """获取 author 信息，生成需要重新验证的数据"""
+        return {**self.model_dump(), "author": get_author_name(self.author_id)}
+
+    def to_registry(self, result: ValidationDict | None = None) -> "RegistryBot":
         """将仓库数据转换为注册表数据
 
         将获取 author 信息，重新验证数据
+
+        批量转换时传入 validate_many 对 registry_data 的验证结果
         """
-        author = get_author_name(self.author_id)
-        result = validate_info(
-            PublishType.BOT,
-            {**self.model_dump(), "author": author},
-            [],
-        )
+        if result is None:
+            result = validate_info(PublishType.BOT, self.registry_data(), [])
         if result.info is None or not isinstance(result.info, BotPublishInfo):
             raise ValueError(f"数据验证失败: {result.errors}")
         return RegistryBot.from_publish_info(result.info)
@@ -122,6 +147,8 @@ class StoreBot(BaseModel):
 class StoreDriver(BaseModel):
     """NoneBot 仓库中的驱动数据"""
 
+    model_config = ConfigDict(defer_build=True)
+
     module_name: str
     project_link: str
     name: str
@@ -150,17 +177,19 @@ class StoreDriver(BaseModel):
             is_official=publish_info.is_official,
         )
 
-    def to_registry(self) -> "RegistryDriver":
+    def registry_data(self) -> dict[str, Any]:
+        """获取 author 信息，生成需要重新验证的数据"""
+        return {**self.model_dump(), "author": get_author_name(self.author_id)}
+
+    def to_registry(self, result: ValidationDict | None = None) -> "RegistryDriver":
         """将仓库数据转换为注册表数据
 
         将获取 author 信息，重新验证数据
+
+        批量转换时传入 validate_many 对 registry_data 的验证结果
         """
-        author = get_author_name(self.author_id)
-        result = validate_info(
-            PublishType.DRIVER,
-            {**self.model_dump(), "author": author},
-            [],
-        )
+        if result is None:
+            result = validate_info(PublishType.DRIVER, self.registry_data(), [])
         if result.info is None or not isinstance(result.info, DriverPublishInfo):
             raise ValueError(f"数据验证失败: {result.errors}")
         return RegistryDriver.from_publish_info(result.info)
@@ -169,6 +198,8 @@ class StoreDriver(BaseModel):
 class StorePlugin(BaseModel):
     """NoneBot 仓库中的插件数据"""
 
+    model_config = ConfigDict(defer_build=True)
+
     module_name: str
     project_link: str
     author_id: int
@@ -425,13 +456,33 @@ class StoreTestResult(BaseModel):
     """
     results: dict[Literal["validation", "load", "metadata"], bool]
     outputs: dict[Literal["validation", "load", "metadata"], Any]
+    timings: dict[str, PhaseTiming] | None = None
+    """主要测试环境中各测试阶段耗时
+
+    键为测试阶段，值为该阶段的墙钟时间与 CPU 时间
+    """
+
+    profile: PluginProfile | None = None
+    """主要测试环境中插件加载性能数据
+
+    包括加载耗时、峰值内存占用与导入耗时最长的模块
+    """
+
+    @model_serializer(mode="wrap")
+    def serialize(self, handler: SerializerFunctionWrapHandler) -> dict[str, Any]:
+        data = handler(self)
+        # 没有耗时与性能数据时不输出对应字段，减少文件大小
+        for key in ["timings", "profile"]:
+            if data.get(key) is None:
+                data.pop(key, None)
+        return data
 
     @classmethod
     def from_info(cls, info: PluginPublishInfo) -> Self:
         return cls(
             config=info.test_config,
             version=info.version,
-            test_env={"python==3.12": True},
+            test_env={f"python=={PLUGIN_TEST_PYTHON_VERSION}": True},
             results={"validation": True, "load": True, "metadata": True},
             outputs={
                 "validation": None,
@@ -464,6 +515,8 @@ class StoreTestResult(BaseModel):
 
 
 class RegistryUpdatePayload(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     type: PublishType
     registry: RegistryModels
     result: StoreTestResult | None = None
@@ -1,11 +1,14 @@
 import asyncio
 import os
+from pathlib import Path
 
 import click
 
+from src.providers.constants import PLUGIN_TEST_BACKEND, VALIDATION_FACTS_PATH
 from src.providers.logger import logger
 from src.providers.models import RegistryUpdatePayload
 
+from .constants import HOMEPAGES_REPORT_PATH
 from .store import StoreTest
 
 
@@ -35,11 +38,19 @@ def registry_update():
 @click.option("-o", "--offset", default=0, show_default=True, help="测试插件偏移量")
 @click.option("-f", "--force", default=False, is_flag=True, help="强制重新测试")
 @click.option("-k", "--key", default=None, show_default=True, help="测试插件标识符")
-def plugin_test(limit: int, offset: int, force: bool, key: str | None):
+@click.option(
+    "-b",
+    "--backend",
+    type=click.Choice(["docker", "local"]),
+    default=PLUGIN_TEST_BACKEND,
+    show_default=True,
+    help="插件测试后端",
+)
+def plugin_test(limit: int, offset: int, force: bool, key: str | None, backend: str):
     """插件测试"""
     from .store import StoreTest
 
-    test = StoreTest()
+    test = StoreTest(backend)
 
     if key:
         asyncio.run(test.run_single_plugin(key, force))
@@ -47,5 +58,43 @@ def plugin_test(limit: int, offset: int, force: bool, key: str | None):
         asyncio.run(test.run(limit, offset, force))
 
 
+@cli.command()
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=HOMEPAGES_REPORT_PATH,
+    show_default=True,
+    help="检查报告保存路径",
+)
+def check_homepages(output: Path):
+    """检查商店中所有项目主页是否可以访问"""
+    from .homepages import run_check_homepages
+
+    asyncio.run(run_check_homepages(output))
+
+
+@cli.command()
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=VALIDATION_FACTS_PATH,
+    show_default=True,
+    help="离线验证数据库保存路径",
+)
+def sync_facts(output: Path):
+    """同步离线验证数据"""
+    from src.providers.facts import get_facts
+
+    from .facts import sync_facts
+
+    if get_facts() is not None:
+        logger.error("同步离线验证数据需要访问网络，请先关闭离线验证")
+        return
+
+    asyncio.run(sync_facts(output))
+
+
 if __name__ == "__main__":
     cli()
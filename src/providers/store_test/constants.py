@@ -23,3 +23,6 @@ PLUGINS_PATH = TEST_DIR / "plugins.json"
 
 PLUGIN_CONFIG_PATH = TEST_DIR / "plugin_configs.json"
 """ 生成的插件配置保存路径 """
+
+HOMEPAGES_REPORT_PATH = TEST_DIR / "homepages.json"
+""" 项目主页检查报告保存路径 """
@@ -0,0 +1,144 @@
+"""同步离线验证数据
+
+从商店与 PyPI 获取验证所需的数据，保存到离线验证数据库中
+"""
+
+import asyncio
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from src.providers.constants import (
+    BOT_KEY_TEMPLATE,
+    PYPI_KEY_TEMPLATE,
+    STORE_ADAPTERS_URL,
+    STORE_BOTS_URL,
+    STORE_DRIVERS_URL,
+    STORE_PLUGINS_URL,
+    TIME_ZONE,
+)
+from src.providers.facts import FactsStore
+from src.providers.logger import logger
+from src.providers.utils import get_url, load_json_from_web
+
+from .homepages import check_homepages, collect_homepages, load_registry_data
+
+
+def data_key(item: dict[str, Any]) -> str:
+    """商店数据的键"""
+    if "project_link" in item:
+        return PYPI_KEY_TEMPLATE.format(
+            project_link=item["project_link"], module_name=item["module_name"]
+        )
+    return BOT_KEY_TEMPLATE.format(name=item["name"], homepage=item["homepage"])
+
+
+def collect_authors(
+    store_data: dict[str, list[dict[str, Any]]],
+    registry_data: dict[str, list[dict[str, Any]]],
+) -> dict[int, str]:
+    """获取作者 ID 与名字
+
+    仓库数据中只有作者 ID，商店数据中只有作者名字，通过同一数据的键对应起来，
+    不需要访问 GitHub API
+    """
+    authors: dict[int, str] = {}
+    for name, items in store_data.items():
+        names = {data_key(item): item["author"] for item in registry_data[name]}
+        for item in items:
+            if author := names.get(data_key(item)):
+                authors[item["author_id"]] = author
+    return authors
+
+
+def collect_project_links(registry_data: dict[str, list[dict[str, Any]]]) -> list[str]:
+    """获取商店中所有的 PyPI 项目名
+
+    内置驱动器的上传时间与版本号以 nonebot2 为准
+    """
+    project_links = {"nonebot2"}
+    for name in ["adapters", "drivers", "plugins"]:
+        for item in registry_data[name]:
+            project_link = item["project_link"]
+            if project_link and not project_link.startswith("nonebot2["):
+                project_links.add(project_link)
+    return sorted(project_links)
+
+
+async def fetch_pypi(project_link: str) -> dict[str, Any] | None:
+    """获取 PyPI 数据，项目不存在或获取失败时返回 None"""
+    try:
+        r = await asyncio.to_thread(
+            get_url, f"https://pypi.org/pypi/{project_link}/json"
+        )
+    except Exception as e:
+        logger.warning(f"获取 PyPI 项目 {project_link} 失败：{e}")
+        return None
+    if r.status_code != 200:
+        return None
+    return r.json()
+
+
+async def sync_facts(path: Path) -> dict[str, int]:
+    """同步离线验证数据
+
+    先写入临时文件再替换，同步过程中不影响正在使用的数据库
+
+    Returns:
+        dict[str, int]: 各类数据的数量
+    """
+    store_data = {
+        "adapters": load_json_from_web(STORE_ADAPTERS_URL),
+        "bots": load_json_from_web(STORE_BOTS_URL),
+        "drivers": load_json_from_web(STORE_DRIVERS_URL),
+        "plugins": load_json_from_web(STORE_PLUGINS_URL),
+    }
+    registry_data = load_registry_data()
+
+    project_links = collect_project_links(registry_data)
+    homepages = list(collect_homepages(registry_data))
+    logger.info(
+        f"共有 {len(project_links)} 个 PyPI 项目与 {len(homepages)} 个项目主页需要同步"
+    )
+    pypi_data, homepage_results = await asyncio.gather(
+        asyncio.gather(*(fetch_pypi(project_link) for project_link in project_links)),
+        check_homepages(homepages),
+    )
+    authors = collect_authors(store_data, registry_data)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    syncing = path.with_name(f"{path.name}.tmp")
+    syncing.unlink(missing_ok=True)
+    facts = FactsStore(syncing, readonly=False)
+    try:
+        for project_link, data in zip(project_links, pypi_data):
+            # 不存在的项目不保存，离线验证时视为不存在
+            if data is None:
+                continue
+            urls = data["urls"]
+            facts.set_pypi(
+                project_link,
+                data["info"]["name"],
+                data["info"]["version"],
+                urls[0]["upload_time_iso_8601"] if urls else None,
+            )
+        facts.set_adapters(
+            [adapter["module_name"] for adapter in store_data["adapters"]]
+        )
+        for author_id, name in authors.items():
+            facts.set_author_name(author_id, name)
+        for homepage, (status_code, msg) in homepage_results.items():
+            facts.set_homepage(homepage, status_code, msg)
+        facts.set_meta("synced_at", datetime.now(TIME_ZONE).isoformat())
+    finally:
+        facts.close()
+    syncing.replace(path)
+
+    counts = {
+        "pypi": sum(data is not None for data in pypi_data),
+        "adapters": len(store_data["adapters"]),
+        "authors": len(authors),
+        "homepages": len(homepage_results),
+    }
+    logger.info(f"离线验证数据已同步到 {path}：{counts}")
+    return counts
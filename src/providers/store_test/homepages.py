@@ -0,0 +1,174 @@
+"""检查商店中所有项目主页是否可以访问
+
+不同网站之间同时检查，同一网站限制同时请求的数量并在两次请求之间等待，
+避免对同一网站发送过多请求。缓存中未过期的结果直接使用，不发送请求。
+"""
+
+import asyncio
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, TypedDict
+from urllib.parse import urlsplit
+
+from src.providers.constants import (
+    BOT_KEY_TEMPLATE,
+    HOMEPAGE_CHECK_CONCURRENCY,
+    HOMEPAGE_HOST_CONCURRENCY,
+    HOMEPAGE_HOST_DELAY,
+    PYPI_KEY_TEMPLATE,
+    REGISTRY_ADAPTERS_URL,
+    REGISTRY_BOTS_URL,
+    REGISTRY_DRIVERS_URL,
+    REGISTRY_PLUGINS_URL,
+    TIME_ZONE,
+)
+from src.providers.logger import logger
+from src.providers.utils import add_step_summary, dump_json, load_json_from_web
+from src.providers.validation.homepage import (
+    check_homepage,
+    get_cached_status,
+    save_homepage_cache,
+)
+
+
+class HomepageResult(TypedDict):
+    """无法访问的项目主页"""
+
+    status_code: int
+    """ 状态码，请求报错时为 -1 """
+    msg: str
+    """ 报错信息 """
+    keys: list[str]
+    """ 使用该主页的商店数据 """
+
+
+class HomepageReport(TypedDict):
+    """项目主页检查报告"""
+
+    time: str
+    """ 检查时间 """
+    total: int
+    """ 检查的主页数量 """
+    failed: dict[str, HomepageResult]
+    """ 无法访问的主页 """
+
+
+def load_registry_data() -> dict[str, list[dict[str, Any]]]:
+    """获取商店中所有的适配器、机器人、驱动器与插件数据"""
+    return {
+        "adapters": load_json_from_web(REGISTRY_ADAPTERS_URL),
+        "bots": load_json_from_web(REGISTRY_BOTS_URL),
+        "drivers": load_json_from_web(REGISTRY_DRIVERS_URL),
+        "plugins": load_json_from_web(REGISTRY_PLUGINS_URL),
+    }
+
+
+def collect_homepages(
+    registry_data: dict[str, list[dict[str, Any]]],
+) -> dict[str, list[str]]:
+    """收集商店中所有的项目主页
+
+    Returns:
+        dict[str, list[str]]: 项目主页与使用该主页的商店数据
+    """
+    homepages: dict[str, list[str]] = defaultdict(list)
+    for name in ["adapters", "drivers", "plugins"]:
+        for item in registry_data[name]:
+            homepages[item["homepage"]].append(
+                PYPI_KEY_TEMPLATE.format(
+                    project_link=item["project_link"], module_name=item["module_name"]
+                )
+            )
+    for item in registry_data["bots"]:
+        homepages[item["homepage"]].append(
+            BOT_KEY_TEMPLATE.format(name=item["name"], homepage=item["homepage"])
+        )
+    # 内置驱动器的主页为文档路径，不是网址
+    return {
+        homepage: keys
+        for homepage, keys in homepages.items()
+        if urlsplit(homepage).scheme in ("http", "https")
+    }
+
+
+async def check_homepages(
+    homepages: list[str],
+    concurrency: int = HOMEPAGE_CHECK_CONCURRENCY,
+    host_concurrency: int = HOMEPAGE_HOST_CONCURRENCY,
+    delay: float = HOMEPAGE_HOST_DELAY,
+) -> dict[str, tuple[int, str]]:
+    """同时检查多个项目主页
+
+    Returns:
+        dict[str, tuple[int, str]]: 项目主页与其状态码和报错信息
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    host_semaphores: dict[str, asyncio.Semaphore] = defaultdict(
+        lambda: asyncio.Semaphore(host_concurrency)
+    )
+
+    async def worker(url: str) -> tuple[int, str]:
+        if cached := get_cached_status(url):
+            return cached
+        async with host_semaphores[urlsplit(url).netloc]:
+            async with semaphore:
+                status = await asyncio.to_thread(check_homepage, url, save=False)
+            # 等待期间仍占用该网站的名额，避免连续请求同一网站
+            await asyncio.sleep(delay)
+        return status
+
+    results = await asyncio.gather(*(worker(url) for url in homepages))
+    save_homepage_cache()
+    return dict(zip(homepages, results))
+
+
+def generate_homepages_summary(report: HomepageReport) -> str:
+    """生成 GitHub 摘要"""
+    failed = report["failed"]
+    summary = f"""# 🏠 项目主页检查结果
+
+> 📅 {report["time"]}
+> ♻️ 共检查 {report["total"]} 个项目主页
+> ✅ 可以访问：{report["total"] - len(failed)} 个
+> ❌ 无法访问：{len(failed)} 个
+"""
+    rows = [
+        f"| {homepage} | {result['status_code']} | {', '.join(result['keys'])} |"
+        for homepage, result in failed.items()
+    ]
+    if rows:
+        summary += f"""
+## 无法访问的项目主页
+
+| 项目主页 | 状态码 | 商店数据 |
+| --- | --- | --- |
+{"\n".join(rows)}
+"""
+    return summary
+
+
+async def run_check_homepages(output: Path) -> HomepageReport:
+    """检查商店中所有项目主页，保存检查报告并添加作业摘要"""
+    homepages = collect_homepages(load_registry_data())
+    logger.info(f"共有 {len(homepages)} 个项目主页需要检查")
+
+    results = await check_homepages(list(homepages))
+    report: HomepageReport = {
+        "time": datetime.now(TIME_ZONE).strftime("%Y-%m-%d %H:%M:%S %Z"),
+        "total": len(results),
+        "failed": {
+            homepage: {
+                "status_code": status_code,
+                "msg": msg,
+                "keys": homepages[homepage],
+            }
+            for homepage, (status_code, msg) in results.items()
+            if status_code != 200
+        },
+    }
+    logger.info(f"检查完成，{len(report['failed'])} 个项目主页无法访问")
+
+    dump_json(output, report)
+    add_step_summary(generate_homepages_summary(report))
+    return report
@@ -0,0 +1,92 @@
+"""预先下载即将测试的插件分发文件
+
+下载与插件测试同时进行，测试时直接从本地目录安装插件
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import httpx
+
+from src.providers.constants import PLUGIN_PREFETCH_CONCURRENCY
+from src.providers.logger import logger
+
+
+def select_distribution(urls: list[dict[str, Any]]) -> dict[str, Any] | None:
+    """选择需要下载的分发文件
+
+    优先选择通用的 wheel，其次为源码包
+    """
+    for packagetype, suffix in [
+        ("bdist_wheel", "-py3-none-any.whl"),
+        ("sdist", ""),
+    ]:
+        for url in urls:
+            if url["packagetype"] == packagetype and url["filename"].endswith(suffix):
+                return url
+
+
+async def prefetch_distribution(
+    client: httpx.AsyncClient, project_link: str, wheelhouse: Path
+) -> Path | None:
+    """下载插件最新版本的分发文件
+
+    Returns:
+        Path | None: 分发文件路径，没有可下载的文件时返回 None
+    """
+    r = await client.get(f"https://pypi.org/pypi/{project_link}/json")
+    r.raise_for_status()
+    distribution = select_distribution(r.json()["urls"])
+    if not distribution:
+        return None
+
+    path = wheelhouse / distribution["filename"]
+    if path.exists():
+        return path
+
+    # 先下载到临时文件再重命名，避免测试读取到未下载完成的文件
+    downloading = wheelhouse / f".{distribution['filename']}.{uuid4().hex}.part"
+    try:
+        async with client.stream("GET", distribution["url"]) as r:
+            r.raise_for_status()
+            with open(downloading, "wb") as f:
+                async for chunk in r.aiter_bytes():
+                    f.write(chunk)
+        downloading.replace(path)
+    finally:
+        downloading.unlink(missing_ok=True)
+    return path
+
+
+async def prefetch_distributions(
+    project_links: list[str],
+    wheelhouse: Path,
+    concurrency: int = PLUGIN_PREFETCH_CONCURRENCY,
+) -> dict[str, Path | None]:
+    """同时下载多个插件的分发文件
+
+    下载失败不影响插件测试，测试时会正常从 PyPI 下载
+
+    Returns:
+        dict[str, Path | None]: 下载成功的插件及其分发文件路径
+    """
+    wheelhouse.mkdir(parents=True, exist_ok=True)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def worker(project_link: str):
+        async with semaphore:
+            try:
+                return await prefetch_distribution(client, project_link, wheelhouse)
+            except Exception as e:
+                logger.warning(f"预先下载插件 {project_link} 失败：{e}")
+
+    async with httpx.AsyncClient(follow_redirects=True) as client:
+        paths = await asyncio.gather(*(worker(x) for x in project_links))
+
+    return {
+        project_link: path
+        for project_link, path in zip(project_links, paths)
+        if path is not None
+    }
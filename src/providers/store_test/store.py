@@ -1,7 +1,12 @@
+import asyncio
 from datetime import datetime
+from pathlib import Path
+from typing import Any
 
 from src.providers.constants import (
     BOT_KEY_TEMPLATE,
+    PLUGIN_TEST_BACKEND,
+    PLUGIN_TEST_WHEELHOUSE,
     PYPI_KEY_TEMPLATE,
     REGISTRY_ADAPTERS_URL,
     REGISTRY_BOTS_URL,
@@ -34,6 +39,7 @@ from src.providers.utils import (
     get_pypi_version,
     load_json_from_web,
 )
+from src.providers.validation import PublishType, ValidationDict, validate_many
 
 from .constants import (
     ADAPTERS_PATH,
@@ -43,13 +49,22 @@ from .constants import (
     PLUGINS_PATH,
     RESULTS_PATH,
 )
-from .validation import validate_plugin
+from .prefetch import prefetch_distributions
+from .utils import format_timings
+from .validation import (
+    PluginTestOutcome,
+    collect_plugin_result,
+    run_plugin_test,
+    validate_plugin,
+)
 
 
 class StoreTest:
     """商店测试"""
 
-    def __init__(self) -> None:
+    def __init__(self, backend: str = PLUGIN_TEST_BACKEND) -> None:
+        # 插件测试后端
+        self._backend = backend
         # 商店数据
         self._store_adapters: dict[str, StoreAdapter] = {
             PYPI_KEY_TEMPLATE.format(
@@ -170,9 +185,27 @@ class StoreTest:
             store_plugin=plugin,
             config=config,
             previous_plugin=self._previous_plugins.get(key),
+            backend=self._backend,
+            previous_result=self._previous_results.get(key),
         )
         return new_result, new_plugin
 
+    async def run_test(self, key: str) -> PluginTestOutcome:
+        """测试插件，插件信息稍后与同一轮测试的插件一起验证
+
+        Args:
+            key (str): 插件标识符
+        """
+        plugin = self._store_plugins[key]
+        config = self.read_plugin_config(key)
+        return await run_plugin_test(
+            store_plugin=plugin,
+            config=config,
+            previous_plugin=self._previous_plugins.get(key),
+            backend=self._backend,
+            previous_result=self._previous_results.get(key),
+        )
+
     async def test_plugins(self, limit: int, offset: int, force: bool):
         """批量测试插件
 
@@ -183,30 +216,62 @@ class StoreTest:
         """
         new_results: dict[str, StoreTestResult] = {}
         new_plugins: dict[str, RegistryPlugin] = {}
-        i = 1
-        test_plugins = list(self._store_plugins.keys())[offset:]
-
-        for key in test_plugins:
-            if i > limit:
-                logger.info(f"已达到测试上限 {limit}，测试停止")
-                break
-
-            # 是否需要跳过测试
-            if self.should_skip(key, force):
-                continue
-
-            async def worker():
-                new_result, new_plugin = await self.test_plugin(key)
-                new_results[key] = new_result
-                new_plugins[key] = new_plugin
+        test_plugins = iter(list(self._store_plugins.keys())[offset:])
 
+        async def worker(i: int, key: str):
             try:
                 logger.info(f"{i}/{limit} 正在测试插件 {key} ...")
-                await worker()  # TODO: 修改为并行
-                i += 1
+                return await self.run_test(key)
             except Exception as err:
                 logger.error(f"{err}")
-                continue
+
+        # 每轮同时提交剩余名额数量的插件，由资源调度器决定同时运行的测试容器数量
+        # 测试失败的插件不占用名额，下一轮继续补充
+        while len(new_results) < limit:
+            keys: list[str] = []
+            for key in test_plugins:
+                # 是否需要跳过测试
+                if self.should_skip(key, force):
+                    continue
+                keys.append(key)
+                if len(keys) >= limit - len(new_results):
+                    break
+
+            if not keys:
+                break
+
+            # 插件分发文件的下载与测试同时进行，排队等待资源的测试可以直接使用
+            prefetch = asyncio.create_task(
+                prefetch_distributions(
+                    [self._store_plugins[key].project_link for key in keys],
+                    Path(PLUGIN_TEST_WHEELHOUSE),
+                )
+            )
+            outcomes = await asyncio.gather(
+                *(worker(i, key) for i, key in enumerate(keys, len(new_results) + 1))
+            )
+            await prefetch
+
+            # 同一轮测试完成的插件一起验证，共享商店数据索引与网络数据的获取
+            tested = {
+                key: outcome
+                for key, outcome in zip(keys, outcomes)
+                if outcome is not None
+            }
+            results = validate_many(
+                PublishType.PLUGIN,
+                [outcome.raw_data for outcome in tested.values()],
+                [],
+            )
+            for (key, outcome), result in zip(tested.items(), results):
+                try:
+                    new_results[key], new_plugins[key] = collect_plugin_result(
+                        outcome, result
+                    )
+                except Exception as err:
+                    logger.error(f"{err}")
+        else:
+            logger.info(f"已达到测试上限 {limit}，测试停止")
 
         summary = self.generate_github_summary(new_results)
         add_step_summary(summary)
@@ -315,14 +380,28 @@ class StoreTest:
 
         以商店数据为准，更新商店数据到仓库中，如果仓库中不存在则获取用户名后存储
         """
+        # 仓库中不存在的数据按类型一起验证
+        new_adapters = self.validate_new(
+            PublishType.ADAPTER, self._store_adapters, self._previous_adapters, "适配器"
+        )
+        new_bots = self.validate_new(
+            PublishType.BOT, self._store_bots, self._previous_bots, "机器人"
+        )
+        new_drivers = self.validate_new(
+            PublishType.DRIVER, self._store_drivers, self._previous_drivers, "驱动器"
+        )
         for key in self._store_adapters:
             try:
                 if key in self._previous_adapters:
                     new_adapter = self._previous_adapters[key].update(
                         self._store_adapters[key]
                     )
+                elif key in new_adapters:
+                    new_adapter = self._store_adapters[key].to_registry(
+                        new_adapters[key]
+                    )
                 else:
-                    new_adapter = self._store_adapters[key].to_registry()
+                    continue
             except Exception as e:
                 logger.error(f"适配器 {key} 同步商店数据失败：{e}")
                 continue
@@ -331,8 +410,10 @@ class StoreTest:
             try:
                 if key in self._previous_bots:
                     new_bot = self._previous_bots[key].update(self._store_bots[key])
+                elif key in new_bots:
+                    new_bot = self._store_bots[key].to_registry(new_bots[key])
                 else:
-                    new_bot = self._store_bots[key].to_registry()
+                    continue
             except Exception as e:
                 logger.error(f"机器人 {key} 同步商店数据失败：{e}")
                 continue
@@ -344,8 +425,10 @@ class StoreTest:
                     new_driver = self._previous_drivers[key].update(
                         self._store_drivers[key]
                     )
+                elif key in new_drivers:
+                    new_driver = self._store_drivers[key].to_registry(new_drivers[key])
                 else:
-                    new_driver = self._store_drivers[key].to_registry()
+                    continue
             except Exception as e:
                 logger.error(f"驱动器 {key} 同步商店数据失败：{e}")
                 continue
@@ -366,6 +449,30 @@ class StoreTest:
 
             self._previous_plugins[key] = new_plugin
 
+    def validate_new(
+        self,
+        publish_type: PublishType,
+        stores: dict[str, StoreAdapter] | dict[str, StoreBot] | dict[str, StoreDriver],
+        previous: dict[str, RegistryAdapter]
+        | dict[str, RegistryBot]
+        | dict[str, RegistryDriver],
+        name: str,
+    ) -> dict[str, ValidationDict]:
+        """获取仓库中不存在的数据的作者信息，并通过 validate_many 一起验证
+
+        获取作者信息失败的数据不参与验证
+        """
+        raw_data: dict[str, dict[str, Any]] = {}
+        for key, store in stores.items():
+            if key in previous:
+                continue
+            try:
+                raw_data[key] = store.registry_data()
+            except Exception as e:
+                logger.error(f"{name} {key} 同步商店数据失败：{e}")
+        results = validate_many(publish_type, list(raw_data.values()), [])
+        return dict(zip(raw_data, results))
+
     def generate_github_summary(self, results: dict[str, StoreTestResult]):
         """生成 GitHub 摘要"""
         valid_plugins = [
@@ -392,5 +499,18 @@ class StoreTest:
 ## 未通过测试插件列表
 
 {'\n'.join([f'- {name}' for name in invalid_plugins])}
+"""
+        timings = [
+            f"| {name} | {format_timings(result.timings)} |"
+            for name, result in results.items()
+            if result.timings
+        ]
+        if timings:
+            summary += f"""
+## 测试耗时
+
+| 插件 | 各阶段耗时 |
+| --- | --- |
+{'\n'.join(timings)}
 """
         return summary
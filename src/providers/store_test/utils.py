@@ -1,3 +1,4 @@
+from src.providers.docker_test import PhaseTiming
 from src.providers.utils import load_json_from_web
 
 
@@ -5,3 +6,24 @@ def get_user_id(name: str) -> int:
     """获取用户信息"""
     data = load_json_from_web(f"https://api.github.com/users/{name}")
     return data["id"]
+
+
+def format_timing(timing: PhaseTiming) -> str:
+    """将测试阶段耗时转换为字符串
+
+    10.1s (CPU 8.0s, 512 MB)
+    """
+    usage = f"CPU {timing['cpu']:.1f}s"
+    if max_rss := timing.get("max_rss"):
+        usage += f", {max_rss / 1024:.0f} MB"
+    return f"{timing['wall']:.1f}s ({usage})"
+
+
+def format_timings(timings: dict[str, PhaseTiming]) -> str:
+    """将各测试阶段耗时转换为字符串
+
+    create 10.1s (CPU 8.0s, 512 MB), load 2.0s (CPU 1.5s)
+    """
+    return ", ".join(
+        f"{phase} {format_timing(timing)}" for phase, timing in timings.items()
+    )
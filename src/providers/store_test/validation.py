@@ -2,7 +2,16 @@
 
 from typing import Any
 
-from src.providers.docker_test import DockerPluginTest
+from pydantic import BaseModel, ConfigDict
+
+from src.providers.constants import PLUGIN_TEST_BACKEND
+from src.providers.docker_test import (
+    DockerTestResult,
+    MatrixCell,
+    get_phase_timeouts,
+    get_plugin_test,
+    get_test_matrix,
+)
 from src.providers.logger import logger
 from src.providers.models import RegistryPlugin, StorePlugin, StoreTestResult
 from src.providers.utils import get_author_name, get_pypi_upload_time
@@ -14,19 +23,60 @@ from src.providers.validation import (
 )
 
 
+class PluginTestOutcome(BaseModel):
+    """插件测试完成后，验证插件信息所需的数据"""
+
+    model_config = ConfigDict(defer_build=True)
+
+    config: str
+    """ 插件测试配置 """
+    previous_plugin: RegistryPlugin | None
+    """ 上次的插件数据 """
+    matrix: list[MatrixCell]
+    """ 测试矩阵 """
+    results: list[DockerTestResult]
+    """ 各测试环境的测试结果，第一个为主要测试环境 """
+    raw_data: dict[str, Any]
+    """ 需要验证的插件信息 """
+    author: str
+    """ 插件作者名称 """
+
+
 async def validate_plugin(
     store_plugin: StorePlugin,
     config: str,
     previous_plugin: RegistryPlugin | None = None,
+    backend: str = PLUGIN_TEST_BACKEND,
+    previous_result: StoreTestResult | None = None,
 ):
     """验证插件
 
     如果 previous_plugin 为 None，说明是首次验证插件
 
+    如果提供了 previous_result，则根据上次测试各阶段的耗时设置超时时间
+
     返回测试结果与验证后的插件数据
 
     如果插件验证失败，返回的插件数据为 None
     """
+    outcome = await run_plugin_test(
+        store_plugin, config, previous_plugin, backend, previous_result
+    )
+    result = validate_info(PublishType.PLUGIN, outcome.raw_data, [])
+    return collect_plugin_result(outcome, result)
+
+
+async def run_plugin_test(
+    store_plugin: StorePlugin,
+    config: str,
+    previous_plugin: RegistryPlugin | None = None,
+    backend: str = PLUGIN_TEST_BACKEND,
+    previous_result: StoreTestResult | None = None,
+) -> PluginTestOutcome:
+    """测试插件并生成需要验证的插件信息
+
+    批量测试时先测试所有插件，再通过 validate_many 一起验证
+    """
     # 需要从商店插件数据中获取的信息
     project_link = store_plugin.project_link
     module_name = store_plugin.module_name
@@ -34,15 +84,18 @@ async def validate_plugin(
     # 从 PyPI 获取信息
     pypi_time = get_pypi_upload_time(project_link)
 
-    # 测试插件
-    plugin_test_result = await DockerPluginTest(project_link, module_name, config).run(
-        "3.12"
-    )
+    # 在所有测试环境中同时测试插件
+    # 第一个为主要测试环境，其结果用于验证插件
+    matrix = get_test_matrix()
+    timeouts = get_phase_timeouts(previous_result.timings if previous_result else None)
+    plugin_test_results = await get_plugin_test(
+        project_link, module_name, config, backend, timeouts
+    ).run_matrix(matrix)
+    plugin_test_result = plugin_test_results[0]
 
     plugin_test_load = plugin_test_result.load
     plugin_test_output = plugin_test_result.output
     plugin_test_version = plugin_test_result.version
-    plugin_test_env = plugin_test_result.test_env
     plugin_metadata = plugin_test_result.metadata
 
     # 输出插件测试相关信息
@@ -91,8 +144,23 @@ async def validate_plugin(
     # 更新插件信息
     raw_data["time"] = pypi_time
 
-    # 验证插件信息
-    result: ValidationDict = validate_info(PublishType.PLUGIN, raw_data, [])
+    return PluginTestOutcome(
+        config=config,
+        previous_plugin=previous_plugin,
+        matrix=matrix,
+        results=plugin_test_results,
+        raw_data=raw_data,
+        author=author_name,
+    )
+
+
+def collect_plugin_result(
+    outcome: PluginTestOutcome, result: ValidationDict
+) -> tuple[StoreTestResult, RegistryPlugin]:
+    """根据插件测试与验证结果生成测试结果与新的插件数据"""
+    previous_plugin = outcome.previous_plugin
+    plugin_test_result = outcome.results[0]
+    plugin_metadata = plugin_test_result.metadata
 
     if result.valid:
         assert isinstance(result.info, PluginPublishInfo)
@@ -104,7 +172,7 @@ async def validate_plugin(
         # 顺便更新作者名与验证结果
         data.update(
             {
-                "author": author_name,
+                "author": outcome.author,
                 "valid": result.valid,
             }
         )
@@ -115,20 +183,29 @@ async def validate_plugin(
         None if result.valid else {"data": result.valid_data, "errors": result.errors}
     )
 
+    # 合并所有测试环境的结果
+    # 如果插件未能安装，则无法获取到实际环境，使用测试矩阵中的环境
+    test_env = {
+        (result.test_env if result.run else cell.test_env): result.load
+        for cell, result in zip(outcome.matrix, outcome.results)
+    }
+
     test_result = StoreTestResult(
-        version=plugin_test_version,
+        version=plugin_test_result.version,
         results={
             "validation": validation_result,
-            "load": plugin_test_load,
+            "load": plugin_test_result.load,
             "metadata": bool(plugin_metadata),
         },
-        config=config,
+        config=outcome.config,
         outputs={
             "validation": validation_output,
-            "load": plugin_test_output,
+            "load": plugin_test_result.output,
             "metadata": plugin_metadata,
         },
-        test_env={plugin_test_env: True},
+        test_env=test_env,
+        timings=plugin_test_result.timings or None,
+        profile=plugin_test_result.profile,
     )
 
     return test_result, new_plugin
@@ -8,6 +8,8 @@ import httpx
 import pyjson5
 from pydantic_core import to_jsonable_python
 
+from src.providers.constants import USER_AGENT
+from src.providers.facts import get_facts
 from src.providers.logger import logger
 
 
@@ -71,14 +73,14 @@ def dump_json5(path: Path, data: Any) -> None:
 @cache
 def get_url(url: str) -> httpx.Response:
     """获取网址"""
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/83.0.4103.116 Safari/537.36"
-    }
+    headers = {"User-Agent": USER_AGENT}
     return httpx.get(url, follow_redirects=True, headers=headers)
 
 
 def get_pypi_data(project_link: str) -> dict[str, Any]:
     """获取 PyPI 数据"""
+    if facts := get_facts():
+        return facts.get_pypi_data(project_link)
 
     url = f"https://pypi.org/pypi/{project_link}/json"
     try:
@@ -128,5 +130,7 @@ def add_step_summary(summary: str):
 @cache
 def get_author_name(author_id: int) -> str:
     """通过作者的ID获取作者名字"""
+    if facts := get_facts():
+        return facts.get_author_name(author_id)
     url = f"https://api.github.com/user/{author_id}"
     return load_json_from_web(url)["login"]
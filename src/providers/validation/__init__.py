@@ -1,5 +1,6 @@
 """验证数据是否符合规范"""
 
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from pydantic import ValidationError
@@ -13,6 +14,10 @@ from .models import (
 from .models import PublishInfoModels as PublishInfoModels
 from .models import PublishType as PublishType
 from .models import ValidationDict as ValidationDict
+from .prefetch import prefetch_facts
+from .profile import profile_validation
+from .utils import build_previous_keys as build_previous_keys
+from .utils import get_previous_keys as get_previous_keys
 from .utils import translate_errors
 
 if TYPE_CHECKING:
@@ -30,6 +35,9 @@ def validate_info(
     publish_type: PublishType,
     raw_data: dict[str, Any],
     previous_data: list[dict[str, Any]] | None,
+    previous_keys: frozenset[str] | None = None,
+    adapter_path: Path | None = None,
+    profile: bool = False,
 ) -> ValidationDict:
     """根据发布类型验证数据是否符合规范
 
@@ -37,25 +45,86 @@ def validate_info(
         publish_type (PublishType): 发布类型
         raw_data (dict[str, Any]): 原始数据
         previous_data (list[dict[str, Any]] | None): 当前商店数据，用于验证数据是否重复
+        previous_keys (frozenset[str] | None): 预先构建的商店数据键索引，
+            批量验证同一份商店数据时传入，避免每次都重新构建
+        adapter_path (Path | None): 商店仓库中的适配器文件，存在时优先使用
+        profile (bool): 是否记录各字段与模型验证器的耗时
     """
+    if previous_keys is None and previous_data is not None:
+        previous_keys = build_previous_keys(previous_data)
+
+    # 验证前同时获取的网络数据
+    facts = prefetch_facts(publish_type, [raw_data], previous_keys, adapter_path)
+    return _validate_info(
+        publish_type, raw_data, previous_keys, adapter_path, facts, profile
+    )
+
+
+def validate_many(
+    publish_type: PublishType,
+    items: list[dict[str, Any]],
+    previous_data: list[dict[str, Any]] | None,
+    previous_keys: frozenset[str] | None = None,
+    adapter_path: Path | None = None,
+    profile: bool = False,
+) -> list[ValidationDict]:
+    """批量验证同一发布类型的数据
+
+    所有数据共享商店数据键索引与适配器列表，网络数据在验证前同时获取
+
+    Args:
+        publish_type (PublishType): 发布类型
+        items (list[dict[str, Any]]): 原始数据列表
+        previous_data (list[dict[str, Any]] | None): 当前商店数据，用于验证数据是否重复
+        previous_keys (frozenset[str] | None): 预先构建的商店数据键索引
+        adapter_path (Path | None): 商店仓库中的适配器文件，存在时优先使用
+        profile (bool): 是否记录各字段与模型验证器的耗时
+
+    Returns:
+        list[ValidationDict]: 与原始数据顺序一致的验证结果
+    """
+    if previous_keys is None and previous_data is not None:
+        previous_keys = build_previous_keys(previous_data)
+
+    facts = prefetch_facts(publish_type, items, previous_keys, adapter_path)
+    return [
+        _validate_info(
+            publish_type, raw_data, previous_keys, adapter_path, facts, profile
+        )
+        for raw_data in items
+    ]
+
+
+def _validate_info(
+    publish_type: PublishType,
+    raw_data: dict[str, Any],
+    previous_keys: frozenset[str] | None,
+    adapter_path: Path | None,
+    facts: dict[str, Any],
+    profile: bool = False,
+) -> ValidationDict:
+    """使用已获取的数据验证"""
     context = {
-        "previous_data": previous_data,
+        "previous_keys": previous_keys,
         "valid_data": {},  # 用来存放验证通过的数据
         # 验证过程中可能需要用到的数据
         # 存放在 context 中方便 FieldValidator 使用
         "test_output": raw_data.get("test_output", ""),  # 测试输出
         "skip_test": raw_data.get("skip_test", False),  # 是否跳过测试
+        "adapter_path": adapter_path,  # 适配器文件
+        **facts,
     }
 
     info: PublishInfoModels | None = None
     errors: list[ErrorDetails] = []
 
-    try:
-        info = validation_model_map[publish_type].model_validate(
-            raw_data, context=context
-        )
-    except ValidationError as exc:
-        errors = exc.errors()
+    with profile_validation(profile) as timings:
+        try:
+            info = validation_model_map[publish_type].model_validate(
+                raw_data, context=context
+            )
+        except ValidationError as exc:
+            errors = exc.errors()
 
     # 翻译错误
     errors = translate_errors(errors)
@@ -66,4 +135,5 @@ def validate_info(
         valid_data=context.get("valid_data", {}),
         info=info,
         errors=errors,
+        timings=timings,
     )
@@ -16,6 +16,19 @@ NAME_MAX_LENGTH = 50
 PLUGIN_VALID_TYPE: list[LiteralString] = ["application", "library"]
 """插件类型当前只支持 application 和 library"""
 
+ADAPTERS_CACHE_TTL = 600
+"""从商店获取的适配器列表缓存时间，单位为秒"""
+PREFETCH_CONCURRENCY = 16
+"""验证前同时获取网络数据的最大请求数"""
+
+# 项目主页可访问性检查
+HOMEPAGE_TIMEOUT = 10
+"""检查项目主页的超时时间，单位为秒"""
+HOMEPAGE_CACHE_TTL = 24 * 60 * 60
+"""可以访问的检查结果的缓存时间，单位为秒，会保存到文件中"""
+HOMEPAGE_FAILURE_CACHE_TTL = 10 * 60
+"""无法访问的检查结果的缓存时间，单位为秒，只在当前进程中有效"""
+
 # Pydantic 错误信息翻译
 MESSAGE_TRANSLATIONS = {
     "string_type": "值不是合法的字符串",
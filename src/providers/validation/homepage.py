@@ -0,0 +1,150 @@
+"""项目主页可访问性检查
+
+只需要状态码，所以先发送 HEAD 请求，失败时再发送只请求第一个字节的 GET 请求，
+都不会下载完整的页面。
+
+检查结果按网址缓存，可以访问的结果还会保存到文件中，在之后的运行中复用。
+"""
+
+import json
+import os
+import threading
+import time
+from functools import cache
+from pathlib import Path
+from typing import TypedDict
+
+import httpx
+
+from src.providers.constants import HOMEPAGE_CACHE_PATH, USER_AGENT
+from src.providers.facts import get_facts
+from src.providers.logger import logger
+from src.providers.utils import dump_json
+
+from .constants import HOMEPAGE_CACHE_TTL, HOMEPAGE_FAILURE_CACHE_TTL, HOMEPAGE_TIMEOUT
+
+
+class HomepageStatus(TypedDict):
+    """项目主页检查结果"""
+
+    status_code: int
+    """ 状态码，请求报错时为 -1 """
+    msg: str
+    """ 报错信息 """
+    time: float
+    """ 检查时间，Unix 时间戳 """
+
+
+_lock = threading.Lock()
+
+
+@cache
+def load_homepage_cache() -> dict[str, HomepageStatus]:
+    """读取保存的检查结果
+
+    之后的检查结果会直接更新到返回的字典中
+    """
+    path = Path(HOMEPAGE_CACHE_PATH)
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning(f"读取项目主页检查缓存失败：{e}")
+        return {}
+
+
+def save_homepage_cache() -> None:
+    """保存可以访问的检查结果
+
+    先写入临时文件再替换，读取时不会遇到写了一半的文件
+    """
+    now = time.time()
+    path = Path(HOMEPAGE_CACHE_PATH)
+    temp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with _lock:
+        data = {
+            url: status
+            for url, status in load_homepage_cache().items()
+            if status["status_code"] == 200
+            and now - status["time"] < HOMEPAGE_CACHE_TTL
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            dump_json(temp, data)
+            os.replace(temp, path)
+        except OSError as e:
+            temp.unlink(missing_ok=True)
+            logger.warning(f"保存项目主页检查缓存失败：{e}")
+
+
+def request_status_code(url: str) -> int:
+    """获取网址的状态码
+
+    部分网站不支持 HEAD 请求，此时使用只请求第一个字节的 GET 请求，且不读取响应内容
+    """
+    with httpx.Client(
+        follow_redirects=True,
+        headers={"User-Agent": USER_AGENT},
+        timeout=HOMEPAGE_TIMEOUT,
+    ) as client:
+        try:
+            r = client.head(url)
+            if r.status_code == 200:
+                return 200
+        except Exception:
+            # HEAD 请求失败时仍尝试 GET 请求
+            pass
+        with client.stream("GET", url, headers={"Range": "bytes=0-0"}) as r:
+            # 支持范围请求的网站返回 206
+            return 200 if r.status_code == 206 else r.status_code
+
+
+def get_cached_status(url: str) -> tuple[int, str] | None:
+    """获取未过期的检查结果，没有时返回 None"""
+    with _lock:
+        status = load_homepage_cache().get(url)
+    if not status:
+        return None
+    ttl = (
+        HOMEPAGE_CACHE_TTL
+        if status["status_code"] == 200
+        else HOMEPAGE_FAILURE_CACHE_TTL
+    )
+    if time.time() - status["time"] < ttl:
+        return status["status_code"], status["msg"]
+
+
+def check_homepage(url: str, save: bool = False) -> tuple[int, str]:
+    """检查项目主页是否可以访问
+
+    检查结果默认只缓存在内存中，由调用方在检查完成后调用 save_homepage_cache 统一保存
+
+    Args:
+        url (str): 项目主页
+        save (bool): 是否立即保存检查结果
+
+    Returns:
+        tuple[int, str]: 状态码与报错信息，请求报错时状态码为 -1
+    """
+    if facts := get_facts():
+        return facts.get_homepage(url)
+
+    if cached := get_cached_status(url):
+        return cached
+
+    now = time.time()
+    try:
+        status_code, msg = request_status_code(url), ""
+    except Exception as e:
+        status_code, msg = -1, str(e)
+
+    with _lock:
+        load_homepage_cache()[url] = {
+            "status_code": status_code,
+            "msg": msg,
+            "time": now,
+        }
+    if save and status_code == 200:
+        save_homepage_cache()
+    return status_code, msg
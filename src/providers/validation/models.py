@@ -1,10 +1,12 @@
 # ruff: noqa: UP040
 import abc
+import time
 from enum import Enum
 from typing import Annotated, Any, TypeAlias
 
 from pydantic import (
     BaseModel,
+    ConfigDict,
     Field,
     SkipValidation,
     StringConstraints,
@@ -18,6 +20,7 @@ from pydantic_core import ErrorDetails, PydanticCustomError, to_jsonable_python
 from pydantic_extra_types.color import Color
 from pyjson5 import Json5DecoderException
 
+from src.providers.constants import BOT_KEY_TEMPLATE, PYPI_KEY_TEMPLATE
 from src.providers.utils import (
     get_pypi_name,
     get_pypi_upload_time,
@@ -31,9 +34,10 @@ from .constants import (
     PYPI_PACKAGE_NAME_PATTERN,
     PYTHON_MODULE_NAME_REGEX,
 )
+from .homepage import check_homepage
+from .profile import record_timing, timed
 from .utils import (
     check_pypi,
-    check_url,
     get_adapters,
     resolve_adapter_name,
 )
@@ -75,6 +79,9 @@ class Tag(BaseModel):
 
 
 class PyPIMixin(BaseModel):
+    # 与各发布信息模型一同在首次验证时构建
+    model_config = ConfigDict(defer_build=True)
+
     module_name: str
     project_link: str
 
@@ -89,6 +96,8 @@ class PyPIMixin(BaseModel):
     从 PyPI 获取最新版本号或者由插件测试提供
     """
 
+    # 混入类的字段验证器在 PublishInfo.collect_valid_values 内执行，已经被计入耗时
+    # 不再单独记录，否则耗时会重复计算
     @field_validator("module_name", mode="before")
     @classmethod
     def module_name_validator(cls, v: str) -> str:
@@ -121,6 +130,7 @@ class PyPIMixin(BaseModel):
 
     @model_validator(mode="before")
     @classmethod
+    @timed("prevent_duplication")
     def prevent_duplication(
         cls, values: dict[str, Any], info: ValidationInfo
     ) -> dict[str, Any]:
@@ -130,17 +140,17 @@ class PyPIMixin(BaseModel):
         context = info.context
         if context is None:  # pragma: no cover
             raise PydanticCustomError("validation_context", "未获取到验证上下文")
-        data = context.get("previous_data")
-        if data is None:
+        keys = context.get("previous_keys")
+        if keys is None:
             raise PydanticCustomError("previous_data", "未获取到数据列表")
 
         if (
             module_name
             and project_link
-            and any(
-                x["module_name"] == module_name and x["project_link"] == project_link
-                for x in data
+            and PYPI_KEY_TEMPLATE.format(
+                project_link=project_link, module_name=module_name
             )
+            in keys
         ):
             raise PydanticCustomError(
                 "duplication",
@@ -169,6 +179,8 @@ class PyPIMixin(BaseModel):
 class PublishInfo(abc.ABC, BaseModel):
     """发布信息"""
 
+    model_config = ConfigDict(defer_build=True)
+
     name: str = Field(max_length=NAME_MAX_LENGTH)
     desc: str
     author: str
@@ -194,7 +206,11 @@ class PublishInfo(abc.ABC, BaseModel):
         if context is None:  # pragma: no cover
             raise PydanticCustomError("validation_context", "未获取到验证上下文")
 
-        result = handler(v)
+        start = time.perf_counter()
+        try:
+            result = handler(v)
+        finally:
+            record_timing(info.field_name, time.perf_counter() - start)
         # 保存成 jsonable 的数据
         # 方便后续使用
         context["valid_data"][info.field_name] = to_jsonable_python(result)
@@ -202,12 +218,13 @@ class PublishInfo(abc.ABC, BaseModel):
 
     @field_validator("homepage", mode="before")
     @classmethod
+    @timed("homepage")
     def homepage_validator(cls, v: str) -> str:
         if v:
             # 内置驱动器的主页可以不是网址
             if issubclass(cls, DriverPublishInfo) and v.startswith("/docs/"):
                 return v
-            status_code, msg = check_url(v)
+            status_code, msg = check_homepage(v)
             if status_code != 200:
                 raise PydanticCustomError(
                     "homepage",
@@ -218,6 +235,7 @@ class PublishInfo(abc.ABC, BaseModel):
 
     @field_validator("tags", mode="before")
     @classmethod
+    @timed("tags")
     def tags_validator(cls, v: str | list[Any]) -> list[dict[str, str]]:
         if not isinstance(v, str):
             # 将值转成 Python dict，避免 model_type 报错
@@ -249,6 +267,7 @@ class PluginPublishInfo(PublishInfo, PyPIMixin):
 
     @field_validator("type", mode="before")
     @classmethod
+    @timed("type")
     def type_validator(cls, v: str) -> str:
         if v not in PLUGIN_VALID_TYPE:
             raise PydanticCustomError("plugin.type", "插件类型不符合规范")
@@ -256,6 +275,7 @@ class PluginPublishInfo(PublishInfo, PyPIMixin):
 
     @field_validator("supported_adapters", mode="before")
     @classmethod
+    @timed("supported_adapters")
     def supported_adapters_validator(
         cls, v: str | list[str] | None, info: ValidationInfo
     ) -> list[str] | None:
@@ -279,7 +299,10 @@ class PluginPublishInfo(PublishInfo, PyPIMixin):
             raise PydanticCustomError("set_type", "值应该是一个集合")
 
         supported_adapters = {resolve_adapter_name(x) for x in v}
-        store_adapters = get_adapters()
+        # 优先使用验证前获取的适配器列表
+        store_adapters = context.get("adapters")
+        if store_adapters is None:
+            store_adapters = get_adapters(context.get("adapter_path"))
 
         missing_adapters = supported_adapters - store_adapters
         if missing_adapters:
@@ -295,6 +318,7 @@ class PluginPublishInfo(PublishInfo, PyPIMixin):
 
     @field_validator("load", mode="before")
     @classmethod
+    @timed("load")
     def plugin_test_load_validator(cls, v: bool, info: ValidationInfo) -> bool:
         context = info.context
         if context is None:
@@ -310,6 +334,7 @@ class PluginPublishInfo(PublishInfo, PyPIMixin):
 
     @field_validator("metadata", mode="before")
     @classmethod
+    @timed("metadata")
     def plugin_test_metadata_validator(
         cls, v: bool | None, info: ValidationInfo
     ) -> bool:
@@ -335,6 +360,7 @@ class BotPublishInfo(PublishInfo):
 
     @model_validator(mode="before")
     @classmethod
+    @timed("prevent_duplication")
     def prevent_duplication(
         cls, values: dict[str, Any], info: ValidationInfo
     ) -> dict[str, Any]:
@@ -344,14 +370,14 @@ class BotPublishInfo(PublishInfo):
         context = info.context
         if context is None:  # pragma: no cover
             raise PydanticCustomError("validation_context", "未获取到验证上下文")
-        data = context.get("previous_data")
-        if data is None:
+        keys = context.get("previous_keys")
+        if keys is None:
             raise PydanticCustomError("previous_data", "未获取到数据列表")
 
         if (
             name
             and homepage
-            and any(x["name"] == name and x["homepage"] == homepage for x in data)
+            and BOT_KEY_TEMPLATE.format(name=name, homepage=homepage) in keys
         ):
             raise PydanticCustomError(
                 "duplication",
@@ -371,6 +397,8 @@ PublishInfoModels: TypeAlias = (
 
 
 class ValidationDict(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     type: PublishType
     raw_data: dict[str, Any] = {}
     """原始数据"""
@@ -380,6 +408,8 @@ class ValidationDict(BaseModel):
     info: SkipValidation[PublishInfoModels | None] = None
     """验证通过的信息"""
     errors: list[ErrorDetails] = []
+    timings: dict[str, float] = {}
+    """各字段与模型验证器的耗时，单位为秒，仅在开启耗时记录时存在"""
 
     @property
     def valid(self) -> bool:
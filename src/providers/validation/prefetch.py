@@ -0,0 +1,142 @@
+"""验证前并发获取验证所需的网络数据
+
+验证器会依次访问 PyPI、项目主页与商店适配器列表。
+在验证前同时获取这些数据，验证器之后直接读取缓存或验证上下文中的结果，
+验证耗时只取决于最慢的一个请求。
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from src.providers.constants import BOT_KEY_TEMPLATE, PYPI_KEY_TEMPLATE
+from src.providers.facts import get_facts
+from src.providers.utils import get_url
+
+from .constants import PREFETCH_CONCURRENCY, PYPI_PACKAGE_NAME_PATTERN
+from .homepage import check_homepage, save_homepage_cache
+from .models import PublishType
+from .utils import get_adapters
+
+
+def is_duplicated(
+    publish_type: PublishType, raw_data: dict[str, Any], previous_keys: frozenset[str]
+) -> bool:
+    """数据是否与商店重复，重复时验证会直接失败"""
+    if publish_type == PublishType.BOT:
+        name = raw_data.get("name")
+        homepage = raw_data.get("homepage")
+        return bool(name and homepage) and (
+            BOT_KEY_TEMPLATE.format(name=name, homepage=homepage) in previous_keys
+        )
+    project_link = raw_data.get("project_link")
+    module_name = raw_data.get("module_name")
+    return bool(project_link and module_name) and (
+        PYPI_KEY_TEMPLATE.format(project_link=project_link, module_name=module_name)
+        in previous_keys
+    )
+
+
+def collect_urls(publish_type: PublishType, raw_data: dict[str, Any]) -> list[str]:
+    """收集验证器将会访问的 PyPI 网址
+
+    与验证器的判断保持一致，验证器不会访问的网址不需要获取
+    """
+    urls = []
+
+    project_link = raw_data.get("project_link")
+    if publish_type != PublishType.BOT and isinstance(project_link, str):
+        # 内置驱动器的上传时间与版本号以 nonebot2 为准
+        if publish_type == PublishType.DRIVER and (
+            project_link == "" or project_link.startswith("nonebot2[")
+        ):
+            urls.append("https://pypi.org/pypi/nonebot2/json")
+        elif PYPI_PACKAGE_NAME_PATTERN.match(project_link):
+            urls.append(f"https://pypi.org/pypi/{project_link}/json")
+    return urls
+
+
+def collect_homepage(publish_type: PublishType, raw_data: dict[str, Any]) -> str | None:
+    """获取验证器将会检查的项目主页"""
+    homepage = raw_data.get("homepage")
+    if (
+        isinstance(homepage, str)
+        and homepage
+        # 内置驱动器的主页可以不是网址
+        and not (publish_type == PublishType.DRIVER and homepage.startswith("/docs/"))
+    ):
+        return homepage
+
+
+def prefetch_facts(
+    publish_type: PublishType,
+    items: list[dict[str, Any]],
+    previous_keys: frozenset[str] | None,
+    adapter_path: Path | None = None,
+) -> dict[str, Any]:
+    """同时获取验证所需的网络数据
+
+    PyPI 数据通过 get_url 获取并缓存，项目主页通过 check_homepage 检查并缓存，
+    适配器列表放入返回的验证上下文中。
+    获取失败时忽略，由验证器重新获取并报告错误。
+
+    Args:
+        publish_type (PublishType): 发布类型
+        items (list[dict[str, Any]]): 需要验证的原始数据，批量验证时共享获取的数据
+        previous_keys (frozenset[str] | None): 商店数据键索引
+        adapter_path (Path | None): 商店仓库中的适配器文件
+
+    Returns:
+        dict[str, Any]: 需要加入验证上下文的数据
+    """
+    # 缺少商店数据或数据重复时验证会直接失败，不需要访问网络
+    # 离线验证时验证器直接读取离线数据库
+    if previous_keys is None or get_facts() is not None:
+        return {}
+    items = [
+        raw_data
+        for raw_data in items
+        if not is_duplicated(publish_type, raw_data, previous_keys)
+    ]
+
+    urls = list(
+        dict.fromkeys(
+            url for raw_data in items for url in collect_urls(publish_type, raw_data)
+        )
+    )
+    homepages = list(
+        dict.fromkeys(
+            homepage
+            for raw_data in items
+            if (homepage := collect_homepage(publish_type, raw_data))
+        )
+    )
+    fetch_adapters = publish_type == PublishType.PLUGIN and any(
+        raw_data.get("supported_adapters") is not None for raw_data in items
+    )
+    if not urls and not homepages and not fetch_adapters:
+        return {}
+
+    with ThreadPoolExecutor(
+        max_workers=min(len(urls) + len(homepages) + 1, PREFETCH_CONCURRENCY)
+    ) as executor:
+        # 获取结果都会被缓存，之后验证器直接使用
+        for url in urls:
+            executor.submit(get_url, url)
+        for homepage in homepages:
+            executor.submit(check_homepage, homepage, save=False)
+        adapters = (
+            executor.submit(partial(get_adapters, adapter_path))
+            if fetch_adapters
+            else None
+        )
+
+    # 所有主页检查完成后统一保存一次，避免每个结果都重写缓存文件
+    if homepages:
+        save_homepage_cache()
+
+    context = {}
+    if adapters and not adapters.exception():
+        context["adapters"] = adapters.result()
+    return context
@@ -0,0 +1,64 @@
+"""记录验证器耗时
+
+开启后记录每个字段与模型验证器的耗时，用于找出拖慢验证的验证器。
+未开启时验证器不做任何额外操作。
+"""
+
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+_timings: ContextVar[dict[str, float] | None] = ContextVar(
+    "validation_timings", default=None
+)
+
+
+@contextmanager
+def profile_validation(enabled: bool = True) -> Iterator[dict[str, float]]:
+    """在上下文中记录验证器耗时
+
+    Yields:
+        dict[str, float]: 字段或模型验证器名与其耗时，单位为秒，未开启时始终为空
+    """
+    timings: dict[str, float] = {}
+    if not enabled:
+        yield timings
+        return
+
+    token = _timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _timings.reset(token)
+
+
+def record_timing(key: str, seconds: float) -> None:
+    """累加耗时，同一字段的多个验证器耗时合并计算"""
+    timings = _timings.get()
+    if timings is not None:
+        timings[key] = timings.get(key, 0) + seconds
+
+
+def timed[**P, R](key: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """记录验证器耗时
+
+    需要放在 classmethod 之下，保留原函数签名供 pydantic 判断是否传入 ValidationInfo
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if _timings.get() is None:
+                return func(*args, **kwargs)
+
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record_timing(key, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
@@ -1,16 +1,63 @@
-from typing import TYPE_CHECKING
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from src.providers.constants import STORE_ADAPTERS_URL
-from src.providers.utils import get_url, load_json_from_web
+from src.providers.constants import (
+    BOT_KEY_TEMPLATE,
+    PYPI_KEY_TEMPLATE,
+    STORE_ADAPTERS_URL,
+)
+from src.providers.facts import get_facts
+from src.providers.utils import get_url, load_json_from_file, load_json_from_web
 
-from .constants import MESSAGE_TRANSLATIONS
+from .constants import ADAPTERS_CACHE_TTL, MESSAGE_TRANSLATIONS
 
 if TYPE_CHECKING:
     from pydantic_core import ErrorDetails
 
 
+def build_previous_keys(previous_data: list[dict[str, Any]]) -> frozenset[str]:
+    """构建商店数据的键索引，用于检查数据是否重复
+
+    PyPI 项目的键为 project_link:module_name，机器人的键为 name:homepage。
+    同一份商店数据只需构建一次，可在多次验证中复用。
+    """
+    keys = set()
+    for x in previous_data:
+        if x.get("module_name") and x.get("project_link"):
+            keys.add(
+                PYPI_KEY_TEMPLATE.format(
+                    project_link=x["project_link"], module_name=x["module_name"]
+                )
+            )
+        if x.get("name") and x.get("homepage"):
+            keys.add(BOT_KEY_TEMPLATE.format(name=x["name"], homepage=x["homepage"]))
+    return frozenset(keys)
+
+
+def get_previous_keys(path: Path) -> frozenset[str]:
+    """读取商店数据文件并构建键索引
+
+    文件未修改时直接使用上次构建的索引
+    """
+    stat = path.stat()
+    return load_previous_keys_from_file(path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=4)
+def load_previous_keys_from_file(path: Path, mtime: int, size: int) -> frozenset[str]:
+    """读取商店数据文件并构建键索引
+
+    修改时间与文件大小用于判断文件是否变化，每种发布类型的数据各缓存一份
+    """
+    return build_previous_keys(load_json_from_file(path))
+
+
 def check_pypi(project_link: str) -> bool:
     """检查项目是否存在"""
+    if facts := get_facts():
+        return facts.has_pypi(project_link)
     url = f"https://pypi.org/pypi/{project_link}/json"
     status_code, _ = check_url(url)
     return status_code == 200
@@ -28,10 +75,42 @@ def check_url(url: str) -> tuple[int, str]:
         return -1, str(e)
 
 
-def get_adapters() -> set[str]:
-    """获取适配器列表"""
+def get_adapters(adapter_path: Path | None = None) -> frozenset[str]:
+    """获取适配器列表
+
+    在商店仓库中运行时优先读取本地的适配器文件，文件修改后重新读取。
+    离线验证时从离线数据库读取。
+    否则从商店获取，结果在 ADAPTERS_CACHE_TTL 秒内共享。
+
+    Args:
+        adapter_path (Path | None): 商店仓库中的适配器文件
+    """
+    if adapter_path is not None and adapter_path.is_file():
+        stat = adapter_path.stat()
+        return load_adapters_from_file(adapter_path, stat.st_mtime_ns, stat.st_size)
+    if facts := get_facts():
+        return facts.get_adapters()
+    return load_adapters_from_web(int(time.monotonic() // ADAPTERS_CACHE_TTL))
+
+
+@lru_cache(maxsize=1)
+def load_adapters_from_file(path: Path, mtime: int, size: int) -> frozenset[str]:
+    """读取适配器文件
+
+    修改时间与文件大小用于判断文件是否变化
+    """
+    adapters = load_json_from_file(path)
+    return frozenset(adapter["module_name"] for adapter in adapters)
+
+
+@lru_cache(maxsize=1)
+def load_adapters_from_web(period: int) -> frozenset[str]:
+    """从商店获取适配器列表
+
+    同一时间段内只获取一次
+    """
     adapters = load_json_from_web(STORE_ADAPTERS_URL)
-    return {adapter["module_name"] for adapter in adapters}
+    return frozenset(adapter["module_name"] for adapter in adapters)
 
 
 def resolve_adapter_name(name: str) -> str:
@@ -91,11 +91,33 @@ async def app(
 
 
 @pytest.fixture(autouse=True)
-def _clear_cache(app: App):
+def _clear_cache(app: App, tmp_path: Path, mocker: MockerFixture):
     """每次运行前都清除 cache"""
+    from src.providers.docker_test import get_docker_client, get_plugin_index
+    from src.providers.docker_test.scheduler import get_scheduler
+    from src.providers.facts import get_facts
     from src.providers.utils import get_url
+    from src.providers.validation.homepage import load_homepage_cache
+    from src.providers.validation.utils import (
+        load_adapters_from_file,
+        load_adapters_from_web,
+        load_previous_keys_from_file,
+    )
 
     get_url.cache_clear()
+    get_docker_client.cache_clear()
+    get_plugin_index.cache_clear()
+    load_adapters_from_file.cache_clear()
+    load_adapters_from_web.cache_clear()
+    load_previous_keys_from_file.cache_clear()
+    get_scheduler.cache_clear()
+    load_homepage_cache.cache_clear()
+    get_facts.cache_clear()
+    # 项目主页检查结果不能保存到用户目录中
+    mocker.patch(
+        "src.providers.validation.homepage.HOMEPAGE_CACHE_PATH",
+        str(tmp_path / "homepages.json"),
+    )
 
 
 class PyPIProject(TypedDict):
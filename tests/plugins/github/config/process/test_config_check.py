@@ -77,6 +77,7 @@ async def test_process_config_check(
     mock_test_result.load = True
     mock_test_result.version = "1.0.0"
     mock_test_result.output = ""
+    mock_test_result.timings = {}
     mock_docker = mocker.patch("src.providers.docker_test.DockerPluginTest.run")
     mock_docker.return_value = mock_test_result
 
@@ -291,6 +292,9 @@ log_level=DEBUG
         ]  # type: ignore
     )
 
+    # 默认不复用测试环境
+    mock_docker.assert_called_once_with("3.12", reuse_environment=False)
+
     # 检查文件是否正确
     check_json_data(
         mock_results["plugins"],
@@ -63,6 +63,7 @@ async def test_plugin_process_publish_check(
     mock_test_result.load = True
     mock_test_result.version = "1.0.0"
     mock_test_result.output = ""
+    mock_test_result.timings = {}
     mock_docker = mocker.patch("src.providers.docker_test.DockerPluginTest.run")
     mock_docker.return_value = mock_test_result
 
@@ -88,10 +89,6 @@ async def test_plugin_process_publish_check(
                     "api": "rest.issues.async_get",
                     "result": mock_issues_resp,
                 },
-                {
-                    "api": "rest.issues.async_update",
-                    "result": None,
-                },
                 {
                     "api": "rest.issues.async_list_comments",
                     "result": mock_list_comments_resp,
@@ -100,6 +97,10 @@ async def test_plugin_process_publish_check(
                     "api": "rest.issues.async_update",
                     "result": None,
                 },
+                {
+                    "api": "rest.issues.async_update",
+                    "result": None,
+                },
                 {
                     "api": "rest.issues.async_list_comments",
                     "result": mock_list_comments_resp,
@@ -125,7 +126,8 @@ async def test_plugin_process_publish_check(
                 {
                     0: {"owner": "he0119", "repo": "action-test"},
                     1: {"owner": "he0119", "repo": "action-test", "issue_number": 80},
-                    2: {
+                    2: {"owner": "he0119", "repo": "action-test", "issue_number": 80},
+                    3: {
                         "owner": "he0119",
                         "repo": "action-test",
                         "issue_number": 80,
@@ -153,7 +155,6 @@ log_level=DEBUG
 - [x] 🔥插件测试中，请稍后\
 """,
                     },
-                    3: {"owner": "he0119", "repo": "action-test", "issue_number": 80},
                     4: {
                         "owner": "he0119",
                         "repo": "action-test",
@@ -209,6 +210,7 @@ log_level=DEBUG
 
 💪 Powered by [NoneFlow](https://github.com/nonebot/noneflow)
 <!-- NONEFLOW -->
+<!-- NONEFLOW_STATE eJwtjlFuwyAQRO-y38jBcWJsX8bCsCS0mEVmiVRFvnsh7ddqNW_05g0-psIZljekg77Q8Bp8_IYFbtKNo5r7UQ3uPg1XELCTLQHXqHeswLTZYbpqJe-9tQpNBRgzr4ai848KbPPozGTcTSulpJvh_COa7IVH9hQr1Xeyk7UbSFtY-CgogArXVTVsUmRtNevW-jd_jgCL2dTvcwQ8acekHy1_Mqe8XC6RIm7EncVXG_eTWqhTCt5obnYBuaREB6NdqyRxXQVLLCGc5_kLgmNcKA== -->
 """,
                     },
                     7: {
@@ -323,6 +325,7 @@ async def test_plugin_process_publish_check_re_run(
     mock_test_result.load = True
     mock_test_result.version = "1.0.0"
     mock_test_result.output = ""
+    mock_test_result.timings = {}
     mock_docker = mocker.patch("src.providers.docker_test.DockerPluginTest.run")
     mock_docker.return_value = mock_test_result
 
@@ -348,10 +351,6 @@ async def test_plugin_process_publish_check_re_run(
                     "api": "rest.issues.async_get",
                     "result": mock_issues_resp,
                 },
-                {
-                    "api": "rest.issues.async_update",
-                    "result": None,
-                },
                 {
                     "api": "rest.issues.async_list_comments",
                     "result": mock_list_comments_resp,
@@ -360,6 +359,10 @@ async def test_plugin_process_publish_check_re_run(
                     "api": "rest.issues.async_update",
                     "result": None,
                 },
+                {
+                    "api": "rest.issues.async_update",
+                    "result": None,
+                },
                 {
                     "api": "rest.issues.async_list_comments",
                     "result": mock_list_comments_resp,
@@ -385,7 +388,8 @@ async def test_plugin_process_publish_check_re_run(
                 {
                     0: {"owner": "he0119", "repo": "action-test"},
                     1: {"owner": "he0119", "repo": "action-test", "issue_number": 80},
-                    2: {
+                    2: {"owner": "he0119", "repo": "action-test", "issue_number": 80},
+                    3: {
                         "owner": "he0119",
                         "repo": "action-test",
                         "issue_number": 80,
@@ -413,7 +417,6 @@ log_level=DEBUG
 - [x] 🔥插件测试中，请稍后\
 """,
                     },
-                    3: {"owner": "he0119", "repo": "action-test", "issue_number": 80},
                     4: {
                         "owner": "he0119",
                         "repo": "action-test",
@@ -469,6 +472,7 @@ log_level=DEBUG
 
 💪 Powered by [NoneFlow](https://github.com/nonebot/noneflow)
 <!-- NONEFLOW -->
+<!-- NONEFLOW_STATE eJwtjlFuwyAQRO-y38jBcWJsX8bCsCS0mEVmiVRFvnsh7ddqNW_05g0-psIZljekg77Q8Bp8_IYFbtKNo5r7UQ3uPg1XELCTLQHXqHeswLTZYbpqJe-9tQpNBRgzr4ai848KbPPozGTcTSulpJvh_COa7IVH9hQr1Xeyk7UbSFtY-CgogArXVTVsUmRtNevW-jd_jgCL2dTvcwQ8acekHy1_Mqe8XC6RIm7EncVXG_eTWqhTCt5obnYBuaREB6NdqyRxXQVLLCGc5_kLgmNcKA== -->
 """,
                     },
                     7: {
@@ -538,6 +542,194 @@ log_level=DEBUG
     mock_docker.assert_called_once_with("3.12")
 
 
+async def test_plugin_process_publish_check_reuse_test(
+    app: App,
+    mocker: MockerFixture,
+    mocked_api: MockRouter,
+    tmp_path: Path,
+    mock_installation,
+) -> None:
+    """测试插件的发布流程，插件测试相关信息未修改时使用上次的测试结果"""
+    from src.plugins.github.constants import NONEFLOW_MARKER
+    from src.plugins.github.plugins.publish.check_state import (
+        CheckState,
+        PluginTestState,
+        hash_inputs,
+    )
+    from src.plugins.github.plugins.publish.validation import (
+        extract_plugin_info_from_issue,
+    )
+    from src.providers.docker_test import Metadata
+
+    mock_subprocess_run = mock_subprocess_run_with_side_effect(mocker)
+
+    mock_issue = MockIssue(
+        body=MockBody(type="plugin", test_button=False).generate()
+    ).as_mock()
+
+    mock_issues_resp = mocker.MagicMock()
+    mock_issues_resp.parsed_data = mock_issue
+
+    # 上次检查时保存的状态
+    check_state = CheckState(
+        inputs=hash_inputs(extract_plugin_info_from_issue(mock_issue)),
+        test=PluginTestState(
+            version="1.0.0",
+            load=True,
+            output="",
+            metadata=Metadata(
+                name="name",
+                desc="desc",
+                homepage="https://nonebot.dev",
+                type="application",
+                supported_adapters=None,
+            ),
+        ),
+    )
+    mock_comment = mocker.MagicMock()
+    mock_comment.id = 123
+    mock_comment.performed_via_github_app.id = 1
+    mock_comment.body = f"old\n{NONEFLOW_MARKER}\n{check_state.to_marker()}\n"
+    mock_list_comments_resp = mocker.MagicMock()
+    mock_list_comments_resp.parsed_data = [mock_comment]
+
+    mock_pull = mocker.MagicMock()
+    mock_pull.number = 2
+    mock_pulls_resp = mocker.MagicMock()
+    mock_pulls_resp.parsed_data = mock_pull
+
+    mock_docker = mocker.patch("src.providers.docker_test.DockerPluginTest.run")
+
+    with open(tmp_path / "plugins.json5", "w") as f:
+        json.dump([], f)
+
+    async with app.test_matcher() as ctx:
+        adapter, bot = get_github_bot(ctx)
+        event = get_mock_event(IssuesOpened)
+        event.payload.issue.labels = get_issue_labels(["Plugin", "Publish"])
+
+        ctx.receive_event(bot, event)
+        should_call_apis(
+            ctx,
+            [
+                {
+                    "api": "rest.apps.async_get_repo_installation",
+                    "result": mock_installation,
+                },
+                {
+                    "api": "rest.issues.async_get",
+                    "result": mock_issues_resp,
+                },
+                {
+                    "api": "rest.issues.async_list_comments",
+                    "result": mock_list_comments_resp,
+                },
+                {
+                    "api": "rest.issues.async_list_comments",
+                    "result": mock_list_comments_resp,
+                },
+                {
+                    "api": "rest.issues.async_update_comment",
+                    "result": None,
+                },
+                {
+                    "api": "rest.issues.async_update",
+                    "result": None,
+                },
+                {
+                    "api": "rest.pulls.async_create",
+                    "result": mock_pulls_resp,
+                },
+                {
+                    "api": "rest.issues.async_add_labels",
+                    "result": None,
+                },
+            ],
+            snapshot(
+                {
+                    0: {"owner": "he0119", "repo": "action-test"},
+                    1: {"owner": "he0119", "repo": "action-test", "issue_number": 80},
+                    2: {"owner": "he0119", "repo": "action-test", "issue_number": 80},
+                    3: {"owner": "he0119", "repo": "action-test", "issue_number": 80},
+                    4: {
+                        "owner": "he0119",
+                        "repo": "action-test",
+                        "comment_id": 123,
+                        "body": """\
+# 📃 商店发布检查结果
+
+> Plugin: name
+
+**✅ 所有测试通过，一切准备就绪！**
+
+
+<details>
+<summary>详情</summary>
+<pre><code><li>✅ 项目 <a href="https://nonebot.dev">主页</a> 返回状态码 200。</li><li>✅ 项目 <a href="https://pypi.org/project/project_link/">project_link</a> 已发布至 PyPI。</li><li>✅ 标签: test-#ffffff。</li><li>✅ 插件类型: application。</li><li>✅ 插件支持的适配器: 所有。</li><li>✅ 插件 <a href="https://github.com/owner/repo/actions/runs/123456">加载测试</a> 通过。</li><li>✅ 版本号: 1.0.0。</li><li>✅ 发布时间：2023-09-01 08:00:00 CST。</li></code></pre>
+</details>
+
+---
+
+💡 如需修改信息，请直接修改 issue，机器人会自动更新检查结果。
+💡 当插件加载测试失败时，请发布新版本后勾选插件测试勾选框重新运行插件测试。
+
+♻️ 评论已更新至最新检查结果
+
+💪 Powered by [NoneFlow](https://github.com/nonebot/noneflow)
+<!-- NONEFLOW -->
+<!-- NONEFLOW_STATE eJwtjlFuwyAQRO-y38jBcWJsX8bCsCS0mEVmiVRFvnsh7ddqNW_05g0-psIZljekg77Q8Bp8_IYFbtKNo5r7UQ3uPg1XELCTLQHXqHeswLTZYbpqJe-9tQpNBRgzr4ai848KbPPozGTcTSulpJvh_COa7IVH9hQr1Xeyk7UbSFtY-CgogArXVTVsUmRtNevW-jd_jgCL2dTvcwQ8acekHy1_Mqe8XC6RIm7EncVXG_eTWqhTCt5obnYBuaREB6NdqyRxXQVLLCGc5_kLgmNcKA== -->
+""",
+                    },
+                    5: {
+                        "owner": "he0119",
+                        "repo": "action-test",
+                        "issue_number": 80,
+                        "title": "Plugin: name",
+                    },
+                    6: {
+                        "owner": "he0119",
+                        "repo": "action-test",
+                        "title": "Plugin: name",
+                        "body": "resolve #80",
+                        "base": "master",
+                        "head": "publish/issue80",
+                    },
+                    7: {
+                        "owner": "he0119",
+                        "repo": "action-test",
+                        "issue_number": 2,
+                        "labels": ["Publish", "Plugin"],
+                    },
+                }
+            ),
+        )
+
+    assert_subprocess_run_calls(
+        mock_subprocess_run,
+        [
+            ["git", "config", "--global", "safe.directory", "*"],
+            ["git", "switch", "-C", "publish/issue80"],
+            ["git", "ls-remote", "--heads", "origin", "publish/issue80"],
+            ["git", "config", "--global", "user.name", "test"],
+            [
+                "git",
+                "config",
+                "--global",
+                "user.email",
+                "test@users.noreply.github.com",
+            ],
+            ["git", "add", "-A"],
+            ["git", "commit", "-m", ":beers: publish plugin name (#80)"],
+            ["git", "fetch", "origin"],
+            ["git", "diff", "origin/publish/issue80", "publish/issue80"],
+            ["git", "push", "origin", "publish/issue80", "-f"],
+        ],
+    )
+
+    # 没有运行插件测试
+    mock_docker.assert_not_called()
+
+
 async def test_plugin_process_publish_check_missing_metadata(
     app: App,
     mocker: MockerFixture,
@@ -571,6 +763,7 @@ async def test_plugin_process_publish_check_missing_metadata(
     mock_test_result.load = True
     mock_test_result.version = "1.0.0"
     mock_test_result.output = ""
+    mock_test_result.timings = {}
     mock_docker = mocker.patch("src.providers.docker_test.DockerPluginTest.run")
     mock_docker.return_value = mock_test_result
 
@@ -596,10 +789,6 @@ async def test_plugin_process_publish_check_missing_metadata(
                     "api": "rest.issues.async_get",
                     "result": mock_issues_resp,
                 },
-                {
-                    "api": "rest.issues.async_update",
-                    "result": None,
-                },
                 {
                     "api": "rest.issues.async_list_comments",
                     "result": mock_list_comments_resp,
@@ -608,6 +797,10 @@ async def test_plugin_process_publish_check_missing_metadata(
                     "api": "rest.issues.async_update",
                     "result": None,
                 },
+                {
+                    "api": "rest.issues.async_update",
+                    "result": None,
+                },
                 {
                     "api": "rest.issues.async_list_comments",
                     "result": mock_list_comments_resp,
@@ -629,7 +822,8 @@ async def test_plugin_process_publish_check_missing_metadata(
                 {
                     0: {"owner": "he0119", "repo": "action-test"},
                     1: {"owner": "he0119", "repo": "action-test", "issue_number": 80},
-                    2: {
+                    2: {"owner": "he0119", "repo": "action-test", "issue_number": 80},
+                    3: {
                         "owner": "he0119",
                         "repo": "action-test",
                         "issue_number": 80,
@@ -657,7 +851,6 @@ log_level=DEBUG
 - [x] 🔥插件测试中，请稍后\
 """,
                     },
-                    3: {"owner": "he0119", "repo": "action-test", "issue_number": 80},
                     4: {
                         "owner": "he0119",
                         "repo": "action-test",
@@ -714,6 +907,7 @@ log_level=DEBUG
 
 💪 Powered by [NoneFlow](https://github.com/nonebot/noneflow)
 <!-- NONEFLOW -->
+<!-- NONEFLOW_STATE eJwlzs0OgyAQBOB32bMx-AfIyxiEpaFFMLr0Ynz3rul5vsnMBTHvlU4wF-xHeaOjJcX8AQOjCFKquZNqCJMeemhgK74mXLLdkIFe_aB7q8TUea_QMSA8aXElh_hisM4yOO3CaJVSIsxw_8Uz9sXjjCWz6lrRCu6mYj0YOio2UCrxKw6fUSTrLVkwuaZ03z-ZeDgY -->
 """,
                     },
                     7: {
@@ -797,10 +991,6 @@ async def test_skip_plugin_check(
                     "api": "rest.issues.async_get",
                     "result": mock_issues_resp,
                 },
-                {
-                    "api": "rest.issues.async_update",
-                    "result": None,
-                },
                 {
                     "api": "rest.issues.async_list_comments",
                     "result": mock_list_comments_resp,
@@ -813,6 +1003,10 @@ async def test_skip_plugin_check(
                     "api": "rest.issues.async_update",
                     "result": None,
                 },
+                {
+                    "api": "rest.issues.async_update",
+                    "result": None,
+                },
                 {
                     "api": "rest.issues.async_list_comments",
                     "result": mock_list_comments_resp,
@@ -834,7 +1028,8 @@ async def test_skip_plugin_check(
                 {
                     0: {"owner": "he0119", "repo": "action-test"},
                     1: {"owner": "he0119", "repo": "action-test", "issue_number": 70},
-                    2: {
+                    2: {"owner": "he0119", "repo": "action-test", "issue_number": 70},
+                    3: {
                         "owner": "he0119",
                         "repo": "action-test",
                         "issue_number": 70,
@@ -862,7 +1057,6 @@ log_level=DEBUG
 - [x] 🔥插件测试中，请稍后\
 """,
                     },
-                    3: {"owner": "he0119", "repo": "action-test", "issue_number": 70},
                     4: {
                         "owner": "he0119",
                         "repo": "action-test",
@@ -967,6 +1161,7 @@ log_level=DEBUG
 
 💪 Powered by [NoneFlow](https://github.com/nonebot/noneflow)
 <!-- NONEFLOW -->
+<!-- NONEFLOW_STATE eJwlykEOgyAQAMC_7LkHFGWBzxCE3YYWwVQ4Gf8uSec8F6Ry9HaCveD41Q-F5nIqX7CwCFYKzaRQ8qrlDC_Ya-yZXPE7jaC3KPXsUaxTjEhhhEZnc6EWTu8RNqM46MCLR0TBBu7_AFt6zvcDh-Am1w== -->
 """,
                     },
                     8: {
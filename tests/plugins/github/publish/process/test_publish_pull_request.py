@@ -54,6 +54,7 @@ async def test_process_pull_request(
     mock_test_result.load = True
     mock_test_result.version = "1.0.0"
     mock_test_result.output = ""
+    mock_test_result.timings = {}
     mock_docker = mocker.patch("src.providers.docker_test.DockerPluginTest.run")
     mock_docker.return_value = mock_test_result
 
@@ -71,3 +71,49 @@ async def test_render_reuse(app: App):
 <!-- NONEFLOW -->
 """
     )
+
+
+async def test_render_summary_timings(app: App):
+    """工作流总结中展示各测试阶段耗时"""
+    from src.plugins.github.plugins.publish.render import render_summary
+    from src.providers.docker_test import DockerTestResult
+
+    test_result = DockerTestResult(
+        run=True,
+        load=True,
+        output="output",
+        version="0.1.0",
+        timings={
+            "create": {"wall": 12.34, "cpu": 8.0, "max_rss": 524288},
+            "load": {"wall": 2.0, "cpu": 1.52},
+        },
+    )
+
+    summary = await render_summary(test_result, "output", "project_link")
+    assert summary == snapshot(
+        """\
+# 📃 插件 project_link (0.1.0)
+
+> **✅ 插件已尝试运行**
+> **✅ 插件加载成功**
+
+## 插件元数据
+
+<pre><code>{}</code></pre>
+
+## 测试耗时
+
+| 阶段 | 耗时 | CPU 时间 | 峰值内存 |
+| --- | --- | --- | --- |
+| create | 12.3s | 8.0s | 512 MB |
+| load | 2.0s | 1.5s | - |
+
+## 插件输出
+
+<pre><code>output</code></pre>
+
+---
+
+💪 Powered by [NoneFlow](https://github.com/nonebot/noneflow)\
+"""
+    )
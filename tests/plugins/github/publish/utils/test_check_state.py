@@ -0,0 +1,140 @@
+from nonebug import App
+from pytest_mock import MockerFixture
+
+from tests.plugins.github.utils import MockBody, generate_issue_body_plugin_test_button
+
+
+def get_check_state():
+    from src.plugins.github.plugins.publish.check_state import (
+        CheckState,
+        PluginTestState,
+        hash_inputs,
+    )
+
+    return CheckState(
+        inputs=hash_inputs(
+            {
+                "module_name": "module_name",
+                "project_link": "project_link",
+                "test_config": "log_level=DEBUG",
+                "tags": '[{"label": "test", "color": "#ffffff"}]',
+            }
+        ),
+        test=PluginTestState(
+            version="1.0.0", load=False, output="加载失败\n" * 1000, metadata=None
+        ),
+    )
+
+
+async def test_check_state_from_comments(app: App, mocker: MockerFixture):
+    """从机器人的评论中读取检查状态，忽略其他评论"""
+    from src.plugins.github.constants import NONEFLOW_MARKER
+    from src.plugins.github.plugins.publish.check_state import CheckState
+
+    check_state = get_check_state()
+    check_state.test.output = "加载失败\n" * 700  # type: ignore
+    marker = check_state.to_marker()
+    # 测试输出经过压缩，避免评论超过长度限制
+    assert check_state.test
+    assert len(marker) < len(check_state.test.output) / 5
+
+    other_comment = mocker.MagicMock()
+    other_comment.body = marker
+    other_comment.performed_via_github_app.id = 1
+    # 其他用户伪造的检查状态
+    forged_comment = mocker.MagicMock()
+    forged_comment.body = f"评论\n{NONEFLOW_MARKER}\n{marker}\n"
+    forged_comment.performed_via_github_app = None
+    # 其他应用（如 github-actions[bot]）伪造的检查状态
+    forged_bot_comment = mocker.MagicMock()
+    forged_bot_comment.body = f"评论\n{NONEFLOW_MARKER}\n{marker}\n"
+    forged_bot_comment.performed_via_github_app.id = 15368
+    comment = mocker.MagicMock()
+    comment.body = f"评论\n{NONEFLOW_MARKER}\n{marker}\n"
+    comment.performed_via_github_app.id = 1
+
+    comments = [other_comment, forged_comment, forged_bot_comment, comment]
+    assert CheckState.from_comments(comments, 1) == check_state
+    assert CheckState.from_comments(comments[:-1], 1) is None
+
+    # 旧评论中没有检查状态
+    comment.body = f"评论\n{NONEFLOW_MARKER}\n"
+    assert CheckState.from_comments([comment], 1) is None
+
+    # 检查状态无法解析
+    comment.body = f"评论\n{NONEFLOW_MARKER}\n<!-- NONEFLOW_STATE invalid -->\n"
+    assert CheckState.from_comments([comment], 1) is None
+
+
+async def test_check_state_marker_limit(app: App, mocker: MockerFixture):
+    """插件测试输出过长时只保存末尾，标记仍然过大时不保存插件测试结果"""
+    from src.plugins.github.constants import NONEFLOW_MARKER
+    from src.plugins.github.plugins.publish.check_state import CheckState
+    from src.plugins.github.plugins.publish.constants import CHECK_STATE_OUTPUT_LIMIT
+
+    check_state = get_check_state()
+    assert check_state.test
+    check_state.test.output = "开始加载\n" * 10000 + "加载失败"
+    comment = mocker.MagicMock()
+    comment.body = f"{NONEFLOW_MARKER}\n{check_state.to_marker()}"
+    comment.performed_via_github_app.id = 1
+
+    state = CheckState.from_comments([comment], 1)
+    assert state
+    assert state.inputs == check_state.inputs
+    assert state.test
+    assert state.test.output.startswith("……\n")
+    assert state.test.output.endswith("加载失败")
+    assert len(state.test.output) < CHECK_STATE_OUTPUT_LIMIT + 5
+
+    # 保存插件测试结果后仍然过大
+    limit = len(CheckState(inputs=check_state.inputs).to_marker())
+    mocker.patch(
+        "src.plugins.github.plugins.publish.check_state.CHECK_STATE_MARKER_LIMIT",
+        limit,
+    )
+    marker = check_state.to_marker()
+    assert len(marker) <= limit
+    comment.body = f"{NONEFLOW_MARKER}\n{marker}"
+
+    state = CheckState.from_comments([comment], 1)
+    assert state
+    assert state.inputs == check_state.inputs
+    assert state.test is None
+
+
+async def test_check_state_reusable_test(app: App):
+    """只有插件测试相关的字段修改时才需要重新测试"""
+    from src.plugins.github.plugins.publish.check_state import hash_inputs
+
+    check_state = get_check_state()
+    raw_data = {
+        "module_name": "module_name",
+        "project_link": "project_link",
+        "test_config": "log_level=DEBUG",
+    }
+    # 只保存插件测试相关字段的哈希值
+    assert check_state.inputs.keys() == raw_data.keys()
+
+    # 只修改了标签
+    inputs = hash_inputs(raw_data | {"tags": "[]"})
+    assert check_state.reusable_test(inputs) == check_state.test
+
+    # 修改了插件配置项
+    inputs = hash_inputs(raw_data | {"test_config": ""})
+    assert check_state.reusable_test(inputs) is None
+
+    # 上次跳过了插件测试
+    check_state.test = None
+    assert check_state.reusable_test(check_state.inputs) is None
+
+
+async def test_is_retest_requested(app: App):
+    """勾选插件重测勾选框时需要重新测试"""
+    from src.plugins.github.plugins.publish.check_state import is_retest_requested
+
+    body = MockBody(type="plugin").generate()
+
+    assert is_retest_requested(generate_issue_body_plugin_test_button(body, True))
+    assert not is_retest_requested(generate_issue_body_plugin_test_button(body, False))
+    assert not is_retest_requested(body)
@@ -155,6 +155,74 @@ async def test_resolve_conflict_pull_requests_adapter(
     assert mocked_api["homepage"].called
 
 
+async def test_resolve_conflict_pull_requests_validate_many(
+    app: App, mocker: MockerFixture, mocked_api: MockRouter, tmp_path: Path
+) -> None:
+    """同一发布类型的拉取请求一起验证，商店数据只读取与索引一次"""
+    from src.plugins.github.handlers import GithubHandler
+    from src.plugins.github.models import RepoInfo
+    from src.plugins.github.plugins.publish.utils import resolve_conflict_pull_requests
+    from src.providers.utils import dump_json5
+    from src.providers.validation import utils
+
+    mock_subprocess_run = mocker.patch("subprocess.run")
+    mock_result = mocker.MagicMock()
+    mock_subprocess_run.side_effect = lambda *args, **kwargs: mock_result
+
+    mocked_build_previous_keys = mocker.patch.object(
+        utils, "build_previous_keys", wraps=utils.build_previous_keys
+    )
+
+    mock_label = mocker.MagicMock()
+    mock_label.name = "Adapter"
+
+    pulls = []
+    issues = []
+    for number, module_name in [(1, "module_name1"), (2, "module_name2")]:
+        mock_pull = mocker.MagicMock()
+        mock_pull.head.ref = f"publish/issue{number}"
+        mock_pull.draft = False
+        mock_pull.labels = [mock_label]
+        pulls.append(mock_pull)
+
+        mock_issue_repo = mocker.MagicMock()
+        mock_issue_repo.parsed_data = MockIssue(
+            number=number,
+            body=MockBody(type="adapter", module_name=module_name).generate(),
+            user=MockUser(login="he0119", id=1),
+        ).as_mock(mocker)
+        issues.append(mock_issue_repo)
+
+    dump_json5(tmp_path / "adapters.json5", [])
+
+    async with app.test_api() as ctx:
+        adapter, bot = get_github_bot(ctx)
+
+        handler = GithubHandler(bot=bot, repo_info=RepoInfo(owner="owner", repo="repo"))
+
+        for number, mock_issue_repo in enumerate(issues, 1):
+            ctx.should_call_api(
+                "rest.issues.async_get",
+                {"owner": "owner", "repo": "repo", "issue_number": number},
+                mock_issue_repo,
+            )
+
+        await resolve_conflict_pull_requests(handler, pulls)
+
+    mocked_build_previous_keys.assert_called_once_with([])
+    # 两个拉取请求都已更新
+    mock_subprocess_run.assert_any_call(
+        ["git", "commit", "-m", ":beers: publish adapter name (#1)"],
+        check=True,
+        capture_output=True,
+    )
+    mock_subprocess_run.assert_any_call(
+        ["git", "commit", "-m", ":beers: publish adapter name (#2)"],
+        check=True,
+        capture_output=True,
+    )
+
+
 async def test_resolve_conflict_pull_requests_bot(
     app: App, mocker: MockerFixture, mocked_api: MockRouter, tmp_path: Path, mock_pull
 ) -> None:
@@ -324,6 +392,7 @@ async def test_resolve_conflict_pull_requests_plugin(
     )
     mock_test_result.version = "1.0.0"
     mock_test_result.output = ""
+    mock_test_result.timings = {}
     mock_docker = mocker.patch("src.providers.docker_test.DockerPluginTest.run")
     mock_docker.return_value = mock_test_result
 
@@ -467,6 +536,7 @@ async def test_resolve_conflict_pull_requests_plugin_not_valid(
     mock_test_result.load = False
     mock_test_result.metadata = None
     mock_test_result.output = ""
+    mock_test_result.timings = {}
     mock_docker = mocker.patch("src.providers.docker_test.DockerPluginTest.run")
     mock_docker.return_value = mock_test_result
 
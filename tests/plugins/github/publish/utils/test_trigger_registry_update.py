@@ -47,6 +47,7 @@ async def test_trigger_registry_update(
     mock_test_result.load = True
     mock_test_result.version = "1.0.0"
     mock_test_result.output = ""
+    mock_test_result.timings = {}
     mock_docker = mocker.patch("src.providers.docker_test.DockerPluginTest.run")
     mock_docker.return_value = mock_test_result
 
@@ -313,6 +314,7 @@ async def test_trigger_registry_update_plugins_issue_body_info_missing(
     )
     mock_test_result.load = True
     mock_test_result.output = ""
+    mock_test_result.timings = {}
     mock_docker = mocker.patch("src.providers.docker_test.DockerPluginTest.run")
     mock_docker.return_value = mock_test_result
 
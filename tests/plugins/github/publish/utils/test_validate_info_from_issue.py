@@ -81,6 +81,7 @@ async def test_validate_info_from_issue_plugin(
     mock_test_result.version = "1.0.0"
     mock_test_result.load = True
     mock_test_result.output = 'require("nonebot_plugin_alconna")\ntest'
+    mock_test_result.timings = {}
     mock_docker = mocker.patch("src.providers.docker_test.DockerPluginTest.run")
     mock_docker.return_value = mock_test_result
 
@@ -172,3 +173,49 @@ async def test_validate_info_from_issue_plugin_skip_test(
 
     assert result.valid
     assert mocked_api["homepage"].called
+
+
+async def test_validate_info_from_issue_bot_profile(
+    app: App, mocker: MockerFixture, mocked_api: MockRouter
+):
+    """开启耗时记录时，将最慢的字段添加到作业摘要"""
+    from src.plugins.github import plugin_config
+    from src.plugins.github.plugins.publish.validation import (
+        validate_bot_info_from_issue,
+    )
+
+    mocker.patch.object(plugin_config, "validation_profile", True)
+    mocker.patch(
+        "src.providers.validation.profile_validation",
+    ).return_value.__enter__.return_value = {
+        "name": 0.001,
+        "homepage": 1.5,
+        "prevent_duplication": 0.002,
+        "tags": 0.01,
+        "desc": 0.0,
+        "author": 0.0,
+    }
+
+    mock_issue = mocker.MagicMock()
+    mock_issue.body = generate_issue_body_bot()
+    mock_issue.user.login = "test"
+
+    result = await validate_bot_info_from_issue(mock_issue)
+
+    assert result.valid
+    assert plugin_config.github_step_summary.read_text(encoding="utf-8") == snapshot(
+        """\
+# ⏱️ Bot: name 验证耗时
+
+> 共 1.513s
+
+| 字段 | 耗时 |
+| --- | --- |
+| 项目仓库/主页链接 | 1.500s |
+| 标签 | 0.010s |
+| prevent_duplication | 0.002s |
+| 名称 | 0.001s |
+| 描述 | 0.000s |
+
+"""
+    )
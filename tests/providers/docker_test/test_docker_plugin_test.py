@@ -1,25 +1,34 @@
+import asyncio
 import json
+import threading
 
+import pytest
 from inline_snapshot import snapshot
 from pytest_mock import MockerFixture
 from respx import MockRouter
 
 
 async def test_docker_plugin_test(mocked_api: MockRouter, mocker: MockerFixture):
+    from src.providers.constants import PLUGIN_TEST_LOCK_DIR, PLUGIN_TEST_WHEELHOUSE
     from src.providers.docker_test import DockerPluginTest, DockerTestResult
 
+    mocked_container = mocker.Mock()
+    mocked_container.attrs = {"State": {"OOMKilled": False}}
+    mocked_container.logs.return_value = [
+        json.dumps(
+            {
+                "metadata": None,
+                "output": "test",
+                "load": True,
+                "run": True,
+                "version": "0.0.1",
+                "config": "",
+                "test_env": "python==3.12",
+            }
+        ).encode()
+    ]
     mocked_run = mocker.Mock()
-    mocked_run.return_value = json.dumps(
-        {
-            "metadata": None,
-            "output": "test",
-            "load": True,
-            "run": True,
-            "version": "0.0.1",
-            "config": "",
-            "test_env": "python==3.12",
-        }
-    ).encode()
+    mocked_run.return_value = mocked_container
     mocked_client = mocker.Mock()
     mocked_client.containers.run = mocked_run
     mocked_docker = mocker.patch("docker.DockerClient")
@@ -48,18 +57,32 @@ async def test_docker_plugin_test(mocked_api: MockRouter, mocker: MockerFixture)
                 "PROJECT_LINK": "project_link",
                 "MODULE_NAME": "module_name",
                 "PLUGIN_CONFIG": "",
+                "PLUGIN_WHEELHOUSE": "/wheels",
+                "PLUGIN_LOCK_DIR": "/locks",
+                "PLUGIN_INDEX": '{"nonebot-plugin-datastore":"nonebot_plugin_datastore","nonebot-plugin-treehelp":"nonebot_plugin_treehelp"}',
                 "PYTHON_VERSION": "3.12",
             }
         ),
-        detach=False,
-        remove=True,
+        volumes={
+            "noneflow-cache": {"bind": "/root/.cache", "mode": "rw"},
+            PLUGIN_TEST_WHEELHOUSE: {"bind": "/wheels", "mode": "ro"},
+            PLUGIN_TEST_LOCK_DIR: {"bind": "/locks", "mode": "rw"},
+        },
+        nano_cpus=1000000000,
+        mem_limit=2147483648,
+        detach=True,
     )
+    mocked_container.logs.assert_called_once_with(
+        stream=True, follow=True, stdout=True, stderr=False
+    )
+    mocked_container.remove.assert_called_once_with(force=True)
 
 
 async def test_docker_plugin_test_exception(
     mocked_api: MockRouter, mocker: MockerFixture
 ):
     """插件测试时报错"""
+    from src.providers.constants import PLUGIN_TEST_LOCK_DIR, PLUGIN_TEST_WHEELHOUSE
     from src.providers.docker_test import DockerPluginTest, DockerTestResult
 
     mocked_run = mocker.Mock()
@@ -89,11 +112,20 @@ async def test_docker_plugin_test_exception(
                 "PROJECT_LINK": "project_link",
                 "MODULE_NAME": "module_name",
                 "PLUGIN_CONFIG": "",
+                "PLUGIN_WHEELHOUSE": "/wheels",
+                "PLUGIN_LOCK_DIR": "/locks",
+                "PLUGIN_INDEX": '{"nonebot-plugin-datastore":"nonebot_plugin_datastore","nonebot-plugin-treehelp":"nonebot_plugin_treehelp"}',
                 "PYTHON_VERSION": "3.12",
             }
         ),
-        detach=False,
-        remove=True,
+        volumes={
+            "noneflow-cache": {"bind": "/root/.cache", "mode": "rw"},
+            PLUGIN_TEST_WHEELHOUSE: {"bind": "/wheels", "mode": "ro"},
+            PLUGIN_TEST_LOCK_DIR: {"bind": "/locks", "mode": "rw"},
+        },
+        nano_cpus=1000000000,
+        mem_limit=2147483648,
+        detach=True,
     )
 
 
@@ -101,26 +133,32 @@ async def test_docker_plugin_test_metadata_some_fields_empty(
     mocked_api: MockRouter, mocker: MockerFixture
 ):
     """测试 metadata 的部分字段为空"""
+    from src.providers.constants import PLUGIN_TEST_LOCK_DIR, PLUGIN_TEST_WHEELHOUSE
     from src.providers.docker_test import DockerPluginTest, DockerTestResult
 
+    mocked_container = mocker.Mock()
+    mocked_container.attrs = {"State": {"OOMKilled": False}}
+    mocked_container.logs.return_value = [
+        json.dumps(
+            {
+                "metadata": {
+                    "name": "name",
+                    "desc": "desc",
+                    "homepage": None,
+                    "type": None,
+                    "supported_adapters": None,
+                },
+                "output": "test",
+                "load": True,
+                "run": True,
+                "version": "0.0.1",
+                "config": "",
+                "test_env": "python==3.12",
+            }
+        ).encode()
+    ]
     mocked_run = mocker.Mock()
-    mocked_run.return_value = json.dumps(
-        {
-            "metadata": {
-                "name": "name",
-                "desc": "desc",
-                "homepage": None,
-                "type": None,
-                "supported_adapters": None,
-            },
-            "output": "test",
-            "load": True,
-            "run": True,
-            "version": "0.0.1",
-            "config": "",
-            "test_env": "python==3.12",
-        }
-    ).encode()
+    mocked_run.return_value = mocked_container
     mocked_client = mocker.Mock()
     mocked_client.containers.run = mocked_run
     mocked_docker = mocker.patch("docker.DockerClient")
@@ -155,11 +193,20 @@ async def test_docker_plugin_test_metadata_some_fields_empty(
                 "PROJECT_LINK": "project_link",
                 "MODULE_NAME": "module_name",
                 "PLUGIN_CONFIG": "",
+                "PLUGIN_WHEELHOUSE": "/wheels",
+                "PLUGIN_LOCK_DIR": "/locks",
+                "PLUGIN_INDEX": '{"nonebot-plugin-datastore":"nonebot_plugin_datastore","nonebot-plugin-treehelp":"nonebot_plugin_treehelp"}',
                 "PYTHON_VERSION": "3.12",
             }
         ),
-        detach=False,
-        remove=True,
+        volumes={
+            "noneflow-cache": {"bind": "/root/.cache", "mode": "rw"},
+            PLUGIN_TEST_WHEELHOUSE: {"bind": "/wheels", "mode": "ro"},
+            PLUGIN_TEST_LOCK_DIR: {"bind": "/locks", "mode": "rw"},
+        },
+        nano_cpus=1000000000,
+        mem_limit=2147483648,
+        detach=True,
     )
 
 
@@ -167,26 +214,32 @@ async def test_docker_plugin_test_metadata_some_fields_invalid(
     mocked_api: MockRouter, mocker: MockerFixture
 ):
     """测试 metadata 的部分字段不符合规范"""
+    from src.providers.constants import PLUGIN_TEST_LOCK_DIR, PLUGIN_TEST_WHEELHOUSE
     from src.providers.docker_test import DockerPluginTest, DockerTestResult, Metadata
 
+    mocked_container = mocker.Mock()
+    mocked_container.attrs = {"State": {"OOMKilled": False}}
+    mocked_container.logs.return_value = [
+        json.dumps(
+            {
+                "metadata": {
+                    "name": "name",
+                    "desc": "desc",
+                    "homepage": 12,
+                    "type": True,
+                    "supported_adapters": {},
+                },
+                "output": "test",
+                "load": True,
+                "run": True,
+                "version": "0.0.1",
+                "config": "",
+                "test_env": "python==3.12",
+            }
+        ).encode()
+    ]
     mocked_run = mocker.Mock()
-    mocked_run.return_value = json.dumps(
-        {
-            "metadata": {
-                "name": "name",
-                "desc": "desc",
-                "homepage": 12,
-                "type": True,
-                "supported_adapters": {},
-            },
-            "output": "test",
-            "load": True,
-            "run": True,
-            "version": "0.0.1",
-            "config": "",
-            "test_env": "python==3.12",
-        }
-    ).encode()
+    mocked_run.return_value = mocked_container
     mocked_client = mocker.Mock()
     mocked_client.containers.run = mocked_run
     mocked_docker = mocker.patch("docker.DockerClient")
@@ -221,9 +274,432 @@ async def test_docker_plugin_test_metadata_some_fields_invalid(
                 "PROJECT_LINK": "project_link",
                 "MODULE_NAME": "module_name",
                 "PLUGIN_CONFIG": "",
+                "PLUGIN_WHEELHOUSE": "/wheels",
+                "PLUGIN_LOCK_DIR": "/locks",
+                "PLUGIN_INDEX": '{"nonebot-plugin-datastore":"nonebot_plugin_datastore","nonebot-plugin-treehelp":"nonebot_plugin_treehelp"}',
                 "PYTHON_VERSION": "3.12",
             }
         ),
-        detach=False,
-        remove=True,
+        volumes={
+            "noneflow-cache": {"bind": "/root/.cache", "mode": "rw"},
+            PLUGIN_TEST_WHEELHOUSE: {"bind": "/wheels", "mode": "ro"},
+            PLUGIN_TEST_LOCK_DIR: {"bind": "/locks", "mode": "rw"},
+        },
+        nano_cpus=1000000000,
+        mem_limit=2147483648,
+        detach=True,
+    )
+
+
+async def test_docker_plugin_test_container_failed(
+    mocked_api: MockRouter, mocker: MockerFixture
+):
+    """容器运行过程中报错，也需要删除容器"""
+    from src.providers.docker_test import DockerPluginTest, DockerTestResult
+
+    mocked_container = mocker.Mock()
+    mocked_container.attrs = {"State": {"OOMKilled": False}}
+    mocked_container.logs.side_effect = Exception("Container failed")
+    mocked_client = mocker.Mock()
+    mocked_client.containers.run.return_value = mocked_container
+    mocked_docker = mocker.patch("docker.DockerClient")
+    mocked_docker.return_value = mocked_client
+
+    test = DockerPluginTest("project_link", "module_name")
+    result = await test.run("3.12")
+
+    assert result == snapshot(
+        DockerTestResult(run=False, load=False, output="Container failed")
+    )
+
+    mocked_container.remove.assert_called_once_with(force=True)
+
+
+async def test_docker_plugin_test_cancelled(
+    mocked_api: MockRouter, mocker: MockerFixture
+):
+    """取消测试时，需要停止并删除容器"""
+    from src.providers.docker_test import DockerPluginTest
+
+    started = threading.Event()
+    finished = threading.Event()
+
+    def logs(**kwargs):
+        started.set()
+        finished.wait(5)
+        yield b""
+
+    mocked_container = mocker.Mock()
+    mocked_container.attrs = {"State": {"OOMKilled": False}}
+    mocked_container.logs.side_effect = logs
+    mocked_container.remove.side_effect = lambda force: finished.set()
+    mocked_client = mocker.Mock()
+    mocked_client.containers.run.return_value = mocked_container
+    mocked_docker = mocker.patch("docker.DockerClient")
+    mocked_docker.return_value = mocked_client
+
+    test = DockerPluginTest("project_link", "module_name")
+    task = asyncio.create_task(test.run("3.12"))
+
+    await asyncio.to_thread(started.wait, 5)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    mocked_container.remove.assert_called_once_with(force=True)
+
+
+async def test_docker_plugin_test_cancelled_while_creating(
+    mocked_api: MockRouter, mocker: MockerFixture
+):
+    """创建容器时取消测试，创建完成的容器也需要删除"""
+    from src.providers.docker_test import DockerPluginTest
+
+    started = threading.Event()
+    cancelled = threading.Event()
+    removed = threading.Event()
+
+    mocked_container = mocker.Mock()
+    mocked_container.remove.side_effect = lambda force: removed.set()
+
+    def run(*args, **kwargs):
+        started.set()
+        cancelled.wait(5)
+        return mocked_container
+
+    mocked_client = mocker.Mock()
+    mocked_client.containers.run.side_effect = run
+    mocked_docker = mocker.patch("docker.DockerClient")
+    mocked_docker.return_value = mocked_client
+
+    test = DockerPluginTest("project_link", "module_name")
+    task = asyncio.create_task(test.run("3.12"))
+
+    await asyncio.to_thread(started.wait, 5)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    cancelled.set()
+
+    assert await asyncio.to_thread(removed.wait, 5)
+    mocked_container.remove.assert_called_once_with(force=True)
+    mocked_container.logs.assert_not_called()
+
+
+async def test_docker_plugin_test_events(mocked_api: MockRouter, mocker: MockerFixture):
+    """逐行读取容器输出的事件"""
+    from src.providers.docker_test import DockerPluginTest, DockerTestResult
+
+    events = [
+        {"event": "phase_started", "phase": "create", "timeout": 300},
+        {"event": "output", "text": "项目 project_link 创建成功。"},
+        {
+            "event": "phase_finished",
+            "phase": "create",
+            "success": True,
+            "wall": 1.5,
+            "cpu": 1.0,
+            "max_rss": 1024,
+        },
+        {"event": "metadata", "metadata": None},
+        {
+            "event": "result",
+            "result": {
+                "metadata": None,
+                "output": "项目 project_link 创建成功。",
+                "load": True,
+                "run": True,
+                "version": "0.0.1",
+                "config": "",
+                "test_env": "python==3.12",
+            },
+        },
+    ]
+    data = "".join(json.dumps(event, ensure_ascii=False) + "\n" for event in events)
+    data = data.encode()
+    # 数据块不一定按行分割
+    chunks = [data[i : i + 7] for i in range(0, len(data), 7)]
+
+    mocked_container = mocker.Mock()
+    mocked_container.attrs = {"State": {"OOMKilled": False}}
+    mocked_container.logs.return_value = chunks
+    mocked_client = mocker.Mock()
+    mocked_client.containers.run.return_value = mocked_container
+    mocked_docker = mocker.patch("docker.DockerClient")
+    mocked_docker.return_value = mocked_client
+
+    test = DockerPluginTest("project_link", "module_name")
+    result = await test.run("3.12")
+
+    assert result == snapshot(
+        DockerTestResult(
+            config="",
+            load=True,
+            metadata=None,
+            output="项目 project_link 创建成功。",
+            run=True,
+            test_env="python==3.12",
+            version="0.0.1",
+            timings={"create": {"wall": 1.5, "cpu": 1.0, "max_rss": 1024}},
+        )
     )
+    mocked_container.remove.assert_called_once_with(force=True)
+
+
+async def test_docker_plugin_test_phase_timeout(
+    mocked_api: MockRouter, mocker: MockerFixture
+):
+    """测试阶段超时后停止容器"""
+    from src.providers.docker_test import DockerPluginTest, DockerTestResult
+
+    finished = threading.Event()
+
+    def logs(**kwargs):
+        yield b'{"event": "phase_started", "phase": "create", "timeout": 0}\n'
+        yield b'{"event": "output", "text": "Resolving dependencies..."}\n'
+        finished.wait(5)
+
+    mocked_container = mocker.Mock()
+    mocked_container.attrs = {"State": {"OOMKilled": False}}
+    mocked_container.logs.side_effect = logs
+    mocked_container.remove.side_effect = lambda force: finished.set()
+    mocked_client = mocker.Mock()
+    mocked_client.containers.run.return_value = mocked_container
+    mocked_docker = mocker.patch("docker.DockerClient")
+    mocked_docker.return_value = mocked_client
+    mocker.patch("src.providers.docker_test.PHASE_TIMEOUT_GRACE", 0.1)
+
+    test = DockerPluginTest("project_link", "module_name")
+    result = await test.run("3.12")
+
+    assert result == snapshot(
+        DockerTestResult(
+            run=False,
+            load=False,
+            output="""\
+Resolving dependencies...
+测试阶段 create 超时\
+""",
+        )
+    )
+    mocked_container.remove.assert_called_once_with(force=True)
+
+
+async def test_docker_plugin_test_restore_then_timeout(
+    mocked_api: MockRouter, mocker: MockerFixture
+):
+    """恢复测试环境后加载插件超时，仍然视为已运行测试"""
+    from src.providers.docker_test import DockerPluginTest, DockerTestResult
+
+    finished = threading.Event()
+
+    def logs(**kwargs):
+        yield b'{"event": "phase_started", "phase": "restore", "timeout": 300}\n'
+        yield b'{"event": "phase_finished", "phase": "restore", "success": true, "wall": 1.0, "cpu": 0.5}\n'
+        yield b'{"event": "phase_started", "phase": "load", "timeout": 0}\n'
+        finished.wait(5)
+
+    mocked_container = mocker.Mock()
+    mocked_container.attrs = {"State": {"OOMKilled": False}}
+    mocked_container.logs.side_effect = logs
+    mocked_container.remove.side_effect = lambda force: finished.set()
+    mocked_client = mocker.Mock()
+    mocked_client.containers.run.return_value = mocked_container
+    mocked_docker = mocker.patch("docker.DockerClient")
+    mocked_docker.return_value = mocked_client
+    mocker.patch("src.providers.docker_test.PHASE_TIMEOUT_GRACE", 0.1)
+
+    test = DockerPluginTest("project_link", "module_name")
+    result = await test.run("3.12", reuse_environment=True)
+
+    assert result == snapshot(
+        DockerTestResult(
+            run=True,
+            load=False,
+            output="测试阶段 load 超时",
+            timings={"restore": {"wall": 1.0, "cpu": 0.5}},
+        )
+    )
+    mocked_container.remove.assert_called_once_with(force=True)
+
+
+async def test_docker_plugin_test_phase_timeout_many(
+    mocked_api: MockRouter, mocker: MockerFixture
+):
+    """同时卡住的测试多于默认线程池的线程数时，仍能删除所有容器"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from src.providers.docker_test import DockerPluginTest
+
+    finished = threading.Event()
+
+    def logs(**kwargs):
+        yield b'{"event": "phase_started", "phase": "create", "timeout": 0}\n'
+        finished.wait(30)
+
+    def run(image: str, **kwargs):
+        mocked_container = mocker.Mock()
+        mocked_container.attrs = {"State": {"OOMKilled": False}}
+        mocked_container.logs.side_effect = logs
+        return mocked_container
+
+    mocked_client = mocker.Mock()
+    mocked_client.containers.run.side_effect = run
+    mocked_docker = mocker.patch("docker.DockerClient")
+    mocked_docker.return_value = mocked_client
+    mocker.patch("src.providers.docker_test.PHASE_TIMEOUT_GRACE", 0.1)
+
+    # 事件循环在测试间共享，测试结束后恢复原来的默认线程池
+    executor = ThreadPoolExecutor(max_workers=2)
+    mocker.patch.object(asyncio.get_running_loop(), "_default_executor", executor)
+    try:
+        tests = [
+            DockerPluginTest("project_link", "module_name", cpus=0.01, memory=1)
+            for _ in range(4)
+        ]
+        results = await asyncio.wait_for(
+            asyncio.gather(*(test.run("3.12") for test in tests)), 10
+        )
+    finally:
+        finished.set()
+        executor.shutdown(wait=False)
+
+    assert [result.output for result in results] == ["测试阶段 create 超时"] * 4
+    assert mocked_client.containers.run.call_count == 4
+
+
+async def test_docker_plugin_test_matrix(mocked_api: MockRouter, mocker: MockerFixture):
+    """在多个测试环境中同时测试插件"""
+    from src.providers.docker_test import DockerPluginTest, MatrixCell
+
+    def run(image: str, environment: dict[str, str], **kwargs):
+        mocked_container = mocker.Mock()
+        mocked_container.attrs = {"State": {"OOMKilled": False}}
+        mocked_container.logs.return_value = [
+            json.dumps(
+                {
+                    "metadata": None,
+                    "output": environment.get("PLUGIN_CONSTRAINTS", ""),
+                    "load": True,
+                    "run": True,
+                    "version": "0.0.1",
+                    "config": "",
+                    "test_env": f"python=={environment['PYTHON_VERSION']}",
+                }
+            ).encode()
+        ]
+        return mocked_container
+
+    mocked_client = mocker.Mock()
+    mocked_client.containers.run.side_effect = run
+    mocked_docker = mocker.patch("docker.DockerClient")
+    mocked_docker.return_value = mocked_client
+
+    test = DockerPluginTest("project_link", "module_name")
+    results = await test.run_matrix(
+        [
+            MatrixCell(python="3.12"),
+            MatrixCell(python="3.13", constraints=["pydantic<2.0"]),
+        ]
+    )
+
+    assert [(result.test_env, result.output) for result in results] == snapshot(
+        [("python==3.12", ""), ("python==3.13", '["pydantic<2.0"]')]
+    )
+    # 所有测试环境共用同一个 Docker 客户端
+    mocked_docker.assert_called_once()
+
+
+async def test_docker_plugin_test_oom_killed(
+    mocked_api: MockRouter, mocker: MockerFixture
+):
+    """容器因内存不足被终止"""
+    from src.providers.docker_test import DockerPluginTest, DockerTestResult
+
+    mocked_container = mocker.Mock()
+    mocked_container.attrs = {"State": {"OOMKilled": True}}
+    mocked_container.logs.return_value = [
+        b'{"event": "phase_started", "phase": "create", "timeout": 300}\n',
+        b'{"event": "phase_finished", "phase": "create", "success": true}\n',
+        b'{"event": "phase_started", "phase": "load", "timeout": 600}\n',
+    ]
+    mocked_client = mocker.Mock()
+    mocked_client.containers.run.return_value = mocked_container
+    mocked_docker = mocker.patch("docker.DockerClient")
+    mocked_docker.return_value = mocked_client
+
+    test = DockerPluginTest("project_link", "module_name", cpus=0.5, memory=1024**3)
+    result = await test.run("3.12")
+
+    assert result == snapshot(
+        DockerTestResult(
+            run=True, load=False, output="测试因内存不足被终止", oom_killed=True
+        )
+    )
+    assert mocked_client.containers.run.call_args.kwargs["nano_cpus"] == 500000000
+    assert mocked_client.containers.run.call_args.kwargs["mem_limit"] == 1024**3
+    mocked_container.remove.assert_called_once_with(force=True)
+
+
+async def test_docker_plugin_test_without_plugin_index(
+    mocked_api: MockRouter, mocker: MockerFixture
+):
+    """插件索引获取失败时，不传递给测试"""
+    from src.providers.constants import REGISTRY_PLUGINS_URL
+    from src.providers.docker_test import DockerPluginTest
+
+    mocked_registry = mocked_api.get(REGISTRY_PLUGINS_URL).respond(404)
+
+    mocked_container = mocker.Mock()
+    mocked_container.attrs = {"State": {"OOMKilled": False}}
+    mocked_container.logs.return_value = []
+    mocked_run = mocker.Mock()
+    mocked_run.return_value = mocked_container
+    mocked_client = mocker.Mock()
+    mocked_client.containers.run = mocked_run
+    mocked_docker = mocker.patch("docker.DockerClient")
+    mocked_docker.return_value = mocked_client
+
+    test = DockerPluginTest("project_link", "module_name")
+    await test.run("3.12")
+
+    assert mocked_registry.called
+    assert "PLUGIN_INDEX" not in mocked_run.call_args.kwargs["environment"]
+
+
+async def test_get_phase_timeouts():
+    """根据上次耗时计算各测试阶段的超时时间"""
+    from src.providers.docker_test import get_phase_timeouts
+
+    assert get_phase_timeouts(None) == {}
+    assert get_phase_timeouts(
+        {
+            "create": {"wall": 10.0, "cpu": 8.0},
+            "introspect": {"wall": 40.2, "cpu": 1.0},
+            "load": {"wall": 3.0, "cpu": 2.0},
+            "dependencies": {"wall": 100.0, "cpu": 2.0},
+        }
+    ) == snapshot({"create": 120, "introspect": 161, "load": 120, "dependencies": 300})
+
+
+async def test_docker_plugin_test_timeouts(
+    mocked_api: MockRouter, mocker: MockerFixture
+):
+    """将各测试阶段的超时时间传递给测试"""
+    from src.providers.docker_test import DockerPluginTest
+
+    mocked_container = mocker.Mock()
+    mocked_container.attrs = {"State": {"OOMKilled": False}}
+    mocked_container.logs.return_value = []
+    mocked_run = mocker.Mock()
+    mocked_run.return_value = mocked_container
+    mocked_client = mocker.Mock()
+    mocked_client.containers.run = mocked_run
+    mocked_docker = mocker.patch("docker.DockerClient")
+    mocked_docker.return_value = mocked_client
+
+    test = DockerPluginTest("project_link", "module_name", timeouts={"load": 120})
+    await test.run("3.12")
+
+    environment = mocked_run.call_args.kwargs["environment"]
+    assert json.loads(environment["PLUGIN_TIMEOUTS"]) == {"load": 120}
@@ -0,0 +1,135 @@
+import sys
+from pathlib import Path
+
+import pytest
+from inline_snapshot import snapshot
+from pytest_mock import MockerFixture
+
+
+def script_command(script: str) -> list[str]:
+    return [sys.executable, "-c", script]
+
+
+async def test_local_plugin_test(mocker: MockerFixture):
+    """在本地进程中测试插件"""
+    from src.providers.docker_test import DockerTestResult
+    from src.providers.docker_test.local import LocalPluginTest
+
+    result = {
+        "run": True,
+        "load": True,
+        "output": "",
+        "version": "0.3.0",
+        "config": "",
+        "test_env": "python==3.12.7",
+        "metadata": None,
+    }
+    script = f"""
+import json
+def emit(**data):
+    print(json.dumps(data), flush=True)
+emit(event="phase_started", phase="create", timeout=300)
+emit(event="phase_finished", phase="create", success=True)
+emit(event="result", result={result!r})
+"""
+    mocker.patch("src.providers.docker_test.local.TEST_COMMAND", script_command(script))
+
+    test = LocalPluginTest("project_link", "module_name")
+    assert await test.run("3.12") == snapshot(
+        DockerTestResult(
+            run=True,
+            load=True,
+            output="",
+            version="0.3.0",
+            config="",
+            test_env="python==3.12.7",
+        )
+    )
+
+
+async def test_local_plugin_test_limits(mocker: MockerFixture):
+    """测试进程只限制数据段大小，不限制地址空间"""
+    from src.providers.docker_test.local import LocalPluginTest
+
+    script = """
+import json, resource
+limits = [resource.getrlimit(resource.RLIMIT_DATA)[0], resource.getrlimit(resource.RLIMIT_AS)[0], resource.getrlimit(resource.RLIMIT_CORE)[0]]
+print(json.dumps({"event": "result", "result": {"run": True, "load": True, "output": json.dumps(limits)}}), flush=True)
+"""
+    mocker.patch("src.providers.docker_test.local.TEST_COMMAND", script_command(script))
+
+    test = LocalPluginTest("project_link", "module_name", memory=1024**3)
+    result = await test.run("3.12")
+
+    assert result.output == snapshot("[1073741824, -1, 0]")
+
+
+async def test_local_plugin_test_output(mocker: MockerFixture):
+    """测试进程的环境变量与工作目录"""
+    from src.providers.docker_test.local import LocalPluginTest
+
+    script = """
+import json, os
+print(json.dumps({"event": "output", "text": os.getcwd()}), flush=True)
+print(json.dumps({"event": "output", "text": os.environ["MODULE_NAME"]}), flush=True)
+"""
+    mocker.patch("src.providers.docker_test.local.TEST_COMMAND", script_command(script))
+
+    test = LocalPluginTest("project_link", "module_name")
+    result = await test.run("3.12")
+
+    test_dir, module_name, message = result.output.splitlines()
+    assert Path(test_dir).name.startswith("noneflow-plugin-test-")
+    assert not Path(test_dir).exists()
+    assert module_name == "module_name"
+    assert message == "未获取到测试结果"
+    assert not result.run
+    assert not result.load
+
+
+async def test_local_plugin_test_phase_timeout(mocker: MockerFixture):
+    """测试阶段超时后终止测试进程"""
+    from src.providers.docker_test.local import LocalPluginTest, stop_process
+
+    script = """
+import json, time
+print(json.dumps({"event": "phase_started", "phase": "create", "timeout": 0}), flush=True)
+time.sleep(60)
+"""
+    mocker.patch("src.providers.docker_test.local.TEST_COMMAND", script_command(script))
+    mocker.patch("src.providers.docker_test.PHASE_TIMEOUT_GRACE", 0.1)
+    mocked_stop_process = mocker.patch(
+        "src.providers.docker_test.local.stop_process", wraps=stop_process
+    )
+
+    test = LocalPluginTest("project_link", "module_name")
+    result = await test.run("3.12")
+
+    assert result.output == snapshot("测试阶段 create 超时")
+    mocked_stop_process.assert_called_once()
+    process = mocked_stop_process.call_args.args[0]
+    assert process.returncode == -9
+
+
+async def test_get_plugin_test():
+    from src.providers.docker_test import DockerPluginTest, get_plugin_test
+    from src.providers.docker_test.local import LocalPluginTest
+
+    assert isinstance(get_plugin_test("project_link", "module_name"), DockerPluginTest)
+    assert isinstance(
+        get_plugin_test("project_link", "module_name", backend="local"),
+        LocalPluginTest,
+    )
+    with pytest.raises(ValueError, match="不支持的插件测试后端"):
+        get_plugin_test("project_link", "module_name", backend="unknown")
+
+
+async def test_plugin_test_backend_abstract():
+    """未实现 _run 的后端无法实例化"""
+    from src.providers.docker_test import PluginTestBackend
+
+    class IncompleteBackend(PluginTestBackend):
+        pass
+
+    with pytest.raises(TypeError, match="_run"):
+        IncompleteBackend("project_link", "module_name")  # type: ignore
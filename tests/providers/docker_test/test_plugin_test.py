@@ -1,11 +1,16 @@
 import json
+import sys
 from pathlib import Path
 
+import pytest
 from inline_snapshot import snapshot
 from pytest_mock import MockerFixture
 
 
-async def test_plugin_test(mocker: MockerFixture, tmp_path: Path):
+async def test_plugin_test(
+    mocker: MockerFixture, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+):
+    """测试环境信息获取失败时，通过 poetry 获取"""
     from src.providers.docker_test.plugin_test import PluginTest
 
     test = PluginTest("3.12", "project_link", "module_name", "test=123")
@@ -13,6 +18,9 @@ async def test_plugin_test(mocker: MockerFixture, tmp_path: Path):
     mocker.patch.object(test, "_test_dir", tmp_path / "plugin_test")
 
     def command_output(cmd: str, timeout: int = 300):
+        if cmd.startswith("uv python"):
+            # 解释器无法安装时不使用基础环境模板
+            return (False, "", "error: No interpreter found")
         if (
             cmd
             == 'uv venv --python 3.12 && poetry init -n --python "~3.12" && poetry env info --ansi && poetry add project_link'
@@ -60,6 +68,9 @@ async def test_plugin_test(mocker: MockerFixture, tmp_path: Path):
     Writing lock file""",
                 "",
             )
+        if cmd == ".venv/bin/python introspect.py project_link":
+            # 无法获取测试环境信息时回退为通过 poetry 获取
+            return (False, "", "No such file or directory")
         if cmd == "poetry show project_link":
             # show_package_info
             return (
@@ -84,7 +95,7 @@ pydantic==2.10.0 ; python_version >= "3.9" and python_version < "4.0"
                     """,
                 "",
             )
-        if cmd == "poetry run python runner.py":
+        if cmd == "poetry run python -X importtime runner.py":
             # run_plugin_test
             with open(tmp_path / "plugin_test" / "metadata.json", "w") as f:
                 json.dump(
@@ -98,7 +109,22 @@ pydantic==2.10.0 ; python_version >= "3.9" and python_version < "4.0"
                     },
                     f,
                 )
-            return (True, "", "")
+            with open(tmp_path / "plugin_test" / "profile.json", "w") as f:
+                json.dump(
+                    {"load_time": 0.123, "base_rss": 1048576, "peak_rss": 2097152},
+                    f,
+                )
+            return (
+                True,
+                "",
+                """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 | nonebot
+noneflow: start loading plugin
+import time:       300 |        300 |   nonebot_plugin_alconna
+import time:       200 |        500 | nonebot_plugin_treehelp
+""",
+            )
         if cmd == "poetry run python --version":
             return (True, "Python 3.12.7", "")
 
@@ -111,8 +137,27 @@ pydantic==2.10.0 ; python_version >= "3.9" and python_version < "4.0"
         "src.providers.docker_test.plugin_test.get_plugin_list"
     )
     mocked_get_plugin_list.return_value = {}
+    mocker.patch(
+        "src.providers.docker_test.plugin_test.get_latest_version",
+        return_value=None,
+    )
 
     result = await test.run()
+
+    # 每个测试阶段都记录了耗时
+    timings = result.pop("timings")
+    assert sorted(timings) == snapshot(
+        [
+            "create",
+            "dependencies",
+            "introspect",
+            "load",
+            "package_info",
+            "python_version",
+        ]
+    )
+    assert all(timing["wall"] >= 0 for timing in timings.values())
+
     assert result == snapshot(
         {
             "metadata": {
@@ -162,6 +207,8 @@ pydantic==2.10.0 ; python_version >= "3.9" and python_version < "4.0"
           - Installing nonebot-plugin-treehelp (0.5.0)
     
         Writing lock file
+测试环境信息获取失败。
+    No such file or directory
 插件 project_link 的信息如下：
     name         : nonebot-plugin-treehelp
          version      : 0.5.0
@@ -178,8 +225,515 @@ pydantic==2.10.0 ; python_version >= "3.9" and python_version < "4.0"
             "version": "0.5.0",
             "config": "test=123",
             "test_env": "python==3.12.7 nonebot2==2.4.0 pydantic==2.10.0",
+            "profile": {
+                "load_time": 0.123,
+                "base_rss": 1048576,
+                "peak_rss": 2097152,
+                "import_times": {
+                    "nonebot_plugin_alconna": 300,
+                    "nonebot_plugin_treehelp": 200,
+                },
+            },
         }
     )
 
     mocked_get_plugin_list.assert_called_once()
     mocked_command.assert_called()
+
+    # 测试过程中逐行输出事件
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [
+        (event["event"], event.get("phase"))
+        for event in events
+        if event["event"] != "output"
+    ] == snapshot(
+        [
+            ("phase_started", "create"),
+            ("phase_finished", "create"),
+            ("phase_started", "introspect"),
+            ("phase_finished", "introspect"),
+            ("phase_started", "package_info"),
+            ("phase_finished", "package_info"),
+            ("phase_started", "dependencies"),
+            ("phase_finished", "dependencies"),
+            ("phase_started", "python_version"),
+            ("phase_finished", "python_version"),
+            ("phase_started", "load"),
+            ("phase_finished", "load"),
+            ("metadata", None),
+            ("result", None),
+        ]
+    )
+    assert events[-1] == {"event": "result", "result": {**result, "timings": timings}}
+
+
+async def test_plugin_test_introspect(mocker: MockerFixture, tmp_path: Path):
+    """通过一次脚本运行获取测试环境信息"""
+    from src.providers.docker_test.plugin_test import PluginTest
+
+    test = PluginTest("3.12", "nonebot-plugin-treehelp", "nonebot_plugin_treehelp")
+    test_dir = tmp_path / "plugin_test"
+    test_dir.mkdir()
+    mocker.patch.object(test, "_test_dir", test_dir)
+
+    mocked_command = mocker.patch.object(test, "command")
+    mocked_command.return_value = (
+        True,
+        json.dumps(
+            {
+                "python": "3.12.7",
+                "packages": {
+                    "nonebot-plugin-alconna": "0.54.0",
+                    "nonebot-plugin-treehelp": "0.5.0",
+                    "nonebot2": "2.4.0",
+                    "pydantic": "2.10.0",
+                },
+                "version": "0.5.0",
+            }
+        ),
+        "",
+    )
+    mocked_get_plugin_list = mocker.patch(
+        "src.providers.docker_test.plugin_test.get_plugin_list"
+    )
+    mocked_get_plugin_list.return_value = {
+        "nonebot-plugin-alconna": "nonebot_plugin_alconna",
+        "nonebot-plugin-treehelp": "nonebot_plugin_treehelp",
+    }
+
+    assert await test.introspect_environment()
+
+    mocked_command.assert_called_once_with(
+        ".venv/bin/python introspect.py nonebot-plugin-treehelp", 300
+    )
+    assert (test_dir / "introspect.py").exists()
+    assert test._version == "0.5.0"
+    assert test._test_python_version == "3.12.7"
+    assert test._deps == ["nonebot_plugin_alconna"]
+    assert test._test_env == ["nonebot2==2.4.0", "pydantic==2.10.0"]
+
+
+async def test_plugin_test_plugin_index(mocker: MockerFixture):
+    """使用主机提供的插件索引，不再从商店获取"""
+    from src.providers.docker_test.plugin_test import PluginTest
+
+    test = PluginTest(
+        "3.12",
+        "nonebot-plugin-treehelp",
+        "nonebot_plugin_treehelp",
+        plugin_index={"nonebot-plugin-alconna": "nonebot_plugin_alconna"},
+    )
+    mocked_get_plugin_list = mocker.patch(
+        "src.providers.docker_test.plugin_test.get_plugin_list"
+    )
+
+    assert test._get_deps({"nonebot-plugin-alconna": "0.54.0", "httpx": "0.28.1"}) == [
+        "nonebot_plugin_alconna"
+    ]
+
+    mocked_get_plugin_list.assert_not_called()
+
+
+async def test_introspect_script(tmp_path: Path):
+    """获取测试环境信息的脚本"""
+    import asyncio
+    import platform
+    import subprocess
+    import sys
+    from importlib import metadata
+
+    from src.providers.docker_test.render import render_introspect
+
+    script = tmp_path / "introspect.py"
+    script.write_text(await render_introspect(), encoding="utf-8")
+
+    stdout = await asyncio.to_thread(
+        subprocess.check_output,
+        [sys.executable, str(script), "Inline_Snapshot"],
+        text=True,
+    )
+    data = json.loads(stdout)
+
+    assert data["python"] == platform.python_version()
+    assert data["version"] == metadata.version("inline-snapshot")
+    assert data["packages"]["inline-snapshot"] == data["version"]
+
+
+async def test_plugin_test_template(mocker: MockerFixture, tmp_path: Path):
+    """基础环境模板只构建一次，之后的测试直接复制"""
+    from src.providers.docker_test.plugin_test import PluginTest
+
+    template_dir = tmp_path / "templates"
+    commands: list[str] = []
+
+    def command_output(cmd: str, timeout: int = 300):
+        commands.append(cmd)
+        if cmd == "uv python find 3.12":
+            return (True, "/usr/local/bin/python3.12\n", "")
+        if cmd.startswith("uv venv --relocatable"):
+            # 模拟构建模板
+            (template_dir / cmd.split()[5].rsplit("/", 1)[-1]).mkdir()
+            return (True, "", "")
+        return (True, "", "")
+
+    versions = {"nonebot2": "2.4.0"}
+    mocker.patch(
+        "src.providers.docker_test.plugin_test.get_latest_version",
+        side_effect=versions.get,
+    )
+
+    for name in ["first", "second"]:
+        test = PluginTest("3.12", "project_link", "module_name")
+        mocker.patch.object(test, "_test_dir", tmp_path / name)
+        mocker.patch.object(test, "_template_dir", template_dir)
+        mocked_command = mocker.patch.object(test, "command")
+        mocked_command.side_effect = command_output
+
+        await test.create_poetry_project()
+
+    templates = list(template_dir.iterdir())
+    assert len(templates) == 1
+    template = templates[0]
+
+    # 第一次测试构建模板，第二次直接复制
+    # 安装插件后移除插件未依赖的模板预装包
+    assert len(commands) == 5
+    assert commands[1].startswith(
+        f"uv venv --relocatable --python /usr/local/bin/python3.12 {template}-"
+    )
+    assert commands[1].endswith("/bin/python nonebot2==2.4.0")
+    assert commands[2] == (
+        f"cp -a --reflink=auto {template} .venv"
+        ' && poetry init -n --python "~3.12" && poetry env info --ansi'
+        " && poetry add project_link && poetry install --sync --no-root"
+    )
+    assert commands[3] == "uv python find 3.12"
+    assert commands[4] == commands[2]
+
+    # NoneBot 发布新版本后构建新的模板
+    versions["nonebot2"] = "2.4.1"
+    test = PluginTest("3.12", "project_link", "module_name")
+    mocker.patch.object(test, "_test_dir", tmp_path / "third")
+    mocker.patch.object(test, "_template_dir", template_dir)
+    mocker.patch.object(test, "command", side_effect=command_output)
+    await test.create_poetry_project()
+
+    assert len(list(template_dir.iterdir())) == 2
+    assert commands[6].endswith("/bin/python nonebot2==2.4.1")
+
+
+async def test_plugin_test_template_install_python(
+    mocker: MockerFixture, tmp_path: Path
+):
+    """镜像中没有对应版本的解释器时先由 uv 安装，仍然使用模板"""
+    from src.providers.docker_test.constants import PYTHON_INSTALL_DIR
+    from src.providers.docker_test.plugin_test import PluginTest
+
+    template_dir = tmp_path / "templates"
+    commands: list[str] = []
+    installed = False
+    install_success = True
+
+    def command_output(cmd: str, timeout: int = 300):
+        nonlocal installed
+        commands.append(cmd)
+        if cmd == "uv python find 3.12":
+            if installed:
+                return (True, f"{PYTHON_INSTALL_DIR}/cpython-3.12/bin/python3.12\n", "")
+            return (False, "", "error: No interpreter found for Python 3.12")
+        if cmd == "uv python install 3.12 && uv python find 3.12":
+            if not install_success:
+                return (False, "", "error: Failed to download")
+            installed = True
+            return (True, f"{PYTHON_INSTALL_DIR}/cpython-3.12/bin/python3.12\n", "")
+        return (True, "", "")
+
+    mocker.patch(
+        "src.providers.docker_test.plugin_test.get_latest_version",
+        return_value="2.4.0",
+    )
+
+    async def create() -> PluginTest:
+        test = PluginTest("3.12", "project_link", "module_name")
+        mocker.patch.object(test, "_template_dir", template_dir)
+        mocker.patch.object(test, "command", side_effect=command_output)
+        return test
+
+    # 安装失败时不使用模板
+    install_success = False
+    test = await create()
+    assert await test.prepare_template() is None
+    assert commands == [
+        "uv python find 3.12",
+        "uv python install 3.12 && uv python find 3.12",
+    ]
+
+    # 安装后使用新安装的解释器构建模板
+    install_success = True
+    commands.clear()
+    test = await create()
+    assert await test.prepare_template()
+    assert commands[1] == "uv python install 3.12 && uv python find 3.12"
+    assert commands[2].startswith(
+        f"uv venv --relocatable --python {PYTHON_INSTALL_DIR}/cpython-3.12/bin/python3.12 "
+    )
+
+    # 解释器安装在缓存卷中，之后的容器直接找到
+    commands.clear()
+    test = await create()
+    await test.prepare_template()
+    assert commands[0] == "uv python find 3.12"
+    assert "uv python install 3.12 && uv python find 3.12" not in commands
+    assert test.env["UV_PYTHON_INSTALL_DIR"] == str(PYTHON_INSTALL_DIR)
+
+
+async def test_plugin_test_template_packages(mocker: MockerFixture):
+    """基础依赖固定为最新版本，已有约束时以约束为准"""
+    from src.providers.docker_test.plugin_test import PluginTest
+
+    mocked_version = mocker.patch(
+        "src.providers.docker_test.plugin_test.get_latest_version",
+        return_value="2.4.0",
+    )
+
+    test = PluginTest("3.12", "project_link", "module_name")
+    assert test.template_packages() == ["nonebot2==2.4.0"]
+
+    test = PluginTest(
+        "3.12", "project_link", "module_name", constraints=["NoneBot2==2.3.0"]
+    )
+    assert test.template_packages() == ["NoneBot2==2.3.0"]
+
+    # 无法获取最新版本时不使用模板
+    mocked_version.return_value = None
+    test = PluginTest("3.12", "project_link", "module_name")
+    assert test.template_packages() is None
+
+
+async def test_plugin_test_lock(mocker: MockerFixture, tmp_path: Path):
+    """同一版本重新测试时使用保存的锁文件安装，安装失败时重新解析依赖"""
+    from src.providers.docker_test.plugin_test import PluginTest
+
+    lock_dir = tmp_path / "locks"
+    commands: list[str] = []
+    timeouts: list[int] = []
+    install_success = True
+
+    def command_output(cmd: str, timeout: int = 300):
+        commands.append(cmd)
+        timeouts.append(timeout)
+        if cmd.endswith("poetry add project_link"):
+            # 重新解析依赖前需要清理锁文件，否则 poetry init 会失败
+            assert not (test._test_dir / "pyproject.toml").exists()
+            # 模拟解析依赖后生成的项目文件
+            (test._test_dir / "pyproject.toml").write_text("pyproject")
+            (test._test_dir / "poetry.lock").write_text("lock")
+        if cmd.endswith("poetry install --no-root"):
+            assert (test._test_dir / "poetry.lock").read_text() == "lock"
+            return (install_success, "", "")
+        return (True, "", "")
+
+    mocker.patch(
+        "src.providers.docker_test.plugin_test.get_latest_version",
+        return_value="0.5.0",
+    )
+
+    async def create(name: str) -> PluginTest:
+        # 锁文件目录由主机挂载并传入
+        test = PluginTest("3.12", "project_link", "module_name", lock_dir=str(lock_dir))
+        mocker.patch.object(test, "_test_dir", tmp_path / name)
+        mocker.patch.object(test, "prepare_template", return_value=None)
+        mocker.patch.object(test, "command", side_effect=command_output)
+        return test
+
+    # 首次测试解析依赖并保存锁文件
+    test = await create("first")
+    await test.create_poetry_project()
+    test._version = "0.5.0"
+    test.save_lock()
+    assert (test.lock_path("0.5.0") / "poetry.lock").read_text() == "lock"
+    assert len(list(lock_dir.iterdir())) == 1
+
+    # 重新测试时直接按锁文件安装
+    test = await create("second")
+    await test.create_poetry_project()
+    assert test._create
+    assert commands[-1] == (
+        "uv venv --python 3.12 && poetry env info --ansi && poetry install --no-root"
+    )
+
+    # 按锁文件安装失败时重新解析依赖
+    install_success = False
+    test = await create("third")
+    await test.create_poetry_project()
+    assert test._create
+    assert commands[-2].endswith("poetry install --no-root")
+    assert commands[-1].endswith("poetry add project_link")
+    # 重新解析依赖时使用单独的阶段，有完整的超时时间
+    assert timeouts[-2:] == [180, 300]
+    assert test._timings.keys() == {"lock", "create"}
+
+
+async def test_plugin_test_reuse_environment(mocker: MockerFixture, tmp_path: Path):
+    """仅修改插件配置重新测试时复用之前安装好的测试环境"""
+    from src.providers.docker_test.plugin_test import PluginTest
+
+    commands: list[str] = []
+    mocked_latest_version = mocker.patch(
+        "src.providers.docker_test.plugin_test.get_latest_version",
+        return_value="0.5.0",
+    )
+
+    async def create(name: str, config: str) -> PluginTest:
+        test = PluginTest(
+            "3.12",
+            "project_link",
+            "module_name",
+            config,
+            plugin_index={"nonebot-plugin-alconna": "nonebot_plugin_alconna"},
+            reuse_environment=True,
+        )
+        mocker.patch.object(test, "_test_dir", tmp_path / name)
+        mocker.patch.object(test, "_lock_dir", tmp_path / "locks")
+        mocker.patch.object(test, "_env_dir", tmp_path / "envs")
+        mocker.patch.object(test, "prepare_template", return_value=None)
+        real_command = test.command
+
+        async def command(cmd: str, timeout: int = 300):  # noqa: ASYNC109
+            commands.append(cmd)
+            if cmd.startswith("cp "):
+                return await real_command(cmd, timeout)
+            if cmd.endswith("poetry add project_link"):
+                (test._test_dir / ".venv").mkdir()
+            if cmd.startswith(".venv/bin/python introspect.py"):
+                return (
+                    True,
+                    json.dumps(
+                        {
+                            "python": "3.12.7",
+                            "packages": {
+                                "nonebot-plugin-alconna": "0.54.0",
+                                "nonebot2": "2.4.0",
+                            },
+                            "version": "0.5.0",
+                        }
+                    ),
+                    "",
+                )
+            return (True, "", "")
+
+        mocker.patch.object(test, "command", side_effect=command)
+        return test
+
+    # 首次测试时安装并保存测试环境
+    test = await create("first", "a=1")
+    await test.run()
+    assert any(cmd.endswith("poetry add project_link") for cmd in commands)
+    assert (test.environment_path() / ".venv").is_dir()
+    # 保存的测试环境中不包含加载插件的结果
+    assert not (test.environment_path() / ".env.prod").exists()
+
+    # 修改配置后直接恢复测试环境，只重新加载插件
+    commands.clear()
+    test = await create("second", "a=2")
+    result = await test.run()
+    assert commands[1:] == ["poetry run python -X importtime runner.py"]
+    assert (test._test_dir / ".venv").is_dir()
+    assert (test._test_dir / ".env.prod").read_text() == "a=2"
+    assert result["version"] == "0.5.0"
+    assert result["test_env"] == "python==3.12.7 nonebot2==2.4.0"
+    assert test._deps == ["nonebot_plugin_alconna"]
+    assert "restore" in result["timings"]
+
+    # 插件发布新版本后重新安装
+    commands.clear()
+    mocked_latest_version.return_value = "0.6.0"
+    test = await create("third", "a=3")
+    await test.run()
+    assert not commands[0].startswith("cp ")
+    assert any(cmd.endswith("poetry add project_link") for cmd in commands)
+
+
+async def test_plugin_test_wheelhouse(mocker: MockerFixture, tmp_path: Path):
+    """优先从预先下载的分发文件安装插件"""
+    from src.providers.docker_test.plugin_test import PluginTest
+
+    test = PluginTest(
+        "3.12", "project_link", "module_name", wheelhouse=str(tmp_path / "wheels")
+    )
+    # 目录不存在时直接从 PyPI 安装
+    assert test.prefetched_install == ""
+
+    (tmp_path / "wheels").mkdir()
+    assert test.prefetched_install == (
+        "(uv pip install --python .venv/bin/python --no-deps --no-index"
+        f" --find-links {tmp_path / 'wheels'} project_link || true) && "
+    )
+
+
+async def test_plugin_test_command_timeout(mocker: MockerFixture, tmp_path: Path):
+    """命令超时后终止整个进程组，包括忽略了 SIGTERM 的子进程"""
+    from src.providers.docker_test.plugin_test import PluginTest
+
+    mocker.patch("src.providers.docker_test.plugin_test.COMMAND_KILL_GRACE", 0.5)
+
+    test = PluginTest("3.12", "project_link", "module_name")
+    mocker.patch.object(test, "_test_dir", tmp_path)
+
+    code, stdout, _ = await test.command(
+        "(trap '' TERM; sleep 30) & echo $!; wait", timeout=1
+    )
+
+    assert not code
+    assert stdout.startswith("执行命令超时\n")
+    pid = int(stdout.splitlines()[1])
+    # 子进程已被终止，最多残留为僵尸进程
+    stat = Path(f"/proc/{pid}/stat")
+    assert not stat.exists() or stat.read_text().split()[2] == "Z"
+
+
+async def test_plugin_test_phase_usage(mocker: MockerFixture, tmp_path: Path):
+    """记录测试阶段的资源使用情况"""
+    from src.providers.docker_test.plugin_test import PluginTest
+
+    test = PluginTest("3.12", "project_link", "module_name")
+    mocker.patch.object(test, "_test_dir", tmp_path)
+
+    # 之前的阶段使用较多内存
+    code, _, _ = await test.run_phase(
+        "create", f"{sys.executable} -c 'b = bytearray(256 * 1024 ** 2)'"
+    )
+    assert code
+    assert test._timings["create"]["max_rss"] >= 256 * 1024
+
+    # 之后的阶段只记录自身命令的内存
+    code, _, _ = await test.run_phase(
+        "load", f"{sys.executable} -c 'b = bytearray(64 * 1024 ** 2)'"
+    )
+    assert code
+    assert 64 * 1024 <= test._timings["load"]["max_rss"] < 256 * 1024
+    assert test._timings["load"]["wall"] >= 0
+
+    # 不在测试阶段中执行的命令不记录
+    assert await test.command("true") == (True, "", "")
+    assert test._timings.keys() == {"create", "load"}
+
+
+async def test_plugin_test_phase_timeout(
+    mocker: MockerFixture, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+):
+    """使用指定的阶段超时时间，未指定的阶段使用默认值"""
+    from src.providers.docker_test.plugin_test import PluginTest
+
+    test = PluginTest("3.12", "project_link", "module_name", timeouts={"load": 120})
+    mocker.patch.object(test, "_test_dir", tmp_path)
+    mocked_command = mocker.patch.object(test, "command", return_value=(True, "", ""))
+
+    await test.run_phase("load", "load")
+    await test.run_phase("create", "create")
+
+    mocked_command.assert_has_calls(
+        [mocker.call("load", 120), mocker.call("create", 300)]
+    )
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [event["timeout"] for event in events if "timeout" in event] == [120, 300]
@@ -10,6 +10,9 @@ async def test_render_runner(app: App):
     assert comment == snapshot(
         """\
 import json
+import resource
+import sys
+import time
 
 from nonebot import init, load_plugin, logger, require
 from pydantic import BaseModel
@@ -23,7 +26,20 @@ class SetEncoder(json.JSONEncoder):
 
 
 init()
+# 标记插件开始加载，之后输出的导入耗时均由加载插件产生
+print("noneflow: start loading plugin", file=sys.stderr, flush=True)
+base_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
 plugin = load_plugin("nonebot_plugin_treehelp")
+with open("profile.json", "w", encoding="utf-8") as f:
+    json.dump(
+        {
+            "load_time": round(time.perf_counter() - start, 3),
+            "base_rss": base_rss * 1024,
+            "peak_rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+        },
+        f,
+    )
 
 if not plugin:
     exit(1)
@@ -0,0 +1,88 @@
+import asyncio
+from pathlib import Path
+
+from inline_snapshot import snapshot
+from pytest_mock import MockerFixture
+
+
+def test_capacity_cgroup_v2(tmp_path: Path, mocker: MockerFixture):
+    """从 cgroup v2 获取容量"""
+    from src.providers.docker_test import scheduler
+
+    (tmp_path / "cpu.max").write_text("150000 100000\n")
+    (tmp_path / "memory.max").write_text(f"{4 * 1024**3}\n")
+    meminfo = tmp_path / "meminfo"
+    meminfo.write_text("MemTotal:       16384000 kB\nMemAvailable:    8192000 kB\n")
+    mocker.patch.object(scheduler, "CGROUP_PATH", tmp_path)
+    mocker.patch.object(scheduler, "PROC_MEMINFO_PATH", meminfo)
+    mocker.patch("os.sched_getaffinity", return_value={0, 1, 2, 3})
+
+    assert scheduler.get_cpu_capacity() == 1.5
+    assert scheduler.get_memory_capacity() == 4 * 1024**3
+
+
+def test_capacity_unlimited(tmp_path: Path, mocker: MockerFixture):
+    """cgroup 不限制时使用主机容量"""
+    from src.providers.docker_test import scheduler
+
+    (tmp_path / "cpu.max").write_text("max 100000\n")
+    (tmp_path / "memory.max").write_text("max\n")
+    meminfo = tmp_path / "meminfo"
+    meminfo.write_text("MemTotal:       16384000 kB\nMemAvailable:    8192000 kB\n")
+    mocker.patch.object(scheduler, "CGROUP_PATH", tmp_path)
+    mocker.patch.object(scheduler, "PROC_MEMINFO_PATH", meminfo)
+    mocker.patch("os.sched_getaffinity", return_value={0, 1, 2, 3})
+
+    assert scheduler.get_cpu_capacity() == 4
+    assert scheduler.get_memory_capacity() == 8192000 * 1024
+
+
+def test_capacity_cgroup_v1(tmp_path: Path, mocker: MockerFixture):
+    """从 cgroup v1 获取容量"""
+    from src.providers.docker_test import scheduler
+
+    (tmp_path / "cpu").mkdir()
+    (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("200000\n")
+    (tmp_path / "cpu" / "cpu.cfs_period_us").write_text("100000\n")
+    (tmp_path / "memory").mkdir()
+    (tmp_path / "memory" / "memory.limit_in_bytes").write_text(f"{1024**3}\n")
+    mocker.patch.object(scheduler, "CGROUP_PATH", tmp_path)
+    mocker.patch.object(scheduler, "PROC_MEMINFO_PATH", tmp_path / "meminfo")
+    mocker.patch("os.sched_getaffinity", return_value={0, 1, 2, 3})
+
+    assert scheduler.get_cpu_capacity() == 2
+    assert scheduler.get_memory_capacity() == 1024**3
+
+
+async def test_scheduler_reserve():
+    """剩余容量不足时等待其他测试结束"""
+    from src.providers.docker_test.scheduler import ResourceScheduler
+
+    scheduler = ResourceScheduler(cpus=2, memory=4)
+    events: list[str] = []
+
+    async def worker(name: str, cpus: float, memory: int):
+        async with scheduler.reserve(cpus, memory):
+            events.append(f"{name} start")
+            await asyncio.sleep(0.01)
+            events.append(f"{name} end")
+
+    await asyncio.gather(
+        worker("a", 1, 2),
+        worker("b", 1, 2),
+        worker("c", 1, 1),
+    )
+
+    assert events == snapshot(
+        ["a start", "b start", "a end", "b end", "c start", "c end"]
+    )
+
+
+async def test_scheduler_reserve_exceed_capacity():
+    """单个测试超过主机容量时也能运行"""
+    from src.providers.docker_test.scheduler import ResourceScheduler
+
+    scheduler = ResourceScheduler(cpus=1, memory=1)
+
+    async with scheduler.reserve(4, 8):
+        pass
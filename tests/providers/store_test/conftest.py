@@ -29,5 +29,7 @@ def mocked_store_data(
     mocker.patch.object(store, "DRIVERS_PATH", paths["drivers"])
     mocker.patch.object(store, "PLUGINS_PATH", paths["plugins"])
     mocker.patch.object(store, "PLUGIN_CONFIG_PATH", paths["plugin_configs"])
+    # 预先下载插件分发文件单独测试
+    mocker.patch.object(store, "prefetch_distributions", return_value={})
 
     return paths
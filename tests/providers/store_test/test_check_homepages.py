@@ -0,0 +1,114 @@
+import json
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from inline_snapshot import snapshot
+from pytest_mock import MockerFixture
+from respx import MockRouter
+
+
+async def test_check_homepages(
+    tmp_path: Path, mocked_api: MockRouter, mocker: MockerFixture
+) -> None:
+    """检查商店中所有项目主页，保存报告并添加作业摘要"""
+    from src.providers.constants import TIME_ZONE
+    from src.providers.store_test.homepages import run_check_homepages
+
+    mock_datetime = mocker.patch("src.providers.store_test.homepages.datetime")
+    mock_datetime.now.return_value = datetime(2023, 8, 23, 9, 22, 14, tzinfo=TIME_ZONE)
+
+    def check_homepage(url: str, save: bool = True) -> tuple[int, str]:
+        assert save is False
+        if url == "https://github.com/he0119/nonebot-plugin-treehelp":
+            return 404, ""
+        return 200, ""
+
+    mock_check = mocker.patch(
+        "src.providers.store_test.homepages.check_homepage", side_effect=check_homepage
+    )
+    mock_save = mocker.patch("src.providers.store_test.homepages.save_homepage_cache")
+    mock_summary = mocker.patch("src.providers.store_test.homepages.add_step_summary")
+
+    output = tmp_path / "homepages.json"
+    await run_check_homepages(output)
+
+    # 内置驱动器的文档路径不需要检查
+    assert sorted(call.args[0] for call in mock_check.call_args_list) == snapshot(
+        [
+            "https://github.com/he0119/CoolQBot",
+            "https://github.com/he0119/nonebot-plugin-datastore",
+            "https://github.com/he0119/nonebot-plugin-treehelp",
+            "https://onebot.adapters.nonebot.dev/",
+        ]
+    )
+    mock_save.assert_called_once_with()
+    assert json.loads(output.read_text(encoding="utf-8")) == snapshot(
+        {
+            "time": "2023-08-23 09:22:14 CST",
+            "total": 4,
+            "failed": {
+                "https://github.com/he0119/nonebot-plugin-treehelp": {
+                    "status_code": 404,
+                    "msg": "",
+                    "keys": ["nonebot-plugin-treehelp:nonebot_plugin_treehelp"],
+                }
+            },
+        }
+    )
+    mock_summary.assert_called_once_with(
+        snapshot("""\
+# 🏠 项目主页检查结果
+
+> 📅 2023-08-23 09:22:14 CST
+> ♻️ 共检查 4 个项目主页
+> ✅ 可以访问：3 个
+> ❌ 无法访问：1 个
+
+## 无法访问的项目主页
+
+| 项目主页 | 状态码 | 商店数据 |
+| --- | --- | --- |
+| https://github.com/he0119/nonebot-plugin-treehelp | 404 | nonebot-plugin-treehelp:nonebot_plugin_treehelp |
+""")
+    )
+
+
+async def test_check_homepages_host_limit(mocker: MockerFixture) -> None:
+    """同一网站的请求数量受限，不同网站同时检查，缓存中的结果不发送请求"""
+    from src.providers.store_test.homepages import check_homepages
+
+    lock = threading.Lock()
+    running: dict[str, int] = {}
+    max_running: dict[str, int] = {}
+
+    def check_homepage(url: str, save: bool = True) -> tuple[int, str]:
+        host = url.split("/")[2]
+        with lock:
+            running[host] = running.get(host, 0) + 1
+            max_running[host] = max(max_running.get(host, 0), running[host])
+        time.sleep(0.05)
+        with lock:
+            running[host] -= 1
+        return 200, ""
+
+    mocker.patch(
+        "src.providers.store_test.homepages.check_homepage", side_effect=check_homepage
+    )
+    mocker.patch(
+        "src.providers.store_test.homepages.get_cached_status",
+        side_effect=lambda url: (404, "") if url.endswith("cached") else None,
+    )
+    mocker.patch("src.providers.store_test.homepages.save_homepage_cache")
+
+    homepages = [f"https://a.com/{i}" for i in range(4)] + [
+        f"https://b.com/{i}" for i in range(4)
+    ]
+    results = await check_homepages(
+        [*homepages, "https://c.com/cached"], host_concurrency=1, delay=0.01
+    )
+
+    assert results["https://c.com/cached"] == (404, "")
+    assert all(results[homepage] == (200, "") for homepage in homepages)
+    assert max_running == {"a.com": 1, "b.com": 1}
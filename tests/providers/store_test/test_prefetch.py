@@ -0,0 +1,58 @@
+from pathlib import Path
+
+import httpx
+from respx import MockRouter
+
+
+def test_select_distribution():
+    """优先选择通用的 wheel，其次为源码包"""
+    from src.providers.store_test.prefetch import select_distribution
+
+    sdist = {"packagetype": "sdist", "filename": "test-0.1.0.tar.gz"}
+    wheel = {"packagetype": "bdist_wheel", "filename": "test-0.1.0-py3-none-any.whl"}
+    binary = {
+        "packagetype": "bdist_wheel",
+        "filename": "test-0.1.0-cp312-cp312-win_amd64.whl",
+    }
+
+    assert select_distribution([sdist, binary, wheel]) == wheel
+    assert select_distribution([binary, sdist]) == sdist
+    assert select_distribution([binary]) is None
+
+
+async def test_prefetch_distributions(respx_mock: MockRouter, tmp_path: Path):
+    """同时下载多个插件的分发文件，下载失败的插件跳过"""
+    from src.providers.store_test.prefetch import prefetch_distributions
+
+    respx_mock.get("https://pypi.org/pypi/nonebot-plugin-treehelp/json").respond(
+        json={
+            "urls": [
+                {
+                    "packagetype": "bdist_wheel",
+                    "filename": "nonebot_plugin_treehelp-0.5.0-py3-none-any.whl",
+                    "url": "https://files.pythonhosted.org/treehelp.whl",
+                }
+            ]
+        }
+    )
+    download = respx_mock.get("https://files.pythonhosted.org/treehelp.whl").respond(
+        content=b"wheel"
+    )
+    respx_mock.get("https://pypi.org/pypi/nonebot-plugin-wordcloud/json").mock(
+        side_effect=httpx.ConnectTimeout
+    )
+
+    wheelhouse = tmp_path / "wheels"
+    paths = await prefetch_distributions(
+        ["nonebot-plugin-treehelp", "nonebot-plugin-wordcloud"], wheelhouse
+    )
+
+    wheel = wheelhouse / "nonebot_plugin_treehelp-0.5.0-py3-none-any.whl"
+    assert paths == {"nonebot-plugin-treehelp": wheel}
+    assert wheel.read_bytes() == b"wheel"
+    # 没有残留的临时文件
+    assert list(wheelhouse.iterdir()) == [wheel]
+
+    # 已经下载过的文件不会重复下载
+    await prefetch_distributions(["nonebot-plugin-treehelp"], wheelhouse)
+    assert download.call_count == 1
@@ -58,6 +58,10 @@ async def test_step_summary(
             results={"validation": True, "load": True, "metadata": True},
             test_env={"unknown": True},
             version="0.2.0",
+            timings={
+                "create": {"wall": 12.34, "cpu": 8.0, "max_rss": 524288},
+                "load": {"wall": 2.0, "cpu": 1.52},
+            },
         ),
     }
 
@@ -78,5 +82,11 @@ async def test_step_summary(
 ## 未通过测试插件列表
 
 - NOT_AC
+
+## 测试耗时
+
+| 插件 | 各阶段耗时 |
+| --- | --- |
+| TREEHELP | create 12.3s (CPU 8.0s, 512 MB), load 2.0s (CPU 1.5s) |
 """
     ) == store.generate_github_summary(results=store_test)
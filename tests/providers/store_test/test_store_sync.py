@@ -580,3 +580,47 @@ async def test_store_sync_validation_failed(
             },
         }
     )
+
+
+async def test_store_sync_validate_many(
+    mocked_store_data: dict[str, Path], mocked_api: MockRouter, mocker: MockerFixture
+) -> None:
+    """仓库中不存在的数据按类型一起验证，商店数据索引与网络数据只获取一次"""
+    from src.providers.models import StoreAdapter
+    from src.providers.store_test.store import StoreTest
+    from src.providers.validation import PublishType, build_previous_keys
+    from src.providers.validation.prefetch import prefetch_facts
+
+    mocked_build_previous_keys = mocker.patch(
+        "src.providers.validation.build_previous_keys", wraps=build_previous_keys
+    )
+    mocked_prefetch_facts = mocker.patch(
+        "src.providers.validation.prefetch_facts", wraps=prefetch_facts
+    )
+
+    test = StoreTest()
+    key = "nonebot-adapter-onebot:nonebot.adapters.onebot.v12"
+    test._store_adapters["nonebot-adapter-onebot:nonebot.adapters.onebot.v13"] = (
+        StoreAdapter(
+            **{
+                **test._store_adapters[key].model_dump(),
+                "module_name": "nonebot.adapters.onebot.v13",
+                "name": "OneBot V13",
+            }
+        )
+    )
+    await test.sync_store()
+
+    # 适配器、机器人、驱动器各验证一次
+    assert mocked_build_previous_keys.call_count == 3
+    assert [
+        (call.args[0], [item["name"] for item in call.args[1]])
+        for call in mocked_prefetch_facts.call_args_list
+    ] == [
+        (PublishType.ADAPTER, ["OneBot V12", "OneBot V13"]),
+        (PublishType.BOT, ["Github Bot"]),
+        (PublishType.DRIVER, ["Quart"]),
+    ]
+    assert "nonebot-adapter-onebot:nonebot.adapters.onebot.v13" in (
+        test._previous_adapters
+    )
@@ -16,16 +16,31 @@ async def test_store_test(
     因为 limit=1 所以只测试了一个插件，第三个插件未测试
     """
     from src.providers.store_test.store import (
+        PublishType,
         RegistryPlugin,
         StorePlugin,
         StoreTest,
         StoreTestResult,
     )
 
-    mocked_validate_plugin = mocker.patch(
-        "src.providers.store_test.store.validate_plugin"
+    mocked_run_plugin_test = mocker.patch(
+        "src.providers.store_test.store.run_plugin_test"
+    )
+    from src.providers.validation import validate_many
+
+    # 只替换插件的验证结果，同步商店数据时仍正常验证
+    mocked_validate_many = mocker.patch(
+        "src.providers.store_test.store.validate_many",
+        side_effect=lambda publish_type, items, previous_data: (
+            [mocker.sentinel.validation] * len(items)
+            if publish_type == PublishType.PLUGIN
+            else validate_many(publish_type, items, previous_data)
+        ),
+    )
+    mocked_collect_plugin_result = mocker.patch(
+        "src.providers.store_test.store.collect_plugin_result"
     )
-    mocked_validate_plugin.return_value = (
+    mocked_collect_plugin_result.return_value = (
         StoreTestResult(
             time="2023-08-28T00:00:00.000000+08:00",
             version="1.0.0",
@@ -63,9 +78,12 @@ async def test_store_test(
     )
 
     test = StoreTest()
+    previous_result = test._previous_results[
+        "nonebot-plugin-treehelp:nonebot_plugin_treehelp"
+    ]
     await test.run(1, 0, False)
 
-    mocked_validate_plugin.assert_called_once_with(
+    mocked_run_plugin_test.assert_called_once_with(
         store_plugin=StorePlugin(
             tags=[],
             module_name="nonebot_plugin_treehelp",
@@ -90,6 +108,14 @@ async def test_store_test(
             skip_test=False,
         ),
         config="TEST_CONFIG=true",
+        backend="docker",
+        previous_result=previous_result,
+    )
+    mocked_validate_many.assert_any_call(
+        PublishType.PLUGIN, [mocked_run_plugin_test.return_value.raw_data], []
+    )
+    mocked_collect_plugin_result.assert_called_once_with(
+        mocked_run_plugin_test.return_value, mocker.sentinel.validation
     )
     assert mocked_api["pypi_nonebot-plugin-treehelp"].called
     assert mocked_api["pypi_nonebot-plugin-datastore"].called
@@ -131,6 +157,9 @@ async def test_store_test_with_key(
     mocked_validate_plugin.return_value = ({}, {})
 
     test = StoreTest()
+    previous_result = test._previous_results[
+        "nonebot-plugin-treehelp:nonebot_plugin_treehelp"
+    ]
     await test.run_single_plugin(key="nonebot-plugin-treehelp:nonebot_plugin_treehelp")
 
     mocked_validate_plugin.assert_called_once_with(
@@ -158,6 +187,8 @@ async def test_store_test_with_key(
             skip_test=False,
         ),
         config="TEST_CONFIG=true",
+        backend="docker",
+        previous_result=previous_result,
     )
 
     assert mocked_api["pypi_nonebot-plugin-treehelp"].called
@@ -205,15 +236,15 @@ async def test_store_test_raise(
         name="pypi_nonebot-plugin-treehelp",
     ).side_effect = httpx.ConnectTimeout
 
-    mocked_validate_plugin = mocker.patch(
-        "src.providers.store_test.store.validate_plugin"
+    mocked_run_plugin_test = mocker.patch(
+        "src.providers.store_test.store.run_plugin_test"
     )
-    mocked_validate_plugin.side_effect = Exception
+    mocked_run_plugin_test.side_effect = Exception
 
     test = StoreTest()
     await test.run(limit=1)
 
-    mocked_validate_plugin.assert_has_calls(
+    mocked_run_plugin_test.assert_has_calls(
         [
             mocker.call(
                 store_plugin=StorePlugin(
@@ -225,6 +256,8 @@ async def test_store_test_raise(
                 ),
                 previous_plugin=None,
                 config="",
+                backend="docker",
+                previous_result=None,
             ),  # type: ignore
         ]
     )
@@ -278,6 +311,8 @@ async def test_store_test_with_key_raise(
         ),
         previous_plugin=None,
         config="",
+        backend="docker",
+        previous_result=None,
     )
 
     # 数据没有更新，只是被压缩
@@ -296,3 +331,48 @@ async def test_store_test_with_key_raise(
     assert mocked_store_data["results"].read_text(encoding="utf-8") == snapshot(
         '{"nonebot-plugin-datastore:nonebot_plugin_datastore":{"time":"2023-06-26T22:08:18.945584+08:00","config":"","version":"1.3.0","test_env":null,"results":{"validation":true,"load":true,"metadata":true},"outputs":{"validation":null,"load":"datastore","metadata":{"name":"数据存储","description":"NoneBot 数据存储插件","usage":"请参考文档","type":"library","homepage":"https://github.com/he0119/nonebot-plugin-datastore","supported_adapters":null}}},"nonebot-plugin-treehelp:nonebot_plugin_treehelp":{"time":"2023-06-26T22:20:41.833311+08:00","config":"","version":"0.3.0","test_env":null,"results":{"validation":true,"load":true,"metadata":true},"outputs":{"validation":null,"load":"treehelp","metadata":{"name":"帮助","description":"获取插件帮助信息","usage":"获取插件列表\\n/help\\n获取插件树\\n/help -t\\n/help --tree\\n获取某个插件的帮助\\n/help 插件名\\n获取某个插件的树\\n/help --tree 插件名\\n","type":"application","homepage":"https://github.com/he0119/nonebot-plugin-treehelp","supported_adapters":null}}}}'
     )
+
+
+async def test_store_test_validate_many(
+    mocked_store_data: dict[str, Path], mocked_api: MockRouter, mocker: MockerFixture
+):
+    """同一轮测试完成的插件一起验证"""
+    from src.providers.store_test.store import PublishType, StoreTest
+
+    outcomes = {
+        "nonebot-plugin-treehelp": mocker.MagicMock(),
+        "nonebot-plugin-wordcloud": mocker.MagicMock(),
+    }
+    mocked_run_plugin_test = mocker.patch(
+        "src.providers.store_test.store.run_plugin_test",
+        side_effect=lambda store_plugin, **kwargs: outcomes[store_plugin.project_link],
+    )
+    mocked_validate_many = mocker.patch(
+        "src.providers.store_test.store.validate_many",
+        side_effect=lambda publish_type, items, previous_data: [
+            mocker.sentinel.validation
+        ]
+        * len(items),
+    )
+    mocked_collect_plugin_result = mocker.patch(
+        "src.providers.store_test.store.collect_plugin_result",
+        return_value=(mocker.MagicMock(), mocker.MagicMock()),
+    )
+
+    test = StoreTest()
+    new_results, _ = await test.test_plugins(2, 0, False)
+
+    assert mocked_run_plugin_test.call_count == 2
+    mocked_validate_many.assert_called_once_with(
+        PublishType.PLUGIN,
+        [
+            outcomes["nonebot-plugin-treehelp"].raw_data,
+            outcomes["nonebot-plugin-wordcloud"].raw_data,
+        ],
+        [],
+    )
+    assert mocked_collect_plugin_result.call_count == 2
+    assert list(new_results) == [
+        "nonebot-plugin-treehelp:nonebot_plugin_treehelp",
+        "nonebot-plugin-wordcloud:nonebot_plugin_wordcloud",
+    ]
@@ -0,0 +1,52 @@
+from pathlib import Path
+
+from inline_snapshot import snapshot
+from pytest_mock import MockerFixture
+from respx import MockRouter
+
+
+async def test_sync_facts(
+    tmp_path: Path, mocked_api: MockRouter, mocker: MockerFixture
+) -> None:
+    """同步离线验证数据"""
+    from src.providers.facts import FactsStore
+    from src.providers.store_test.facts import sync_facts
+
+    mock_check = mocker.patch(
+        "src.providers.store_test.facts.check_homepages",
+        return_value={
+            "https://onebot.adapters.nonebot.dev/": (200, ""),
+            "https://github.com/he0119/CoolQBot": (404, ""),
+        },
+    )
+
+    path = tmp_path / "facts" / "facts.db"
+    counts = await sync_facts(path)
+
+    assert counts == snapshot({"pypi": 4, "adapters": 2, "authors": 1, "homepages": 2})
+    assert mock_check.call_args.args[0] == snapshot(
+        [
+            "https://onebot.adapters.nonebot.dev/",
+            "https://github.com/he0119/nonebot-plugin-datastore",
+            "https://github.com/he0119/nonebot-plugin-treehelp",
+            "https://github.com/he0119/CoolQBot",
+        ]
+    )
+    assert not path.with_name("facts.db.tmp").exists()
+
+    facts = FactsStore(path)
+    assert facts.get_pypi_data("Nonebot_Plugin.Datastore") == snapshot(
+        {
+            "info": {"name": "nonebot-plugin-datastore", "version": "1.3.0"},
+            "urls": [{"upload_time_iso_8601": "2024-06-20T07:53:23.524486Z"}],
+        }
+    )
+    assert facts.has_pypi("nonebot2")
+    assert not facts.has_pypi("project_link")
+    assert facts.get_adapters() == snapshot(
+        frozenset({"nonebot.adapters.onebot.v11", "nonebot.adapters.onebot.v12"})
+    )
+    assert facts.get_author_name(1) == snapshot("he0119")
+    assert facts.get_homepage("https://github.com/he0119/CoolQBot") == (404, "")
+    assert facts.get_meta("synced_at")
+    facts.close()
@@ -13,13 +13,13 @@ def mock_docker_result(path: Path, mocker: MockerFixture):
     mock_plugin_test = mocker.MagicMock()
 
     mocker.patch(
-        "src.providers.store_test.validation.DockerPluginTest",
+        "src.providers.store_test.validation.get_plugin_test",
         return_value=mock_plugin_test,
     )
 
-    mock_run = mocker.AsyncMock()
-    mock_run.return_value = DockerTestResult(**json.loads(path.read_text()))
-    mock_plugin_test.run = mock_run
+    mock_run_matrix = mocker.AsyncMock()
+    mock_run_matrix.return_value = [DockerTestResult(**json.loads(path.read_text()))]
+    mock_plugin_test.run_matrix = mock_run_matrix
     return mock_plugin_test
 
 
@@ -363,7 +363,7 @@ async def test_validate_plugin_skip_test_plugin_test_failed(
                 "metadata": None,
             },
             results={"validation": False, "load": False, "metadata": False},
-            test_env={"python==3.12.7": True},
+            test_env={"python==3.12.7": False},
             version="0.3.9",
         )
     )
@@ -491,7 +491,7 @@ async def test_validate_plugin_failed_with_previous(
                 "metadata": None,
             },
             results={"validation": False, "load": False, "metadata": False},
-            test_env={"python==3.12.7": True},
+            test_env={"python==3.12.7": False},
             version="0.3.9",
         )
     )
@@ -516,3 +516,131 @@ async def test_validate_plugin_failed_with_previous(
     )
 
     assert mocked_api["homepage"].called
+
+
+async def test_validate_plugin_matrix(
+    mocked_api: MockRouter, mocker: MockerFixture
+) -> None:
+    """合并多个测试环境的结果"""
+    from src.providers.docker_test import DockerTestResult, MatrixCell
+    from src.providers.models import StorePlugin
+    from src.providers.store_test.validation import validate_plugin
+
+    mocker.patch(
+        "src.providers.store_test.validation.get_test_matrix",
+        return_value=[
+            MatrixCell(python="3.12"),
+            MatrixCell(python="3.13"),
+            MatrixCell(python="3.12", constraints=["pydantic<2.0"]),
+        ],
+    )
+    mock_plugin_test = mock_docker_result(Path(__file__).parent / "output.json", mocker)
+    mock_plugin_test.run_matrix.return_value = [
+        mock_plugin_test.run_matrix.return_value[0],
+        DockerTestResult(
+            run=True,
+            load=False,
+            output="",
+            test_env="python==3.13.1 nonebot2==2.4.0 pydantic==2.10.0",
+        ),
+        DockerTestResult(run=False, load=False, output=""),
+    ]
+
+    plugin = StorePlugin(
+        module_name="module_name",
+        project_link="project_link",
+        author_id=1,
+        tags=[],
+        is_official=True,
+    )
+
+    result, _ = await validate_plugin(plugin, "")
+
+    assert result.results == snapshot(
+        {"validation": True, "load": True, "metadata": True}
+    )
+    assert result.test_env == snapshot(
+        {
+            "python==3.12.7": True,
+            "python==3.13.1 nonebot2==2.4.0 pydantic==2.10.0": False,
+            "python==3.12 pydantic<2.0": False,
+        }
+    )
+
+
+async def test_validate_plugin_profile(
+    mocked_api: MockRouter, mocker: MockerFixture
+) -> None:
+    """记录主要测试环境中的耗时与插件加载性能数据"""
+    from src.providers.models import StorePlugin
+    from src.providers.store_test.validation import validate_plugin
+
+    mock_plugin_test = mock_docker_result(Path(__file__).parent / "output.json", mocker)
+    test_result = mock_plugin_test.run_matrix.return_value[0]
+    test_result.timings = {"create": {"wall": 10.0, "cpu": 8.0}}
+    test_result.profile = {
+        "load_time": 0.5,
+        "base_rss": 1048576,
+        "peak_rss": 2097152,
+        "import_times": {"nonebot_plugin_treehelp": 200},
+    }
+
+    plugin = StorePlugin(
+        module_name="nonebot_plugin_treehelp",
+        project_link="nonebot-plugin-treehelp",
+        author_id=1,
+        tags=[],
+        is_official=True,
+    )
+
+    result, _ = await validate_plugin(plugin, "")
+
+    assert result.model_dump(include={"timings", "profile"}) == snapshot(
+        {
+            "timings": {"create": {"wall": 10.0, "cpu": 8.0}},
+            "profile": {
+                "load_time": 0.5,
+                "base_rss": 1048576,
+                "peak_rss": 2097152,
+                "import_times": {"nonebot_plugin_treehelp": 200},
+            },
+        }
+    )
+
+
+async def test_validate_plugin_timeouts(
+    mocked_api: MockRouter, mocker: MockerFixture
+) -> None:
+    """根据上次测试各阶段的耗时设置超时时间"""
+    from src.providers.models import StorePlugin, StoreTestResult
+    from src.providers.store_test.validation import validate_plugin
+
+    mock_plugin_test = mock_docker_result(Path(__file__).parent / "output.json", mocker)
+    mocked_get_plugin_test = mocker.patch(
+        "src.providers.store_test.validation.get_plugin_test",
+        return_value=mock_plugin_test,
+    )
+
+    plugin = StorePlugin(
+        module_name="nonebot_plugin_treehelp",
+        project_link="nonebot-plugin-treehelp",
+        author_id=1,
+        tags=[],
+        is_official=True,
+    )
+    previous_result = StoreTestResult(
+        version="0.5.0",
+        results={"validation": True, "load": True, "metadata": True},
+        outputs={"validation": None, "load": "", "metadata": None},
+        timings={"create": {"wall": 10.0, "cpu": 8.0}, "load": {"wall": 200, "cpu": 1}},
+    )
+
+    await validate_plugin(plugin, "", previous_result=previous_result)
+
+    mocked_get_plugin_test.assert_called_once_with(
+        "nonebot-plugin-treehelp",
+        "nonebot_plugin_treehelp",
+        "",
+        "docker",
+        {"create": 120, "load": 600},
+    )
@@ -1,4 +1,9 @@
+import json
+import time
+from pathlib import Path
+
 from inline_snapshot import snapshot
+from pytest_mock import MockerFixture
 from respx import MockRouter
 
 from tests.providers.validation.utils import generate_bot_data
@@ -73,3 +78,87 @@ async def test_homepage_failed_empty_homepage(mocked_api: MockRouter) -> None:
 
     assert not mocked_api["homepage"].called
     assert not mocked_api["homepage_failed"].called
+
+
+async def test_check_homepage_head(mocked_api: MockRouter, tmp_path: Path) -> None:
+    """优先发送 HEAD 请求，可以访问的结果会保存到文件中"""
+    from src.providers.validation.homepage import (
+        check_homepage,
+        load_homepage_cache,
+        save_homepage_cache,
+    )
+
+    mocked_head = mocked_api.head("https://example.com/").respond(200)
+    mocked_get = mocked_api.get("https://example.com/").respond(200)
+
+    assert check_homepage("https://example.com/") == (200, "")
+    assert check_homepage("https://example.com/") == (200, "")
+    assert mocked_head.call_count == 1
+    assert not mocked_get.called
+    # 默认不保存，由调用方统一保存
+    assert not (tmp_path / "homepages.json").exists()
+
+    save_homepage_cache()
+    cache = json.loads((tmp_path / "homepages.json").read_text())
+    assert cache["https://example.com/"]["status_code"] == 200
+    assert not list(tmp_path.glob("*.tmp"))
+
+    # 之后的运行中直接使用保存的结果
+    load_homepage_cache.cache_clear()
+    assert check_homepage("https://example.com/") == (200, "")
+    assert mocked_head.call_count == 1
+
+
+def test_check_homepage_ranged_get(
+    mocked_api: MockRouter, mocker: MockerFixture, tmp_path: Path
+) -> None:
+    """不支持 HEAD 请求时发送只请求第一个字节的 GET 请求，无法访问的结果不会保存"""
+    from src.providers.validation.homepage import check_homepage, save_homepage_cache
+
+    mocked_api.head("https://example.com/").respond(405)
+    mocked_get = mocked_api.get("https://example.com/").respond(206)
+    mocked_api.head("https://example.com/missing").respond(404)
+    mocked_missing = mocked_api.get("https://example.com/missing").respond(404)
+
+    assert check_homepage("https://example.com/") == (200, "")
+    assert mocked_get.calls.last.request.headers["Range"] == "bytes=0-0"
+
+    mocked_time = mocker.patch("time.time", return_value=0)
+    assert check_homepage("https://example.com/missing") == (404, "")
+    assert check_homepage("https://example.com/missing") == (404, "")
+    assert mocked_missing.call_count == 1
+    save_homepage_cache()
+    cache = json.loads((tmp_path / "homepages.json").read_text())
+    assert "https://example.com/missing" not in cache
+
+    # 无法访问的结果很快过期
+    mocked_time.return_value = 600
+    assert check_homepage("https://example.com/missing") == (404, "")
+    assert mocked_missing.call_count == 2
+
+
+def test_save_homepage_cache_failed(mocker: MockerFixture, tmp_path: Path) -> None:
+    """保存失败时保留原有的缓存文件，并清理临时文件"""
+    from src.providers.validation.homepage import (
+        load_homepage_cache,
+        save_homepage_cache,
+    )
+
+    path = tmp_path / "homepages.json"
+    path.write_text("{}")
+    load_homepage_cache()["https://example.com/"] = {
+        "status_code": 200,
+        "msg": "",
+        "time": time.time(),
+    }
+
+    def dump_json(path: Path, data):
+        path.write_text("{")
+        raise OSError("disk full")
+
+    mocker.patch("src.providers.validation.homepage.dump_json", side_effect=dump_json)
+
+    save_homepage_cache()
+
+    assert path.read_text() == "{}"
+    assert not list(tmp_path.glob("*.tmp"))
@@ -1,4 +1,7 @@
+from pathlib import Path
+
 from inline_snapshot import snapshot
+from pytest_mock import MockerFixture
 from respx import MockRouter
 
 from tests.providers.validation.utils import generate_plugin_data
@@ -199,3 +202,41 @@ async def test_plugin_supported_adapters_missing_adapters(
     )
 
     assert mocked_api["homepage"].called
+
+
+def test_get_adapters_cached(mocked_api: MockRouter, mocker: MockerFixture) -> None:
+    """从商店获取的适配器列表在一段时间内共享"""
+    from src.providers.validation.utils import get_adapters
+
+    mocked_time = mocker.patch("time.monotonic", return_value=0)
+
+    adapters = get_adapters()
+    assert "nonebot.adapters.onebot.v11" in adapters
+    assert get_adapters() == adapters
+    assert mocked_api["store_adapter"].call_count == 1
+
+    mocked_time.return_value = 600
+    assert get_adapters() == adapters
+    assert mocked_api["store_adapter"].call_count == 2
+
+
+async def test_get_adapters_from_file(mocked_api: MockRouter, tmp_path: Path) -> None:
+    """优先读取本地的适配器文件，文件修改后重新读取"""
+    from src.providers.validation.utils import get_adapters
+
+    adapter_path = tmp_path / "adapters.json5"
+    adapter_path.write_text('[{"module_name": "nonebot.adapters.test"}]')
+
+    assert get_adapters(adapter_path) == {"nonebot.adapters.test"}
+
+    adapter_path.write_text(
+        '[{"module_name": "nonebot.adapters.test"}, {"module_name": "nonebot.adapters.new"}]'
+    )
+    assert get_adapters(adapter_path) == {
+        "nonebot.adapters.test",
+        "nonebot.adapters.new",
+    }
+    assert not mocked_api["store_adapter"].called
+
+    # 文件不存在时从商店获取
+    assert "nonebot.adapters.onebot.v11" in get_adapters(tmp_path / "missing.json5")
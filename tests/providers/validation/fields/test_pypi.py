@@ -1,4 +1,7 @@
+from pathlib import Path
+
 from inline_snapshot import snapshot
+from pytest_mock import MockerFixture
 from respx import MockRouter
 
 from tests.providers.validation.utils import generate_adapter_data
@@ -127,6 +130,42 @@ async def test_name_duplication(mocked_api: MockRouter) -> None:
     assert not mocked_api["homepage"].called
 
 
+async def test_name_duplication_previous_keys(mocked_api: MockRouter) -> None:
+    """使用预先构建的键索引检查重复，可在多次验证中复用"""
+    from src.providers.validation import (
+        PublishType,
+        build_previous_keys,
+        validate_info,
+    )
+
+    previous_keys = build_previous_keys(
+        [
+            {"module_name": "module_name", "project_link": "project_link"},
+            {"name": "name", "homepage": "https://nonebot.dev"},
+        ]
+    )
+    assert previous_keys == snapshot(
+        frozenset({"project_link:module_name", "name:https://nonebot.dev"})
+    )
+
+    for _ in range(2):
+        result = validate_info(
+            PublishType.ADAPTER, generate_adapter_data(), [], previous_keys
+        )
+        assert not result.valid
+        assert [error["type"] for error in result.errors] == ["duplication"]
+
+    result = validate_info(
+        PublishType.ADAPTER,
+        generate_adapter_data(module_name="other"),
+        None,
+        frozenset(),
+    )
+    assert result.valid
+
+    assert mocked_api["pypi_project_link"].called
+
+
 async def test_name_duplication_previos_data_missing(mocked_api: MockRouter) -> None:
     """没有提供 previos_data 的情况
 
@@ -195,3 +234,31 @@ async def test_project_link_normalization(mocked_api: MockRouter) -> None:
 
     assert mocked_api["homepage"].called
     assert mocked_api["pypi_project_link_normalization"].called
+
+
+async def test_get_previous_keys_from_file(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    """商店数据文件未修改时直接使用已构建的键索引，文件修改后重新构建"""
+    from src.providers.validation import get_previous_keys, utils
+
+    mocked_build_previous_keys = mocker.patch.object(
+        utils, "build_previous_keys", wraps=utils.build_previous_keys
+    )
+
+    path = tmp_path / "adapters.json5"
+    path.write_text('[{"module_name": "module_name", "project_link": "project_link"}]')
+
+    assert get_previous_keys(path) == {"project_link:module_name"}
+    assert get_previous_keys(path) == {"project_link:module_name"}
+    assert mocked_build_previous_keys.call_count == 1
+
+    path.write_text(
+        '[{"module_name": "module_name", "project_link": "project_link"}, '
+        '{"module_name": "other", "project_link": "project_link"}]'
+    )
+    assert get_previous_keys(path) == {
+        "project_link:module_name",
+        "project_link:other",
+    }
+    assert mocked_build_previous_keys.call_count == 2
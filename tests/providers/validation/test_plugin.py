@@ -1,4 +1,7 @@
+import time
+
 from inline_snapshot import snapshot
+from pytest_mock import MockerFixture
 from respx import MockRouter
 
 from tests.providers.validation.utils import generate_plugin_data
@@ -285,3 +288,57 @@ async def test_plugin_info_validation_plugin_invalid_metadata(
     )
 
     assert not mocked_api["homepage"].called
+
+
+async def test_plugin_info_validation_profile(mocked_api: MockRouter) -> None:
+    """开启耗时记录时记录各字段与模型验证器的耗时"""
+    from src.providers.validation import PublishType, validate_info
+
+    data = generate_plugin_data()
+
+    result = validate_info(PublishType.PLUGIN, data, [])
+    assert result.valid
+    assert result.timings == {}
+
+    result = validate_info(PublishType.PLUGIN, data, [], profile=True)
+    assert result.valid
+    assert set(result.timings) == snapshot(
+        {
+            "prevent_duplication",
+            "name",
+            "desc",
+            "author",
+            "author_id",
+            "homepage",
+            "tags",
+            "module_name",
+            "project_link",
+            "time",
+            "version",
+            "type",
+            "supported_adapters",
+            "load",
+            "metadata",
+            "skip_test",
+            "test_output",
+        }
+    )
+    assert all(seconds >= 0 for seconds in result.timings.values())
+
+
+async def test_plugin_info_validation_profile_duration(
+    mocked_api: MockRouter, mocker: MockerFixture
+) -> None:
+    """每个字段的耗时只记录一次"""
+    from src.providers.validation import PublishType, validate_info
+
+    def check_pypi(project_link: str) -> bool:
+        time.sleep(0.3)
+        return True
+
+    mocker.patch("src.providers.validation.models.check_pypi", side_effect=check_pypi)
+
+    result = validate_info(PublishType.PLUGIN, generate_plugin_data(), [], profile=True)
+
+    assert result.valid
+    assert 0.3 <= result.timings["project_link"] < 0.5
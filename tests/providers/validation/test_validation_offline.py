@@ -0,0 +1,71 @@
+from pathlib import Path
+
+import pytest
+from inline_snapshot import snapshot
+from pytest_mock import MockerFixture
+from respx import MockRouter
+
+from tests.providers.validation.utils import generate_plugin_data
+
+
+@pytest.fixture
+def facts_path(tmp_path: Path, mocker: MockerFixture) -> Path:
+    """开启离线验证，并准备离线验证数据"""
+    from src.providers.facts import FactsStore
+
+    path = tmp_path / "facts.db"
+    facts = FactsStore(path, readonly=False)
+    facts.set_pypi("Project_Link", "project_link", "0.0.1", "2023-09-01T00:00:00Z")
+    facts.set_adapters(["nonebot.adapters.onebot.v11"])
+    facts.set_author_name(1, "he0119")
+    facts.set_homepage("https://nonebot.dev", 200, "")
+    facts.set_homepage("https://www.baidu.com", 404, "")
+    facts.close()
+
+    mocker.patch("src.providers.facts.VALIDATION_OFFLINE", True)
+    mocker.patch("src.providers.facts.VALIDATION_FACTS_PATH", str(path))
+    return path
+
+
+async def test_validation_offline(facts_path: Path, respx_mock: MockRouter) -> None:
+    """离线验证时所有数据都从离线数据库读取，不访问网络"""
+    from src.providers.utils import get_author_name
+    from src.providers.validation import PublishType, validate_info
+
+    data = generate_plugin_data(supported_adapters=["~onebot.v11"])
+
+    result = validate_info(PublishType.PLUGIN, data, [])
+
+    assert result.valid
+    assert result.valid_data["project_link"] == "project_link"
+    assert result.valid_data["time"] == "2023-09-01T00:00:00Z"
+    assert result.valid_data["supported_adapters"] == ["nonebot.adapters.onebot.v11"]
+
+    get_author_name.cache_clear()
+    assert get_author_name(1) == "he0119"
+    assert not respx_mock.calls
+
+
+async def test_validation_offline_failed(
+    facts_path: Path, respx_mock: MockRouter
+) -> None:
+    """离线数据中不存在的数据视为无法获取"""
+    from src.providers.validation import PublishType, validate_info
+
+    data = generate_plugin_data(
+        project_link="project_link_failed",
+        homepage="https://www.baidu.com",
+        supported_adapters=["missing"],
+    )
+
+    result = validate_info(PublishType.PLUGIN, data, [])
+
+    assert [(error["loc"], error["type"]) for error in result.errors] == snapshot(
+        [
+            (("project_link",), "project_link.not_found"),
+            (("time",), "string_type"),
+            (("homepage",), "homepage"),
+            (("supported_adapters",), "supported_adapters.missing"),
+        ]
+    )
+    assert not respx_mock.calls
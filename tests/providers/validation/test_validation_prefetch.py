@@ -0,0 +1,137 @@
+import threading
+
+from inline_snapshot import snapshot
+from pytest_mock import MockerFixture
+from respx import MockRouter
+
+from tests.providers.validation.utils import (
+    generate_bot_data,
+    generate_driver_data,
+    generate_plugin_data,
+)
+
+
+async def test_collect_urls() -> None:
+    """收集验证器将会访问的网址"""
+    from src.providers.validation import PublishType
+    from src.providers.validation.prefetch import collect_homepage, collect_urls
+
+    assert collect_urls(PublishType.PLUGIN, generate_plugin_data()) == snapshot(
+        ["https://pypi.org/pypi/project_link/json"]
+    )
+    assert collect_homepage(PublishType.PLUGIN, generate_plugin_data()) == snapshot(
+        "https://nonebot.dev"
+    )
+    assert collect_urls(PublishType.BOT, generate_bot_data()) == []
+    assert collect_homepage(PublishType.BOT, generate_bot_data()) == snapshot(
+        "https://nonebot.dev"
+    )
+    driver = generate_driver_data(project_link="nonebot2[fastapi]", homepage="/docs/")
+    assert collect_urls(PublishType.DRIVER, driver) == snapshot(
+        ["https://pypi.org/pypi/nonebot2/json"]
+    )
+    assert collect_homepage(PublishType.DRIVER, driver) is None
+    # 不符合规范的值不会被验证器访问
+    plugin = generate_plugin_data(project_link="一个", homepage=12)
+    assert collect_urls(PublishType.PLUGIN, plugin) == []
+    assert collect_homepage(PublishType.PLUGIN, plugin) is None
+
+
+async def test_prefetch_concurrently(
+    mocked_api: MockRouter, mocker: MockerFixture
+) -> None:
+    """验证前同时获取所有网络数据，验证器直接使用获取到的结果"""
+    from src.providers.utils import get_url
+    from src.providers.validation import PublishType, validate_info
+    from src.providers.validation.homepage import check_homepage
+
+    # 所有请求同时进行时才能通过屏障
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fetch(url: str):
+        barrier.wait()
+        return get_url(url)
+
+    def fetch_homepage(url: str, save: bool = False):
+        # 批量检查时不单独保存
+        assert not save
+        barrier.wait()
+        return check_homepage(url, save=save)
+
+    def fetch_adapters(adapter_path=None):
+        barrier.wait()
+        return {"nonebot.adapters.onebot.v11"}
+
+    mocker.patch("src.providers.validation.prefetch.get_url", side_effect=fetch)
+    mocker.patch(
+        "src.providers.validation.prefetch.check_homepage", side_effect=fetch_homepage
+    )
+    mocker.patch(
+        "src.providers.validation.prefetch.get_adapters", side_effect=fetch_adapters
+    )
+    mocked_get_adapters = mocker.patch(
+        "src.providers.validation.models.get_adapters",
+    )
+    mocked_save = mocker.patch(
+        "src.providers.validation.prefetch.save_homepage_cache",
+    )
+
+    result = validate_info(
+        PublishType.PLUGIN,
+        generate_plugin_data(supported_adapters=["~onebot.v11"]),
+        [],
+    )
+
+    assert result.valid
+    assert result.valid_data["supported_adapters"] == ["nonebot.adapters.onebot.v11"]
+    mocked_get_adapters.assert_not_called()
+    assert mocked_api["pypi_project_link"].call_count == 1
+    assert mocked_api["homepage"].call_count == 1
+    mocked_save.assert_called_once_with()
+
+
+async def test_prefetch_duplicated(mocker: MockerFixture) -> None:
+    """数据重复时不获取网络数据"""
+    from src.providers.validation import PublishType, build_previous_keys
+    from src.providers.validation.prefetch import prefetch_facts
+
+    mocked_get_url = mocker.patch("src.providers.validation.prefetch.get_url")
+
+    data = generate_plugin_data(supported_adapters=["~onebot.v11"])
+    previous_keys = build_previous_keys(
+        [{"module_name": "module_name", "project_link": "project_link"}]
+    )
+
+    assert prefetch_facts(PublishType.PLUGIN, [data], previous_keys) == {}
+    assert prefetch_facts(PublishType.PLUGIN, [data], None) == {}
+    mocked_get_url.assert_not_called()
+
+
+async def test_validate_many(mocked_api: MockRouter, mocker: MockerFixture) -> None:
+    """批量验证时共享商店数据键索引、适配器列表与网络数据"""
+    from src.providers.validation import PublishType, validate_many
+
+    mocked_build_previous_keys = mocker.patch(
+        "src.providers.validation.build_previous_keys",
+        return_value=frozenset({"duplicated:module_name"}),
+    )
+
+    results = validate_many(
+        PublishType.PLUGIN,
+        [
+            generate_plugin_data(supported_adapters=["~onebot.v11"]),
+            generate_plugin_data(project_link="duplicated"),
+            generate_plugin_data(
+                homepage="https://www.baidu.com", supported_adapters=["~onebot.v11"]
+            ),
+        ],
+        [],
+    )
+
+    assert [result.valid for result in results] == [True, False, False]
+    assert [error["type"] for error in results[1].errors] == ["duplication"]
+    assert [error["type"] for error in results[2].errors] == ["homepage"]
+    mocked_build_previous_keys.assert_called_once_with([])
+    assert mocked_api["store_adapter"].call_count == 1
+    assert mocked_api["homepage"].call_count == 1
+    assert mocked_api["homepage_failed"].call_count == 1
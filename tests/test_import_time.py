@@ -0,0 +1,75 @@
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+IMPORT_TIME_BUDGET = 1.5
+""" 导入 src.providers.models 的时间上限，单位为秒
+
+当前约为 0.3 秒，留出足够余量避免在较慢的机器上误报
+"""
+
+LAZY_MODULES = ["docker", "jinja2"]
+""" 需要时才导入的模块 """
+
+IMPORT_TIME_PATTERN = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def run_python(code: str) -> tuple[set[str], dict[str, float]]:
+    """在新进程中运行代码
+
+    Returns:
+        tuple[set[str], dict[str, float]]: 运行后已导入的模块与顶层模块的导入耗时
+    """
+    code += "\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = set(json.loads(result.stdout.splitlines()[-1]))
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if (match := IMPORT_TIME_PATTERN.match(line)) and not match.group(2):
+            import_times[match.group(3)] = int(match.group(1)) / 1_000_000
+    return modules, import_times
+
+
+def test_import_providers_time():
+    """导入 providers 不应导入 docker 与 jinja2，且耗时不超过预算"""
+    modules, import_times = run_python("import src.providers.models")
+
+    assert not modules & set(LAZY_MODULES)
+    assert import_times["src.providers.models"] < IMPORT_TIME_BUDGET
+
+
+def test_load_plugins_lazy_modules():
+    """加载插件时不应导入 docker、jinja2 与渲染模块"""
+    modules, _ = run_python(
+        """\
+import nonebot
+
+nonebot.init(
+    driver="~none",
+    input_config={
+        "base": "master",
+        "adapter_path": "adapter_path",
+        "bot_path": "bot_path",
+        "plugin_path": "plugin_path",
+    },
+    github_repository="owner/repo",
+    github_run_id="123456",
+    github_step_summary="step_summary",
+)
+nonebot.load_plugins("src/plugins")
+"""
+    )
+
+    assert "src.plugins.github.plugins.publish" in modules
+    assert not modules & set(LAZY_MODULES)
+    assert not {module for module in modules if module.endswith(".render")}